@@ -0,0 +1,59 @@
+"""Papan tugas sintetis untuk benchmark.
+
+Distribusinya dibuat mirip papan sungguhan: sebagian besar tugas
+berprioritas sedang, sekitar 40% sudah selesai, dan deadline tersebar
+dari sebulan lalu sampai tiga bulan ke depan dengan lebih banyak tugas
+menumpuk di minggu-minggu terdekat. Seed yang sama selalu menghasilkan
+papan yang sama.
+"""
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from taskManager import Priority, Task, TaskStatus
+
+PRIORITY_WEIGHTS = {Priority.HIGH: 20, Priority.MEDIUM: 50, Priority.LOW: 30}
+COMPLETED_RATIO = 0.4
+
+VERBS = ("Siapkan", "Tinjau", "Perbaiki", "Kirim", "Rapikan", "Uji", "Tulis", "Jadwalkan",
+         "Update", "Review", "Fix", "Deploy")
+OBJECTS = ("laporan mingguan", "rapat tim", "presentasi klien", "anggaran Q3", "dokumentasi API",
+           "invoice", "backup server", "kontrak vendor", "onboarding", "release notes",
+           "bug login", "dashboard ☕", "jadwal piket", "survei pelanggan")
+DETAILS = ("", "", "Koordinasi dengan tim terkait.", "Prioritaskan sebelum rapat.",
+           "Lihat catatan di tiket sebelumnya.", "Butuh persetujuan manajer.",
+           "Cek ulang angka dan lampiran sebelum dikirim.")
+
+def iter_board(count: int, seed: int = 42, now: Optional[datetime] = None) -> Iterator[Task]:
+    """Hasilkan ``count`` tugas sintetis dengan id 1..count."""
+    generator = random.Random(seed)
+    now = (now or datetime(2025, 1, 15, 9, 0)).replace(second=0, microsecond=0)
+    priorities = list(PRIORITY_WEIGHTS)
+    weights = list(PRIORITY_WEIGHTS.values())
+    for task_id in range(1, count + 1):
+        # Deadline condong ke masa dekat: triangular dengan puncak seminggu ke depan
+        deadline = now + timedelta(minutes=int(generator.triangular(-30, 90, 7) * 24 * 60))
+        created_at = deadline - timedelta(minutes=generator.randint(60, 45 * 24 * 60))
+        completed = generator.random() < COMPLETED_RATIO
+        completed_at = None
+        if completed:
+            completed_at = min(now, created_at + timedelta(minutes=generator.randint(10, 30 * 24 * 60)))
+        yield Task(
+            id=task_id,
+            title=f"{generator.choice(VERBS)} {generator.choice(OBJECTS)} #{task_id}",
+            description=generator.choice(DETAILS),
+            priority=generator.choices(priorities, weights)[0],
+            status=TaskStatus.COMPLETED if completed else TaskStatus.PENDING,
+            deadline=deadline,
+            created_at=created_at,
+            completed_at=completed_at
+        )
+
+def make_board(count: int, seed: int = 42, now: Optional[datetime] = None) -> List[Task]:
+    return list(iter_board(count, seed, now))
@@ -0,0 +1,186 @@
+"""Uji beban server HTTP (taskServer) dengan koneksi keep-alive paralel.
+
+Tanpa --url, skrip membuat papan sintetis (default 100k tugas) sebagai
+snapshot biner, menjalankan ``taskManager.py serve`` di proses terpisah,
+lalu menghapus papannya setelah selesai. Campuran request: ambil satu
+tugas, halaman daftar (dengan If-None-Match seperti klien yang menyimpan
+cache), statistik, dan sebagian kecil perubahan.
+
+Contoh: python benchmarks/loadtest.py --tasks 100000 --connections 32 --duration 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from boards import ROOT, iter_board
+
+def request_mix(task_count: int, generator: random.Random) -> Tuple[str, str, Optional[dict]]:
+    """Pilih (method, path, body) berikutnya: 90% baca, 10% tulis."""
+    roll = generator.random()
+    task_id = generator.randint(1, task_count)
+    if roll < 0.55:
+        return "GET", f"/tasks/{task_id}", None
+    if roll < 0.80:
+        return "GET", "/tasks?status=pending&order_by=deadline&limit=20", None
+    if roll < 0.90:
+        return "GET", "/stats", None
+    if roll < 0.97:
+        return "PATCH", f"/tasks/{task_id}", {"priority": generator.choice(["HIGH", "MEDIUM", "LOW"])}
+    return "POST", "/batch", [{"op": "edit", "id": generator.randint(1, task_count), "description": "batch"}
+                              for _ in range(10)]
+
+class Client:
+    """Satu koneksi keep-alive dengan cache ETag sendiri."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.etags: Dict[str, str] = {}
+        self.reader = self.writer = None
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method: str, path: str, body=None) -> int:
+        payload = b"" if body is None else json.dumps(body).encode('utf-8')
+        headers = [f"{method} {path} HTTP/1.1", f"Host: {self.host}", f"Content-Length: {len(payload)}"]
+        if method == "GET" and path in self.etags:
+            headers.append(f"If-None-Match: {self.etags[path]}")
+        self.writer.write(("\r\n".join(headers) + "\r\n\r\n").encode('latin-1') + payload)
+        head = (await self.reader.readuntil(b"\r\n\r\n")).decode('latin-1')
+        status_line, *header_lines = head.split("\r\n")
+        status = int(status_line.split(" ")[1])
+        length = 0
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            name = name.lower()
+            if name == "content-length":
+                length = int(value)
+            elif name == "etag" and method == "GET":
+                self.etags[path] = value.strip()
+        if length:
+            await self.reader.readexactly(length)
+        return status
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+async def worker(client: Client, task_count: int, deadline: float, seed: int,
+                 latencies: List[float], statuses: Counter):
+    generator = random.Random(seed)
+    await client.connect()
+    try:
+        while time.perf_counter() < deadline:
+            method, path, body = request_mix(task_count, generator)
+            start = time.perf_counter()
+            status = await client.request(method, path, body)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] += 1
+    finally:
+        client.close()
+
+async def run_load(host: str, port: int, task_count: int, connections: int, duration: float) -> dict:
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    # Pemanasan: indeks snapshot dibangun pada request pertama
+    warmup = Client(host, port)
+    await warmup.connect()
+    await warmup.request("GET", "/tasks?limit=1")
+    await warmup.request("GET", "/stats")
+    warmup.close()
+
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(worker(Client(host, port), task_count, deadline, seed, latencies, statuses)
+                           for seed in range(connections)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    def percentile(percent: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * percent / 100))] * 1000
+
+    return {
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "requests_per_second": len(latencies) / elapsed,
+        "latency_ms": {"mean": statistics.fmean(latencies) * 1000, "p50": percentile(50),
+                       "p95": percentile(95), "p99": percentile(99), "max": latencies[-1] * 1000},
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+    }
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+def wait_for_port(host: str, port: int, process: subprocess.Popen, timeout: float = 120):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("Server berhenti sebelum siap")
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("Server tidak siap")
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="server yang sudah berjalan, misalnya http://127.0.0.1:8765")
+    parser.add_argument("--tasks", type=int, default=100000,
+                        help="ukuran papan sintetis (atau jumlah id tugas di server --url)")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="lama uji dalam detik")
+    parser.add_argument("-o", "--output", help="simpan hasil sebagai JSON")
+    args = parser.parse_args(argv)
+
+    process = None
+    with tempfile.TemporaryDirectory() as directory:
+        if args.url:
+            url = urlsplit(args.url)
+            host, port = url.hostname, url.port or 80
+        else:
+            from taskSnapshot import write_snapshot
+
+            board = os.path.join(directory, "board.tmsnap")
+            write_snapshot(board, iter_board(args.tasks))
+            host, port = "127.0.0.1", free_port()
+            process = subprocess.Popen(
+                [sys.executable, os.path.join(ROOT, "taskManager.py"), "-f", board, "serve",
+                 "--host", host, "--port", str(port)],
+                stderr=subprocess.DEVNULL)
+            wait_for_port(host, port, process)
+        try:
+            result = asyncio.run(run_load(host, port, args.tasks, args.connections, args.duration))
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+    result.update(tasks=args.tasks, connections=args.connections)
+    latency = result["latency_ms"]
+    print(f"{result['requests']} request dalam {result['seconds']:.1f} s: "
+          f"{result['requests_per_second']:.0f} request/detik")
+    print(f"latensi ms: rata2 {latency['mean']:.2f}  p50 {latency['p50']:.2f}  p95 {latency['p95']:.2f}  "
+          f"p99 {latency['p99']:.2f}  maks {latency['max']:.2f}")
+    print(f"status: {result['statuses']}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(result, file, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
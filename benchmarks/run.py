@@ -0,0 +1,316 @@
+"""Benchmark operasi inti TaskManager dan refresh Treeview GUI.
+
+Setiap operasi dijalankan beberapa kali pada papan sintetis (lihat
+``boards.py``); yang dicatat adalah median dan minimum waktu, serta
+puncak memori yang dialokasikan operasi itu (tracemalloc, putaran
+terpisah agar tidak mengganggu pengukuran waktu). Refresh GUI memakai
+jendela Tk sungguhan dan dilewati jika tidak ada display.
+
+Contoh:
+  python benchmarks/run.py --sizes 1000,10000 -o hasil.json
+  python benchmarks/run.py --baseline hasil.json --threshold 0.2
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from boards import make_board  # juga menambahkan root repo ke sys.path
+from taskManager import Priority, TaskManager, TaskStatus
+
+TABLE_TASKS = 1000
+STREAM_TASKS = 20000
+
+class Benchmark(NamedTuple):
+    name: str
+    setup: Callable[['Context'], object]  # tidak diukur; hasilnya diteruskan ke action
+    action: Callable[[object], object]
+    gui: bool = False
+    rows: Optional[int] = None  # jumlah tugas yang diproses; dibatasi ukuran papan
+
+    def label(self, size: int) -> str:
+        """Nama hasil; untuk benchmark dengan ``rows`` ditambah jumlah tugas yang benar-benar diproses."""
+        return self.name if self.rows is None else f"{self.name}_{min(self.rows, size)}"
+
+    def selected_by(self, names: List[str], size: int) -> bool:
+        return self.name in names or self.label(size) in names
+
+class Context:
+    """Papan dan sumber daya bersama untuk satu ukuran papan."""
+
+    def __init__(self, size: int, seed: int, directory: str):
+        self.size = size
+        self.board = make_board(size, seed)
+        self.directory = directory
+        self._manager = None
+        self._app = None
+
+    def fresh_manager(self) -> TaskManager:
+        manager = TaskManager(overdue_callback=lambda task: None)
+        manager.add_many(task.copy() for task in self.board)
+        return manager
+
+    @property
+    def manager(self) -> TaskManager:
+        """Manager bersama untuk operasi yang tidak mengubah papan."""
+        if self._manager is None:
+            self._manager = self.fresh_manager()
+        return self._manager
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def sample_ids(self, fraction: float = 0.1) -> List[int]:
+        step = max(1, int(1 / fraction))
+        return list(range(1, self.size + 1, step))
+
+    @property
+    def app(self):
+        if self._app is None:
+            from taskManagerUI import ModernTaskManagerUI
+
+            # _load_images membuat folder icons di direktori kerja
+            cwd = os.getcwd()
+            os.chdir(self.directory)
+            try:
+                self._app = ModernTaskManagerUI(self.fresh_manager())
+            finally:
+                os.chdir(cwd)
+            self._app.update()
+        return self._app
+
+    def close(self):
+        if self._app is not None:
+            self._app._on_close()
+            self._app = None
+
+def gui_unavailable() -> Optional[str]:
+    """Alasan refresh GUI tidak bisa diukur, atau None jika bisa."""
+    try:
+        import tkinter
+        import customtkinter  # noqa: F401
+    except ImportError as e:
+        return f"dependensi GUI tidak tersedia: {e}"
+    try:
+        root = tkinter.Tk()
+    except tkinter.TclError as e:
+        return f"tidak ada display: {e}"
+    root.destroy()
+    return None
+
+def refresh_gui(app, clear_cache: bool, timeout: float = 120.0):
+    """Refresh seperti yang dirasakan pengguna: query di worker, polling, lalu render."""
+    if clear_cache:
+        app._row_cache.clear()
+    app._refresh_task_list()
+    # Query berjalan di worker; pompa event loop sampai barisnya selesai dirender
+    deadline = time.perf_counter() + timeout
+    while app._view_job is not None:
+        if time.perf_counter() > deadline:
+            raise RuntimeError("Refresh GUI tidak selesai")
+        app.update()
+        time.sleep(0.001)
+    app.update_idletasks()
+
+def save_json(context: Context) -> TaskManager:
+    context.manager.save_file(context.path("board.json"))
+    return context.manager
+
+def save_ndjson(context: Context) -> TaskManager:
+    context.manager.save_file(context.path("board.ndjson"))
+    return context.manager
+
+def stream_table(manager: TaskManager, tasks) -> int:
+    output = io.StringIO()
+    with redirect_stdout(output):
+        manager.print_tasks_table(tasks)
+    return len(output.getvalue())
+
+def table_tasks(context: Context, count: int):
+    manager = context.manager
+    manager._table_cache.clear()
+    return manager, [manager.get(task_id) for task_id in manager.ids()[:count]]
+
+BENCHMARKS = [
+    Benchmark("add_many",
+              lambda c: (TaskManager(overdue_callback=lambda task: None), [t.copy() for t in c.board]),
+              lambda state: state[0].add_many(state[1])),
+    Benchmark("replace_tasks",
+              lambda c: (TaskManager(overdue_callback=lambda task: None), [t.copy() for t in c.board]),
+              lambda state: state[0].replace_tasks(state[1])),
+    Benchmark("save_file_json",
+              lambda c: (c.manager, c.path("out.json")),
+              lambda state: state[0].save_file(state[1])),
+    Benchmark("load_file_json",
+              lambda c: (TaskManager(overdue_callback=lambda task: None), save_json(c) and c.path("board.json")),
+              lambda state: state[0].load_file(state[1])),
+    Benchmark("save_file_ndjson",
+              lambda c: (c.manager, c.path("out.ndjson")),
+              lambda state: state[0].save_file(state[1])),
+    Benchmark("load_file_ndjson",
+              lambda c: (TaskManager(overdue_callback=lambda task: None), save_ndjson(c) and c.path("board.ndjson")),
+              lambda state: state[0].load_file(state[1])),
+    Benchmark("format_tasks_table",
+              lambda c: table_tasks(c, TABLE_TASKS),
+              lambda state: state[0].format_tasks_table(state[1]), rows=TABLE_TASKS),
+    Benchmark("print_tasks_table_page",
+              lambda c: table_tasks(c, 20),
+              lambda state: stream_table(*state)),
+    Benchmark("print_tasks_table",
+              lambda c: table_tasks(c, STREAM_TASKS),
+              lambda state: stream_table(*state), rows=STREAM_TASKS),
+    Benchmark("search_word", lambda c: c.manager, lambda manager: manager.search("laporan")),
+    Benchmark("search_field", lambda c: c.manager, lambda manager: manager.search("judul:rap")),
+    Benchmark("search_phrase", lambda c: c.manager, lambda manager: manager.search("bug login")),
+    Benchmark("stats", lambda c: c.manager, lambda manager: manager.stats()),
+    Benchmark("query_first_page", lambda c: c.manager,
+              lambda manager: manager.query(status=TaskStatus.PENDING, order_by='deadline', limit=50)),
+    Benchmark("query_all_by_priority", lambda c: c.manager,
+              lambda manager: manager.query_ids(order_by='priority')),
+    Benchmark("update_many_10pct",
+              lambda c: (c.fresh_manager(), c.sample_ids()),
+              lambda state: state[0].update_many(state[1], priority=Priority.HIGH)),
+    Benchmark("complete_many_10pct",
+              lambda c: (c.fresh_manager(), c.sample_ids()),
+              lambda state: state[0].complete_many(state[1])),
+    Benchmark("delete_many_10pct",
+              lambda c: (c.fresh_manager(), c.sample_ids()),
+              lambda state: state[0].delete_many(state[1])),
+    Benchmark("gui_refresh", lambda c: c.app, lambda app: refresh_gui(app, True), gui=True),
+    Benchmark("gui_refresh_cached", lambda c: c.app, lambda app: refresh_gui(app, False), gui=True),
+]
+
+def measure(benchmark: Benchmark, context: Context, repeat: int, memory: bool) -> dict:
+    runs = []
+    for _ in range(repeat):
+        state = benchmark.setup(context)
+        start = time.perf_counter()
+        benchmark.action(state)
+        runs.append(time.perf_counter() - start)
+    result = {"seconds": statistics.median(runs), "min": min(runs), "runs": runs}
+    if memory:
+        state = benchmark.setup(context)
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            benchmark.action(state)
+            result["peak_bytes"] = tracemalloc.get_traced_memory()[1] - baseline
+        finally:
+            tracemalloc.stop()
+    return result
+
+def run(sizes: List[int], seed: int, repeat: int, memory: bool, selected: Optional[List[str]]) -> dict:
+    gui_skip = gui_unavailable()
+    results: Dict[str, Dict[str, dict]] = {}
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            context = Context(size, seed, directory)
+            try:
+                for benchmark in BENCHMARKS:
+                    if selected and not benchmark.selected_by(selected, size):
+                        continue
+                    if benchmark.gui and gui_skip:
+                        result = {"skipped": gui_skip}
+                    else:
+                        result = measure(benchmark, context, repeat, memory)
+                    name = benchmark.label(size)
+                    results.setdefault(str(size), {})[name] = result
+                    print(format_result(size, name, result), file=sys.stderr)
+            finally:
+                context.close()
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+def format_result(size: int, name: str, result: dict) -> str:
+    if "skipped" in result:
+        return f"{size:>9} {name:<28} dilewati ({result['skipped']})"
+    line = f"{size:>9} {name:<28} {result['seconds'] * 1000:10.2f} ms"
+    if "peak_bytes" in result:
+        line += f" {result['peak_bytes'] / 2 ** 20:9.2f} MiB"
+    return line
+
+def compare(current: dict, baseline: dict, threshold: float, min_delta: float) -> List[str]:
+    """Daftar regresi: waktu (atau memori) naik lebih dari ``threshold`` dibanding baseline.
+
+    Selisih waktu di bawah ``min_delta`` detik diabaikan sebagai derau.
+    """
+    regressions = []
+    for size, results in current["results"].items():
+        for name, result in results.items():
+            previous = baseline["results"].get(size, {}).get(name)
+            if previous is None or "skipped" in result or "skipped" in previous:
+                continue
+            ratio = result["seconds"] / previous["seconds"] if previous["seconds"] else 1.0
+            delta = result["seconds"] - previous["seconds"]
+            flag = ""
+            if ratio > 1 + threshold and delta > min_delta:
+                flag = "REGRESI"
+                regressions.append(f"{name}@{size}: waktu x{ratio:.2f}")
+            if "peak_bytes" in result and previous.get("peak_bytes"):
+                memory_ratio = result["peak_bytes"] / previous["peak_bytes"]
+                if memory_ratio > 1 + threshold and result["peak_bytes"] - previous["peak_bytes"] > 2 ** 20:
+                    flag = "REGRESI"
+                    regressions.append(f"{name}@{size}: memori x{memory_ratio:.2f}")
+            print(f"{size:>9} {name:<28} {previous['seconds'] * 1000:10.2f} -> "
+                  f"{result['seconds'] * 1000:10.2f} ms  x{ratio:5.2f} {flag}")
+    return regressions
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="ukuran papan dipisah koma, misalnya 1000,1000000")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="lewati pengukuran puncak memori")
+    parser.add_argument("--only", help="jalankan hanya benchmark ini (nama dipisah koma; "
+                                       "print_tasks_table memilih semua ukuran tabel)")
+    parser.add_argument("-o", "--output", help="simpan hasil sebagai JSON")
+    parser.add_argument("--baseline", help="bandingkan dengan hasil JSON sebelumnya")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="kenaikan relatif yang dianggap regresi (0.2 = 20%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=2.0,
+                        help="selisih waktu minimum agar dianggap regresi")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    selected = args.only.split(",") if args.only else None
+    if selected:
+        unknown = {name for name in selected
+                   if not any(benchmark.selected_by([name], size) for benchmark in BENCHMARKS for size in sizes)}
+        if unknown:
+            parser.error(f"benchmark tidak dikenal: {', '.join(sorted(unknown))}")
+    current = run(sizes, args.seed, args.repeat, not args.no_memory, selected)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(current, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(current, baseline, args.threshold, args.min_delta_ms / 1000)
+        if regressions:
+            print("Regresi:\n  " + "\n  ".join(regressions))
+            return 1
+        print("Tidak ada regresi.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""Benchmark waktu start jalur CLI.
+
+Mengukur (di proses Python baru, median dari beberapa putaran):
+  - waktu impor ``taskManager`` menurut ``python -X importtime``
+  - waktu total perintah tanpa prompt ``query`` dan ``stats``
+dan memastikan jalur itu tidak memuat pustaka GUI/pemformatan. Keluar
+dengan kode 1 jika anggaran waktu terlampaui atau ada modul terlarang.
+
+Contoh: python benchmarks/startup.py --runs 10 --import-budget-ms 60
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modul yang tidak boleh dimuat oleh perintah tanpa prompt
+FORBIDDEN_MODULES = ("tabulate", "colorama", "customtkinter", "tkinter", "tkcalendar", "PIL")
+
+CHECK_MODULES = """
+import json, sys
+import taskCli
+status = taskCli.main(sys.argv[1:])
+loaded = [name for name in {forbidden!r} if name in sys.modules]
+print(json.dumps(loaded), file=sys.stderr)
+"""
+
+def _python(*args: str, **options) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True,
+                          stdin=subprocess.DEVNULL, **options)
+
+def import_time_ms() -> float:
+    """Waktu impor kumulatif taskManager (ms) dari keluaran ``-X importtime``."""
+    result = _python("-X", "importtime", "-c", "import taskManager")
+    for line in reversed(result.stderr.splitlines()):
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == "taskManager":
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"Keluaran importtime tidak dikenali:\n{result.stderr}")
+
+def command_time_ms(*args: str) -> float:
+    start = time.perf_counter()
+    result = _python("taskManager.py", *args)
+    elapsed = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"Perintah {args} gagal:\n{result.stderr}")
+    return elapsed
+
+def loaded_modules(*args: str) -> list:
+    result = _python("-c", CHECK_MODULES.format(forbidden=FORBIDDEN_MODULES), *args)
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--import-budget-ms", type=float, default=60.0,
+                        help="batas median waktu impor taskManager")
+    parser.add_argument("--command-budget-ms", type=float, default=250.0,
+                        help="batas median waktu total satu perintah tanpa prompt")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        board = os.path.join(directory, "tasks.json")
+        _python("taskManager.py", "-f", board, "add", "Benchmark", "--deadline", "2030-01-01 09:00",
+                check=True)
+        commands = {
+            "query": ("-f", board, "query"),
+            "stats": ("-f", board, "stats"),
+        }
+
+        failed = False
+        imports = statistics.median(import_time_ms() for _ in range(args.runs))
+        print(f"impor taskManager : {imports:8.1f} ms (anggaran {args.import_budget_ms:.0f} ms)")
+        failed |= imports > args.import_budget_ms
+
+        for name, command in commands.items():
+            elapsed = statistics.median(command_time_ms(*command) for _ in range(args.runs))
+            print(f"perintah {name:<9}: {elapsed:8.1f} ms (anggaran {args.command_budget_ms:.0f} ms)")
+            failed |= elapsed > args.command_budget_ms
+
+            loaded = loaded_modules(*command)
+            if loaded:
+                print(f"  modul terlarang dimuat: {', '.join(loaded)}")
+                failed = True
+
+    print("GAGAL" if failed else "OK")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from taskProfile import instrumentation
+from taskManager import DATE_FORMAT, Priority, SortedTaskIndex, Task, TaskManager, TaskStatus
+
+DATABASE_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+SNAPSHOT_EXTENSIONS = ('.tmsnap',)
+OPERATIONS = ('add', 'complete', 'delete', 'edit')  # Nilai "op" yang dikenal mode batch
+
+def parse_priority(value: str) -> Priority:
+    value = value.strip()
+    for index, priority in enumerate(Priority, 1):
+        if value.upper() == priority.name or value.lower() == priority.label.lower() or value == str(index):
+            return priority
+    raise argparse.ArgumentTypeError(f"Prioritas tidak dikenal: {value}")
+
+def parse_status(value: str) -> TaskStatus:
+    for status in TaskStatus:
+        if value.strip().lower() in (status.name.lower(), status.value.lower()):
+            return status
+    raise argparse.ArgumentTypeError(f"Status tidak dikenal: {value}")
+
+def parse_deadline(value: str) -> datetime:
+    try:
+        return datetime.strptime(value, DATE_FORMAT)
+    except ValueError:
+        raise argparse.ArgumentTypeError("Format deadline harus YYYY-MM-DD HH:MM")
+
+def open_board(path: str, journal: bool = False) -> TaskManager:
+    """Buka papan tugas sesuai ekstensinya: SQLite, snapshot biner, atau JSON/NDJSON."""
+    manager = TaskManager(overdue_callback=lambda task: None)
+    lower = path.lower()
+    if lower.endswith(DATABASE_EXTENSIONS):
+        manager.open_database(path)
+    elif lower.endswith(SNAPSHOT_EXTENSIONS):
+        if os.path.exists(path):
+            manager.open_snapshot(path)
+    elif journal or os.path.exists(path + ".journal") or os.path.exists(path + ".journal.old"):
+        # Papan yang pernah memakai journal selalu dibuka lewat journal agar perubahannya tidak hilang
+        manager.enable_journal(path)
+    elif os.path.exists(path):
+        manager.load_file(path)
+    return manager
+
+def close_board(manager: TaskManager, path: str, modified: bool):
+    """Simpan papan sekali di akhir perintah (jika berubah), lalu tutup store dan journal."""
+    lower = path.lower()
+    if manager.journal is not None or lower.endswith(DATABASE_EXTENSIONS):
+        # Journal dan SQLite sudah menyimpan setiap perubahan
+        pass
+    elif modified and lower.endswith(SNAPSHOT_EXTENSIONS):
+        manager.save_snapshot(path)
+    elif modified:
+        manager.save_file(path)
+    manager.disable_journal()
+    close = getattr(manager.tasks, 'close', None)
+    if close is not None:
+        close()
+
+def print_tasks(manager: TaskManager, tasks: List[Task], output_format: str):
+    if output_format == "table":
+        if tasks:
+            manager.print_tasks_table(tasks)
+        else:
+            print("Tidak ada tugas!")
+    elif output_format == "json":
+        print(json.dumps([task.to_dict() for task in tasks], indent=4))
+    else:
+        for task in tasks:
+            print(json.dumps(task.to_dict(), ensure_ascii=False))
+
+def _text_field(record: dict, name: str, default: Optional[str] = None) -> str:
+    value = record[name] if default is None else record.get(name, default)
+    if not isinstance(value, str):
+        raise ValueError(f"Field '{name}' harus berupa teks")
+    return value
+
+def apply_operation(manager: TaskManager, record: dict) -> dict:
+    """Jalankan satu operasi batch, misalnya {"op": "complete", "id": 3}.
+
+    Bentuk dan tipe record diperiksa sebelum papan diubah; record yang
+    salah menghasilkan ValueError/KeyError tanpa efek samping.
+    """
+    if not isinstance(record, dict):
+        raise ValueError("Operasi harus berupa objek JSON")
+    op = record.get("op")
+    if op not in OPERATIONS:
+        return {"ok": False, "op": op, "error": f"Operasi tidak dikenal: {op}"}
+    if op == "add":
+        task = manager.create(
+            title=_text_field(record, "title"),
+            description=_text_field(record, "description", ""),
+            priority=parse_priority(_text_field(record, "priority", "MEDIUM")),
+            deadline=parse_deadline(_text_field(record, "deadline"))
+        )
+        return {"ok": True, "op": op, "id": task.id}
+
+    task_id = record.get("id")
+    if not isinstance(task_id, int) or isinstance(task_id, bool):
+        raise ValueError("Field 'id' harus berupa bilangan bulat")
+    if op == "complete":
+        task = manager.complete(task_id)
+    elif op == "delete":
+        task = manager.remove(task_id)
+    elif op == "edit":
+        changes = {}
+        if "title" in record:
+            changes["title"] = _text_field(record, "title")
+        if "description" in record:
+            changes["description"] = _text_field(record, "description")
+        if "priority" in record:
+            changes["priority"] = parse_priority(_text_field(record, "priority"))
+        if "deadline" in record:
+            changes["deadline"] = parse_deadline(_text_field(record, "deadline"))
+        task = manager.update(task_id, **changes)
+
+    if task is None:
+        return {"ok": False, "op": op, "id": task_id, "error": "ID tugas tidak ditemukan"}
+    return {"ok": True, "op": op, "id": task_id}
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="taskManager",
+        description="Task Manager tanpa prompt interaktif. Semua perintah memuat file sekali, "
+                    "menjalankan perubahan, lalu menyimpan sekali."
+    )
+    parser.add_argument("-f", "--file", default="tasks.json",
+                        help="file papan tugas: .json, .ndjson/.jsonl, .tmsnap, atau .db/.sqlite")
+    parser.add_argument("--journal", action="store_true",
+                        help="catat perubahan ke journal alih-alih menulis ulang file JSON")
+    parser.add_argument("--profile", action="store_true",
+                        help="tampilkan ringkasan latensi per operasi di stderr")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="tambah tugas")
+    add.add_argument("title")
+    add.add_argument("-d", "--description", default="")
+    add.add_argument("-p", "--priority", type=parse_priority, default=Priority.MEDIUM)
+    add.add_argument("--deadline", type=parse_deadline, required=True, help="YYYY-MM-DD HH:MM")
+
+    complete = commands.add_parser("complete", help="tandai tugas selesai")
+    complete.add_argument("ids", type=int, nargs="+")
+
+    delete = commands.add_parser("delete", help="hapus tugas")
+    delete.add_argument("ids", type=int, nargs="+")
+
+    edit = commands.add_parser("edit", help="ubah tugas")
+    edit.add_argument("id", type=int)
+    edit.add_argument("-t", "--title")
+    edit.add_argument("-d", "--description")
+    edit.add_argument("-p", "--priority", type=parse_priority)
+    edit.add_argument("--deadline", type=parse_deadline)
+
+    query = commands.add_parser("query", help="cari tugas (sintaks sama dengan menu Cari Tugas)")
+    query.add_argument("text", nargs="?", default="")
+    query.add_argument("-s", "--status", type=parse_status, help="pending atau completed")
+    query.add_argument("-p", "--priority", type=parse_priority)
+    query.add_argument("--due-before", type=parse_deadline, help="YYYY-MM-DD HH:MM")
+    query.add_argument("-o", "--order-by", default="id", choices=SortedTaskIndex.ORDERS)
+    query.add_argument("--desc", action="store_true", help="urutkan menurun")
+    query.add_argument("-n", "--limit", type=int)
+    query.add_argument("--format", choices=("table", "json", "ndjson"), default="table")
+
+    import_ = commands.add_parser("import", help="gabungkan tugas dari file JSON/NDJSON")
+    import_.add_argument("source")
+    import_.add_argument("--replace", action="store_true", help="ganti seluruh isi papan")
+
+    export = commands.add_parser("export", help="ekspor tugas ke file JSON/NDJSON")
+    export.add_argument("target")
+
+    stats = commands.add_parser("stats", help="tampilkan statistik")
+    stats.add_argument("--format", choices=("text", "json"), default="text")
+
+    batch = commands.add_parser("batch", help="jalankan operasi NDJSON dari stdin atau file")
+    batch.add_argument("input", nargs="?", default="-")
+
+    serve = commands.add_parser("serve", help="jalankan server HTTP/JSON (perubahan dicatat ke journal)")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    return parser
+
+def run_command(manager: TaskManager, args: argparse.Namespace) -> Tuple[int, bool]:
+    """Jalankan satu subperintah; kembalikan (kode keluar, apakah papan berubah)."""
+    modified = True
+    status = 0
+
+    if args.command == "add":
+        task = manager.create(args.title, args.description, args.priority, args.deadline)
+        print(task.id)
+    elif args.command in ("complete", "delete"):
+        action = manager.complete_many if args.command == "complete" else manager.delete_many
+        found = {task.id for task in action(args.ids)}
+        for task_id in args.ids:
+            if task_id not in found:
+                print(f"ID tugas tidak ditemukan: {task_id}", file=sys.stderr)
+                status = 1
+    elif args.command == "edit":
+        changes = {name: value for name, value in (
+            ("title", args.title), ("description", args.description),
+            ("priority", args.priority), ("deadline", args.deadline)) if value is not None}
+        if manager.update(args.id, **changes) is None:
+            print(f"ID tugas tidak ditemukan: {args.id}", file=sys.stderr)
+            status = 1
+    elif args.command == "query":
+        order_by = "-" + args.order_by if args.desc else args.order_by
+        if args.text:
+            # Hasil pencarian teks disaring dan diurutkan lewat indeks terurut
+            matches = {task.id for task in manager.search(args.text)}
+            ids = [task_id for task_id in manager.query_ids(args.status, args.priority, args.due_before,
+                                                            order_by) if task_id in matches]
+            tasks = [manager.get(task_id) for task_id in ids[:args.limit]]
+        else:
+            tasks = manager.query(args.status, args.priority, args.due_before, order_by, args.limit)
+        print_tasks(manager, tasks, args.format)
+        modified = False
+    elif args.command == "import":
+        from taskStream import iter_task_file
+
+        incoming = iter_task_file(args.source)
+        if args.replace:
+            manager.replace_tasks(incoming)
+        else:
+            new_tasks = []
+            for task in incoming:
+                if task.id in manager.tasks:
+                    manager.update(task.id, **{name: getattr(task, name) for name in Task.__slots__
+                                               if name != 'id'})
+                else:
+                    new_tasks.append(task)
+            manager.add_many(new_tasks)
+    elif args.command == "export":
+        manager.save_file(args.target)
+        modified = False
+    elif args.command == "stats":
+        stats = manager.stats()
+        if args.format == "json":
+            print(json.dumps({
+                "total": stats.total,
+                "completed": stats.completed,
+                "pending": stats.pending,
+                "overdue": stats.overdue,
+                "by_priority": {priority.name: count for priority, count in stats.by_priority.items()}
+            }))
+        else:
+            print(f"Total tugas         : {stats.total}")
+            print(f"Tugas selesai       : {stats.completed}")
+            print(f"Tugas pending       : {stats.pending}")
+            print(f"Tugas terlambat     : {stats.overdue}")
+            for priority, count in stats.by_priority.items():
+                print(f"{priority.icon} {priority.label}: {count}")
+        modified = False
+    elif args.command == "batch":
+        source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+        with source:
+            for line in source:
+                if not line.strip():
+                    continue
+                # Record yang rusak hanya menggagalkan barisnya sendiri; operasi lain tetap disimpan
+                try:
+                    result = apply_operation(manager, json.loads(line))
+                except (KeyError, ValueError, TypeError, AttributeError, argparse.ArgumentTypeError) as e:
+                    result = {"ok": False, "error": str(e)}
+                if not result["ok"]:
+                    status = 1
+                print(json.dumps(result, ensure_ascii=False))
+    elif args.command == "serve":
+        from taskServer import serve
+
+        serve(manager, args.host, args.port)
+
+    return status, modified
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.profile:
+        instrumentation.enable()
+    try:
+        # Server berjalan lama, jadi papan JSON selalu memakai journal agar tiap perubahan langsung tersimpan
+        manager = open_board(args.file, journal=args.journal or args.command == "serve")
+    except (OSError, ValueError) as e:
+        print(f"Gagal membuka '{args.file}': {e}", file=sys.stderr)
+        return 1
+    try:
+        status, modified = run_command(manager, args)
+    except (OSError, KeyError, ValueError, AttributeError) as e:
+        # Papan tidak disimpan agar file tidak berisi perubahan setengah jadi
+        print(f"Terjadi kesalahan: {e}", file=sys.stderr)
+        status, modified = 1, False
+    close_board(manager, args.file, modified)
+    if args.profile:
+        print(instrumentation.format_summary(), file=sys.stderr)
+    return status
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from taskManager import Task
+from taskStream import iter_json_array
+
+FSYNC_ALWAYS = "always"
+FSYNC_INTERVAL = "interval"
+FSYNC_NEVER = "never"
+
+class TaskJournal:
+    """Persistensi write-ahead: snapshot JSON ditambah journal append-only.
+
+    Setiap perubahan ditulis sebagai satu baris JSON ringkas ke
+    ``<snapshot>.journal``. Saat dibuka, snapshot terakhir dimuat lalu
+    journal diputar ulang di atasnya. Jika journal melewati
+    ``compact_threshold`` byte, journal diputar ke ``.journal.old`` dan
+    thread pemadat menggabungkannya ke snapshot baru hanya dengan membaca
+    file, tanpa menyentuh objek Task yang sedang dipakai. Dengan fsync
+    ``interval``, thread yang sama men-fsync data yang belum tersinkron
+    paling lambat ``fsync_interval`` detik setelah ditulis, walaupun tidak
+    ada penulisan berikutnya.
+
+    Record bersifat idempoten (``put`` menyimpan seluruh isi tugas,
+    ``delete`` mengabaikan id yang tidak ada), sehingga memutar ulang
+    ``.journal.old`` yang sudah terlanjur masuk snapshot tetap aman.
+    """
+
+    def __init__(self, snapshot_path: str, fsync: str = FSYNC_INTERVAL,
+                 fsync_interval: float = 1.0, compact_threshold: int = 4 * 1024 * 1024):
+        if fsync not in (FSYNC_ALWAYS, FSYNC_INTERVAL, FSYNC_NEVER):
+            raise ValueError(f"Kebijakan fsync tidak dikenal: {fsync}")
+        self.snapshot_path = snapshot_path
+        self.journal_path = snapshot_path + ".journal"
+        self.rotated_path = snapshot_path + ".journal.old"
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.compact_threshold = compact_threshold
+        self._lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self._last_sync = time.monotonic()
+        self._unsynced_since: Optional[float] = None  # Waktu penulisan pertama yang belum di-fsync
+        self._wakeup = threading.Event()  # Membangunkan thread latar: pemadatan atau tenggat fsync baru
+        self._compactor: Optional[threading.Thread] = None
+        self._closed = False
+
+    def open(self) -> List[Task]:
+        """Muat snapshot dan putar ulang journal, lalu siap menerima record baru."""
+        # Pemadatan yang terputus sebelum selesai diselesaikan sekarang
+        self._compact_rotated()
+        self._drop_partial_record()
+        state = self._read_state([self.journal_path])
+        self._file = open(self.journal_path, 'a', encoding='utf-8')
+        self._size = self._file.tell()
+        self._closed = False
+        self._compactor = threading.Thread(target=self._background_worker, daemon=True)
+        self._compactor.start()
+        return [Task.from_dict(data) for data in state.values()]
+
+    def record_put(self, task: Task):
+        self._append({"op": "put", "task": task.to_dict()})
+
+    def record_delete(self, task_id: int):
+        self._append({"op": "delete", "id": task_id})
+
+    def record_put_many(self, tasks: Iterable[Task]):
+        self._append(*({"op": "put", "task": task.to_dict()} for task in tasks))
+
+    def record_delete_many(self, task_ids: Iterable[int]):
+        self._append(*({"op": "delete", "id": task_id} for task_id in task_ids))
+
+    def record_reset(self, tasks: Iterable[Task]):
+        """Ganti seluruh isi (misalnya setelah memuat file lain) dengan snapshot baru."""
+        with self._lock, self._snapshot_lock:
+            self._write_snapshot({task.id: task.to_dict() for task in tasks})
+            if os.path.exists(self.rotated_path):
+                os.remove(self.rotated_path)
+            self._file.truncate(0)
+            self._file.seek(0)
+            self._size = 0
+            self._unsynced_since = None
+
+    def close(self):
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.flush()
+            if self.fsync != FSYNC_NEVER:
+                os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+            self._unsynced_since = None
+            self._closed = True
+        self._wakeup.set()
+        if self._compactor is not None:
+            self._compactor.join()
+
+    def _append(self, *records: dict):
+        # Beberapa record ditulis dengan satu write dan paling banyak satu fsync
+        line = "".join(json.dumps(record, separators=(',', ':'), ensure_ascii=False) + "\n"
+                       for record in records)
+        if not line:
+            return
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            self._size += len(line.encode('utf-8'))
+            now = time.monotonic()
+            if self.fsync == FSYNC_ALWAYS or (
+                    self.fsync == FSYNC_INTERVAL and now - self._last_sync >= self.fsync_interval):
+                self._sync(now)
+            elif self.fsync == FSYNC_INTERVAL and self._unsynced_since is None:
+                # Thread latar menjamin fsync sebelum tenggat, meski tidak ada penulisan lagi
+                self._unsynced_since = now
+                self._wakeup.set()
+            if self._size >= self.compact_threshold and not os.path.exists(self.rotated_path):
+                self._rotate()
+
+    def _sync(self, now: float):
+        # Dipanggil dengan _lock dipegang
+        os.fsync(self._file.fileno())
+        self._last_sync = now
+        self._unsynced_since = None
+
+    def _rotate(self):
+        self._file.flush()
+        self._sync(time.monotonic())
+        self._file.close()
+        os.replace(self.journal_path, self.rotated_path)
+        self._file = open(self.journal_path, 'a', encoding='utf-8')
+        self._size = 0
+        self._wakeup.set()
+
+    def _sync_if_due(self):
+        with self._lock:
+            if self._file is None or self._unsynced_since is None:
+                return
+            now = time.monotonic()
+            if now - self._unsynced_since >= self.fsync_interval:
+                self._sync(now)
+
+    def _background_worker(self):
+        while True:
+            timeout = None
+            unsynced_since = self._unsynced_since
+            if unsynced_since is not None:
+                timeout = max(0.0, unsynced_since + self.fsync_interval - time.monotonic())
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+            self._sync_if_due()
+            self._compact_rotated()
+            if self._closed:
+                return
+
+    def _compact_rotated(self):
+        with self._snapshot_lock:
+            if not os.path.exists(self.rotated_path):
+                return
+            state = self._read_state([self.rotated_path])
+            self._write_snapshot(state)
+            os.remove(self.rotated_path)
+
+    def _drop_partial_record(self):
+        """Potong record terakhir yang tidak lengkap agar append berikutnya tidak tercampur."""
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path, 'rb+') as file:
+            end = file.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - 65536)
+                file.seek(start)
+                newline = file.read(position - start).rfind(b"\n")
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position != end:
+                file.truncate(position)
+
+    def _read_state(self, journal_paths: List[str]) -> Dict[int, dict]:
+        state: Dict[int, dict] = {}
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'rb') as file:
+                for data in iter_json_array(file):
+                    state[data['id']] = data
+        for path in journal_paths:
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Baris terakhir yang terpotong karena crash
+                        break
+                    if record['op'] == 'put':
+                        state[record['task']['id']] = record['task']
+                    elif record['op'] == 'delete':
+                        state.pop(record['id'], None)
+        return state
+
+    def _write_snapshot(self, state: Dict[int, dict]):
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(list(state.values()), file, separators=(',', ':'), ensure_ascii=False)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.snapshot_path)
@@ -1,15 +1,52 @@
 import json
-from tabulate import tabulate
+import heapq
+import bisect
+import re
+import sys
+import traceback
+import unicodedata
+from collections import deque
+from itertools import chain, islice
 from datetime import datetime, timedelta
 import threading
 from enum import Enum
 import os
-import colorama
-from colorama import Fore, Style
-from dataclasses import dataclass, asdict
-from typing import Optional, List, Union
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, Iterable, Iterator, NamedTuple, Optional, List, Set, Tuple, Union
+from taskProfile import instrumentation, timed
 
-colorama.init()
+class _LazyColorama:
+    """Pengganti ``colorama.Fore``/``colorama.Style`` yang baru mengimpor colorama saat warna pertama dipakai.
+
+    Perintah tanpa prompt (taskCli) tidak pernah mewarnai keluaran, jadi
+    colorama tidak perlu dimuat saat start.
+    """
+
+    _initialized = False
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attribute: str) -> str:
+        import colorama
+
+        if not _LazyColorama._initialized:
+            colorama.init()
+            _LazyColorama._initialized = True
+        return getattr(getattr(colorama, self._name), attribute)
+
+Fore = _LazyColorama('Fore')
+Style = _LazyColorama('Style')
+
+DATE_FORMAT = "%Y-%m-%d %H:%M"
+
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.strptime(value, DATE_FORMAT) if value else None
+
+def format_datetime(value: Optional[datetime]) -> Optional[str]:
+    return value.strftime(DATE_FORMAT) if value else None
 
 class Priority(Enum):
     HIGH = ("Tinggi", "🔴")
@@ -24,51 +61,859 @@ class TaskStatus(Enum):
     PENDING = "Pending"
     COMPLETED = "Completed"
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: int
     title: str
     description: str
     priority: Priority
     status: TaskStatus
-    deadline: str
-    created_at: str
-    completed_at: Optional[str] = None
+    deadline: datetime
+    created_at: datetime
+    completed_at: Optional[datetime] = None
 
     def to_dict(self) -> dict:
-        data = asdict(self)
-        data['priority'] = self.priority.name
-        data['status'] = self.status.value
-        return data
+        return {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'priority': self.priority.name,
+            'status': self.status.value,
+            'deadline': format_datetime(self.deadline),
+            'created_at': format_datetime(self.created_at),
+            'completed_at': format_datetime(self.completed_at)
+        }
+
+    def copy(self) -> 'Task':
+        # Konstruktor langsung jauh lebih murah daripada dataclasses.replace; setiap event menyalin tugas
+        return Task(self.id, self.title, self.description, self.priority, self.status,
+                    self.deadline, self.created_at, self.completed_at)
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Task':
+        data = dict(data)
         data['priority'] = Priority[data['priority']]
         data['status'] = TaskStatus(data['status'])
+        data['deadline'] = parse_datetime(data['deadline'])
+        data['created_at'] = parse_datetime(data['created_at'])
+        data['completed_at'] = parse_datetime(data.get('completed_at'))
         return cls(**data)
 
-class TaskManager:
+    def validate(self):
+        # Jalur cepat untuk tugas yang valid; validate_task_fields menyusun pesan galatnya
+        if not (type(self.id) is int and isinstance(self.title, str) and isinstance(self.description, str)
+                and isinstance(self.priority, Priority) and isinstance(self.status, TaskStatus)
+                and isinstance(self.deadline, datetime) and isinstance(self.created_at, datetime)
+                and (self.completed_at is None or isinstance(self.completed_at, datetime))):
+            validate_task_fields({name: getattr(self, name) for name in self.__slots__})
+
+# Tipe yang diharapkan per field; data dari luar (CLI, server) diperiksa sebelum store disentuh
+TASK_FIELD_TYPES = {
+    'id': int,
+    'title': str,
+    'description': str,
+    'priority': Priority,
+    'status': TaskStatus,
+    'deadline': datetime,
+    'created_at': datetime,
+    'completed_at': (datetime, type(None)),
+}
+
+def validate_task_fields(fields: dict):
+    """Tolak nama field yang tidak dikenal (AttributeError) atau nilai bertipe salah (TypeError)."""
+    for name, value in fields.items():
+        expected = TASK_FIELD_TYPES.get(name)
+        if expected is None:
+            raise AttributeError(f"Field '{name}' tidak dikenal")
+        if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+            raise TypeError(f"Field '{name}' tidak boleh bertipe {type(value).__name__}")
+
+class TaskStore:
+    """Penyimpanan tugas berbasis id dengan lookup dan penghapusan O(1).
+
+    dict Python menjaga urutan penyisipan, sehingga iterasi tetap mengikuti
+    urutan tugas ditambahkan (dipakai untuk tampilan).
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        self._tasks: Dict[int, Task] = {}
+        for task in tasks:
+            self.add(task)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._tasks.values())
+
+    def __contains__(self, task_id: int) -> bool:
+        return task_id in self._tasks
+
+    def get(self, task_id: int) -> Optional[Task]:
+        return self._tasks.get(task_id)
+
+    def add(self, task: Task) -> Task:
+        if task.id in self._tasks:
+            raise KeyError(f"Tugas dengan ID {task.id} sudah ada")
+        self._tasks[task.id] = task
+        return task
+
+    def remove(self, task_id: int) -> Optional[Task]:
+        return self._tasks.pop(task_id, None)
+
+    def update(self, task_id: int, **fields) -> Optional[Task]:
+        task = self._tasks.get(task_id)
+        if task is None:
+            return None
+        for name in fields:
+            if name == 'id' or not hasattr(task, name):
+                raise AttributeError(f"Field '{name}' tidak dapat diubah")
+        for name, value in fields.items():
+            setattr(task, name, value)
+        return task
+
+    def ids(self) -> List[int]:
+        return list(self._tasks)
+
+    def clear(self):
+        self._tasks.clear()
+
+class EventKind(Enum):
+    TASK_ADDED = "task_added"
+    TASK_UPDATED = "task_updated"
+    TASK_COMPLETED = "task_completed"
+    TASK_DELETED = "task_deleted"
+    BULK_LOADED = "bulk_loaded"
+
+class TaskEvent(NamedTuple):
+    """Satu perubahan pada papan, lihat ``TaskManager.subscribe`` dan ``changes_since``.
+
+    ``version`` adalah versi papan setelah perubahan; event dari satu
+    operasi massal berbagi versi yang sama. ``task`` adalah salinan
+    keadaan sesudah perubahan dan ``previous`` keadaan sebelumnya (untuk
+    update dan delete). BULK_LOADED (papan dimuat atau diganti) tidak
+    membawa tugas: konsumen harus membaca ulang semuanya.
+    """
+    kind: EventKind
+    version: int
+    task_id: Optional[int] = None
+    task: Optional[Task] = None
+    previous: Optional[Task] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "kind": self.kind.value,
+            "version": self.version,
+            "task_id": self.task_id,
+            "task": self.task.to_dict() if self.task is not None else None
+        }
+
+EVENT_HISTORY = 10000
+
+@dataclass(frozen=True)
+class StatisticsSnapshot:
+    total: int
+    completed: int
+    pending: int
+    overdue: int
+    by_priority: Dict[Priority, int] = field(default_factory=dict)
+
+class TaskStatistics:
+    """Penghitung statistik yang diperbarui setiap kali tugas berubah.
+
+    Deadline tugas pending disimpan terurut sehingga jumlah tugas terlambat
+    cukup dicari dengan bisect, tanpa memindai semua tugas.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.completed = 0
+        self.by_priority: Dict[Priority, int] = {priority: 0 for priority in Priority}
+        self._pending_deadlines: List[Tuple[datetime, int]] = []
+
+    def add(self, task: Task):
+        self.total += 1
+        self.by_priority[task.priority] += 1
+        if task.status == TaskStatus.COMPLETED:
+            self.completed += 1
+        else:
+            bisect.insort(self._pending_deadlines, (task.deadline, task.id))
+
+    def discard(self, task: Task):
+        self.total -= 1
+        self.by_priority[task.priority] -= 1
+        if task.status == TaskStatus.COMPLETED:
+            self.completed -= 1
+        else:
+            key = (task.deadline, task.id)
+            index = bisect.bisect_left(self._pending_deadlines, key)
+            if index < len(self._pending_deadlines) and self._pending_deadlines[index] == key:
+                del self._pending_deadlines[index]
+
+    def add_many(self, tasks: Iterable[Task]):
+        pending = []
+        for task in tasks:
+            self.total += 1
+            self.by_priority[task.priority] += 1
+            if task.status == TaskStatus.COMPLETED:
+                self.completed += 1
+            else:
+                pending.append((task.deadline, task.id))
+        if pending:
+            # Timsort menggabungkan dua deret terurut dalam O(n)
+            pending.sort()
+            self._pending_deadlines += pending
+            self._pending_deadlines.sort()
+
+    def discard_many(self, tasks: Iterable[Task]):
+        removed = set()
+        for task in tasks:
+            self.total -= 1
+            self.by_priority[task.priority] -= 1
+            if task.status == TaskStatus.COMPLETED:
+                self.completed -= 1
+            else:
+                removed.add((task.deadline, task.id))
+        if removed:
+            self._pending_deadlines = [key for key in self._pending_deadlines if key not in removed]
+
+    def rebuild(self, tasks: Iterable[Task]):
+        self.total = 0
+        self.completed = 0
+        self.by_priority = {priority: 0 for priority in Priority}
+        pending = []
+        for task in tasks:
+            self.total += 1
+            self.by_priority[task.priority] += 1
+            if task.status == TaskStatus.COMPLETED:
+                self.completed += 1
+            else:
+                pending.append((task.deadline, task.id))
+        pending.sort()
+        self._pending_deadlines = pending
+
+    def overdue(self, now: Optional[datetime] = None) -> int:
+        now = now or datetime.now()
+        return bisect.bisect_left(self._pending_deadlines, (now, -1))
+
+    def snapshot(self) -> StatisticsSnapshot:
+        return StatisticsSnapshot(
+            total=self.total,
+            completed=self.completed,
+            pending=self.total - self.completed,
+            overdue=self.overdue(),
+            by_priority=dict(self.by_priority)
+        )
+
+class SearchIndex:
+    """Indeks terbalik untuk judul dan deskripsi tugas.
+
+    Setiap field memiliki indeks token (untuk pencarian awalan, ``kata*``) dan
+    indeks trigram (untuk pencarian substring). Kueri terdiri dari beberapa
+    term yang semuanya harus cocok; term dapat dibatasi ke satu field dengan
+    ``title:``/``judul:`` atau ``description:``/``deskripsi:`` dan frasa dapat
+    ditulis di antara tanda kutip.
+    """
+
+    FIELDS = ('title', 'description')
+    FIELD_ALIASES = {'title': 'title', 'judul': 'title',
+                     'description': 'description', 'deskripsi': 'description'}
+    TOKEN_PATTERN = re.compile(r"\w+")
+    TERM_PATTERN = re.compile(r'(?:(\w+):)?("[^"]*"?|\S+)')
+
+    def __init__(self):
+        self._texts: Dict[str, Dict[int, str]] = {name: {} for name in self.FIELDS}
+        self._tokens: Dict[str, Dict[str, Set[int]]] = {name: {} for name in self.FIELDS}
+        self._grams: Dict[str, Dict[str, Set[int]]] = {name: {} for name in self.FIELDS}
+        self._vocabulary: Dict[str, List[str]] = {name: [] for name in self.FIELDS}
+
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def add(self, task: Task):
+        self._add(task, True)
+
+    def discard(self, task: Task):
+        self._discard(task, True)
+
+    def add_many(self, tasks: Iterable[Task]):
+        for task in tasks:
+            self._add(task, False)
+        self._sort_vocabulary()
+
+    def discard_many(self, tasks: Iterable[Task]):
+        for task in tasks:
+            self._discard(task, False)
+        self._sort_vocabulary()
+
+    def _sort_vocabulary(self):
+        # Untuk banyak tugas sekaligus, satu kali sort lebih murah daripada insort per token
+        self._vocabulary = {name: sorted(self._tokens[name]) for name in self.FIELDS}
+
+    def _add(self, task: Task, update_vocabulary: bool):
+        for name in self.FIELDS:
+            text = getattr(task, name).lower()
+            self._texts[name][task.id] = text
+            tokens = self._tokens[name]
+            for token in set(self.TOKEN_PATTERN.findall(text)):
+                ids = tokens.get(token)
+                if ids is None:
+                    ids = tokens[token] = set()
+                    if update_vocabulary:
+                        bisect.insort(self._vocabulary[name], token)
+                ids.add(task.id)
+            grams = self._grams[name]
+            for gram in self._trigrams(text):
+                grams.setdefault(gram, set()).add(task.id)
+
+    def _discard(self, task: Task, update_vocabulary: bool):
+        for name in self.FIELDS:
+            text = self._texts[name].pop(task.id, None)
+            if text is None:
+                continue
+            tokens = self._tokens[name]
+            for token in set(self.TOKEN_PATTERN.findall(text)):
+                ids = tokens[token]
+                ids.discard(task.id)
+                if not ids:
+                    del tokens[token]
+                    if update_vocabulary:
+                        vocabulary = self._vocabulary[name]
+                        del vocabulary[bisect.bisect_left(vocabulary, token)]
+            grams = self._grams[name]
+            for gram in self._trigrams(text):
+                ids = grams[gram]
+                ids.discard(task.id)
+                if not ids:
+                    del grams[gram]
+
+    def rebuild(self, tasks: Iterable[Task]):
+        self.__init__()
+        self.add_many(tasks)
+
+    def _match_prefix(self, name: str, prefix: str) -> Set[int]:
+        vocabulary = self._vocabulary[name]
+        tokens = self._tokens[name]
+        found: Set[int] = set()
+        index = bisect.bisect_left(vocabulary, prefix)
+        while index < len(vocabulary) and vocabulary[index].startswith(prefix):
+            found |= tokens[vocabulary[index]]
+            index += 1
+        return found
+
+    def _match_substring(self, name: str, term: str) -> Set[int]:
+        texts = self._texts[name]
+        if len(term) >= 3:
+            grams = self._grams[name]
+            postings = []
+            for gram in self._trigrams(term):
+                ids = grams.get(gram)
+                if not ids:
+                    return set()
+                postings.append(ids)
+            postings.sort(key=len)
+            candidates = postings[0].intersection(*postings[1:])
+        elif self.TOKEN_PATTERN.fullmatch(term):
+            tokens = self._tokens[name]
+            found: Set[int] = set()
+            for token in self._vocabulary[name]:
+                if term in token:
+                    found |= tokens[token]
+            return found
+        else:
+            candidates = texts.keys()
+        # Trigram yang sama belum menjamin substring; cocokkan dengan teks aslinya
+        return {task_id for task_id in candidates if term in texts[task_id]}
+
+    @classmethod
+    def parse_query(cls, query: str) -> List[Tuple[Tuple[str, ...], str, bool]]:
+        """Pecah kueri menjadi (field, term, apakah pencarian awalan) per term."""
+        terms = []
+        for scope, term in cls.TERM_PATTERN.findall(query.lower()):
+            name = cls.FIELD_ALIASES.get(scope)
+            if scope and name is None:
+                term = f"{scope}:{term}"
+            if term.startswith('"'):
+                term = term.strip('"')
+            if not term:
+                continue
+            prefix = term.endswith('*') and len(term) > 1
+            terms.append(((name,) if name else cls.FIELDS, term[:-1] if prefix else term, prefix))
+        return terms
+
+    def search(self, query: str) -> List[int]:
+        result: Optional[Set[int]] = None
+        for fields, term, prefix in self.parse_query(query):
+            matches: Set[int] = set()
+            for field_name in fields:
+                if prefix:
+                    matches |= self._match_prefix(field_name, term)
+                else:
+                    matches |= self._match_substring(field_name, term)
+            result = matches if result is None else result & matches
+            if not result:
+                return []
+        if result is None:
+            return sorted(self._texts['title'])
+        return sorted(result)
+
+class SortedTaskIndex:
+    """Indeks terurut untuk kueri berdasarkan status, prioritas, dan deadline.
+
+    Tugas dipartisi per (status, prioritas). Setiap partisi menyimpan list
+    terurut (deadline, id), (created_at, id), dan id. Kueri memilih partisi
+    yang cocok, memotong list deadline dengan bisect, lalu menggabungkan
+    partisi dengan heapq.merge; k hasil pertama didapat dalam O(log n + k).
+    """
+
+    KEYS = ('deadline', 'created_at', 'id')
+    ORDERS = KEYS + ('priority', 'status')
+    FIELDS = ('status', 'priority', 'deadline', 'created_at')
+
+    def __init__(self):
+        self._lists: Dict[Tuple[TaskStatus, Priority, str], list] = {
+            (status, priority, key): []
+            for status in TaskStatus for priority in Priority for key in self.KEYS
+        }
+
+    @staticmethod
+    def _entry(task: Task, key: str):
+        return task.id if key == 'id' else (getattr(task, key), task.id)
+
+    def add(self, task: Task):
+        for key in self.KEYS:
+            bisect.insort(self._lists[(task.status, task.priority, key)], self._entry(task, key))
+
+    def discard(self, task: Task):
+        for key in self.KEYS:
+            entries = self._lists[(task.status, task.priority, key)]
+            entry = self._entry(task, key)
+            index = bisect.bisect_left(entries, entry)
+            if index < len(entries) and entries[index] == entry:
+                del entries[index]
+
+    def add_many(self, tasks: Iterable[Task]):
+        grouped: Dict[tuple, list] = {}
+        for task in tasks:
+            for key in self.KEYS:
+                grouped.setdefault((task.status, task.priority, key), []).append(self._entry(task, key))
+        for name, entries in grouped.items():
+            target = self._lists[name]
+            target += entries
+            target.sort()
+
+    def discard_many(self, tasks: Iterable[Task]):
+        grouped: Dict[tuple, set] = {}
+        for task in tasks:
+            for key in self.KEYS:
+                grouped.setdefault((task.status, task.priority, key), set()).add(self._entry(task, key))
+        for name, entries in grouped.items():
+            self._lists[name] = [entry for entry in self._lists[name] if entry not in entries]
+
+    def rebuild(self, tasks: Iterable[Task]):
+        self.__init__()
+        self.add_many(tasks)
+
+    def _due_before(self, entries: list, due_before: datetime) -> int:
+        # (due_before,) lebih kecil dari setiap (due_before, id)
+        return bisect.bisect_left(entries, (due_before,))
+
+    def query_ids(self, status: Optional[TaskStatus] = None, priority: Optional[Priority] = None,
+                  due_before: Optional[datetime] = None, order_by: str = 'deadline',
+                  limit: Optional[int] = None, offset: int = 0) -> List[int]:
+        """Id tugas yang cocok, terurut menurut ``order_by`` (awali ``-`` untuk menurun).
+
+        ``order_by`` salah satu dari deadline, created_at, id, priority (Tinggi
+        dulu), atau status (Pending dulu); dua yang terakhir diurutkan lagi
+        per deadline. ``due_before`` hanya memilih deadline sebelum waktu itu.
+        """
+        descending = order_by.startswith('-')
+        field_name = order_by[1:] if descending else order_by
+        if field_name not in self.ORDERS:
+            raise ValueError(f"Urutan tidak dikenal: {order_by}")
+        statuses = list(TaskStatus) if status is None else [status]
+        priorities = list(Priority) if priority is None else [priority]
+        key = field_name if field_name in self.KEYS else 'deadline'
+
+        allowed = None
+        if due_before is not None and key != 'deadline':
+            # Urutan lain tidak bisa dipotong dengan bisect; saring dengan id dari list deadline
+            allowed = set()
+            for status_value in statuses:
+                for priority_value in priorities:
+                    entries = self._lists[(status_value, priority_value, 'deadline')]
+                    allowed.update(entry[1] for entry in islice(entries, self._due_before(entries, due_before)))
+
+        def partition(status_value: TaskStatus, priority_value: Priority) -> Iterator:
+            entries = self._lists[(status_value, priority_value, key)]
+            end = len(entries)
+            if due_before is not None and key == 'deadline':
+                end = self._due_before(entries, due_before)
+            indexes = range(end - 1, -1, -1) if descending else range(end)
+            return (entries[index] for index in indexes)
+
+        def merged(groups: List[Tuple[TaskStatus, Priority]]) -> Iterator:
+            iterators = [partition(*group) for group in groups]
+            return heapq.merge(*iterators, reverse=descending) if len(iterators) > 1 else iterators[0]
+
+        if field_name == 'priority':
+            ordered = reversed(priorities) if descending else priorities
+            entries = chain.from_iterable(merged([(s, p) for s in statuses]) for p in ordered)
+        elif field_name == 'status':
+            ordered = reversed(statuses) if descending else statuses
+            entries = chain.from_iterable(merged([(s, p) for p in priorities]) for s in ordered)
+        else:
+            entries = merged([(s, p) for s in statuses for p in priorities])
+
+        ids = (entry if key == 'id' else entry[1] for entry in entries)
+        if allowed is not None:
+            ids = (task_id for task_id in ids if task_id in allowed)
+        return list(islice(ids, offset, None if limit is None else offset + limit))
+
+class DeadlineScheduler:
+    """Memberi notifikasi satu kali untuk setiap tugas pending yang melewati deadline.
+
+    Deadline disimpan dalam min-heap; thread pekerja tidur tepat sampai
+    deadline terdekat, sehingga tidak ada pemindaian berkala. Entri lama
+    (tugas diedit, diselesaikan, atau dihapus) dibuang secara lazy saat
+    mencapai puncak heap.
+    """
+
+    def __init__(self, callback: Callable[[Task], None]):
+        self.callback = callback
+        self._heap: List[Tuple[datetime, int, int]] = []
+        self._entries: Dict[int, Tuple[int, datetime, Task]] = {}
+        self._notified: Dict[int, datetime] = {}
+        self._generation = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def schedule(self, task: Task):
+        with self._condition:
+            if task.status != TaskStatus.PENDING:
+                self._drop(task.id)
+                return
+            entry = self._entries.get(task.id)
+            if entry is not None and entry[1] == task.deadline:
+                return
+            if self._notified.get(task.id) == task.deadline:
+                return
+            self._notified.pop(task.id, None)
+            self._generation += 1
+            self._entries[task.id] = (self._generation, task.deadline, task)
+            heapq.heappush(self._heap, (task.deadline, task.id, self._generation))
+            if self._heap[0][2] == self._generation:
+                self._condition.notify()
+
+    def discard(self, task_id: int):
+        with self._condition:
+            self._drop(task_id)
+            self._notified.pop(task_id, None)
+
+    def schedule_many(self, tasks: Iterable[Task]):
+        with self._condition:
+            for task in tasks:
+                self.schedule(task)
+
+    def discard_many(self, task_ids: Iterable[int]):
+        with self._condition:
+            for task_id in task_ids:
+                self.discard(task_id)
+
+    def rebuild(self, tasks: Iterable[Task]):
+        with self._condition:
+            self._heap.clear()
+            self._entries.clear()
+            self._notified.clear()
+            for task in tasks:
+                if task.status == TaskStatus.PENDING:
+                    self._generation += 1
+                    self._entries[task.id] = (self._generation, task.deadline, task)
+                    self._heap.append((task.deadline, task.id, self._generation))
+            heapq.heapify(self._heap)
+            self._condition.notify()
+
+    def _drop(self, task_id: int):
+        if self._entries.pop(task_id, None) is None:
+            return
+        # Bersihkan heap jika sebagian besar isinya sudah tidak berlaku
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._entries):
+            self._heap = [item for item in self._heap
+                          if self._entries.get(item[1], (None,))[0] == item[2]]
+            heapq.heapify(self._heap)
+
+    def _next_due(self) -> Optional[Task]:
+        with self._condition:
+            while not self._stopped:
+                while self._heap and self._entries.get(self._heap[0][1], (None,))[0] != self._heap[0][2]:
+                    heapq.heappop(self._heap)
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                deadline, task_id, _ = self._heap[0]
+                delay = (deadline - datetime.now()).total_seconds()
+                if delay > 0:
+                    self._condition.wait(min(delay, threading.TIMEOUT_MAX))
+                    continue
+                heapq.heappop(self._heap)
+                _, _, task = self._entries.pop(task_id)
+                self._notified[task_id] = deadline
+                return task
+            return None
+
+    def _run(self):
+        while True:
+            task = self._next_due()
+            if task is None:
+                return
+            self.callback(task)
+
+    def start(self):
+        with self._condition:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+TABLE_HEADERS = ["ID", "Status", "Judul", "Deskripsi", "Prioritas", "Deadline",
+                 "Status Deadline", "Sisa Waktu", "Selesai Pada"]
+# Lebar tetap tiap kolom untuk tabel streaming, dalam sel terminal
+TABLE_WIDTHS = [6, 6, 25, 33, 9, 16, 18, 17, 16]
+
+def _running_widths(text: str) -> Iterator[int]:
+    """Lebar awalan teks setelah tiap karakter (tidak pernah turun)."""
+    width = 0
+    previous = 0
+    for char in text:
+        if char == '\ufe0f':
+            # Variation selector: karakter sebelumnya ditampilkan sebagai emoji
+            width += 2 - previous
+            previous = 2
+        elif not (unicodedata.combining(char) or char in '\u200b\u200d\ufe0e'):
+            previous = 2 if unicodedata.east_asian_width(char) in 'WF' else 1
+            width += previous
+        yield width
+
+def display_width(text: str) -> int:
+    """Lebar teks di terminal: karakter lebar (emoji, CJK) memakan dua sel."""
+    width = 0
+    for width in _running_widths(text):
+        pass
+    return width
+
+def fit_cell(value, width: int, align_right: bool = False) -> str:
+    """Potong (dengan "...") atau isi spasi agar teks tepat selebar ``width``."""
+    text = str(value).replace("\n", " ")
+    # Satu kali jalan: ingat titik potong untuk "...", berhenti begitu teks terbukti terlalu lebar
+    cut = None
+    used = 0
+    for index, used in enumerate(_running_widths(text)):
+        if cut is None and used > width - 3:
+            cut = index
+        if used > width:
+            text = text[:cut] + "..."
+            used = display_width(text)
+            break
+    padding = " " * (width - used)
+    return padding + text if align_right else text + padding
+
+class RenderCache:
+    """Cache hasil format tampilan per tugas.
+
+    Entri berlaku selama versi tugas (``TaskManager.task_version``) dan
+    menitnya sama. Baris yang tidak bergantung pada waktu (tugas selesai)
+    disimpan tanpa menit sehingga berlaku sampai tugasnya diubah. Jumlah
+    entri dibatasi; entri tertua dibuang lebih dulu.
+    """
+
+    def __init__(self, max_entries: int = 50000):
+        self.max_entries = max_entries
+        self._entries: Dict[int, Tuple[int, Optional[datetime], object]] = {}
+
+    @staticmethod
+    def minute(now: Optional[datetime] = None) -> datetime:
+        return (now or datetime.now()).replace(second=0, microsecond=0)
+
+    def get(self, task_id: int, version: int, minute: datetime):
+        entry = self._entries.get(task_id)
+        if entry is not None and entry[0] == version and (entry[1] is None or entry[1] == minute):
+            return entry[2]
+        return None
+
+    def put(self, task_id: int, version: int, minute: Optional[datetime], value):
+        if task_id not in self._entries and len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[task_id] = (version, minute, value)
+
+    def clear(self):
+        self._entries.clear()
+
+class ReadWriteLock:
+    """Kunci baca/tulis: banyak pembaca sekaligus atau satu penulis.
+
+    Penulis yang menunggu didahulukan agar tidak kelaparan. Kunci bersifat
+    reentrant: penulis boleh membaca atau menulis lagi, pembaca boleh membaca
+    lagi, tetapi pembaca tidak boleh naik menjadi penulis.
+    """
+
     def __init__(self):
-        self.tasks: List[Task] = []
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._waiting_writers = 0
+        self._writer: Optional[int] = None
+        self._writer_depth = 0
+        self._local = threading.local()
+
+    @contextmanager
+    def read(self):
+        me = threading.get_ident()
+        depth = getattr(self._local, 'depth', 0)
+        if self._writer == me or depth:
+            self._local.depth = depth + 1
+            try:
+                yield
+            finally:
+                self._local.depth = depth
+            return
+        with self._condition:
+            while self._writer is not None or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        self._local.depth = 1
+        try:
+            yield
+        finally:
+            self._local.depth = 0
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self):
+        me = threading.get_ident()
+        if self._writer == me:
+            self._writer_depth += 1
+            try:
+                yield
+            finally:
+                self._writer_depth -= 1
+            return
+        if getattr(self._local, 'depth', 0):
+            raise RuntimeError("Kunci baca tidak dapat dinaikkan menjadi kunci tulis")
+        with self._condition:
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._writer_depth = 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = None
+                self._writer_depth = 0
+                self._condition.notify_all()
+
+def _writes(method):
+    @wraps(method)
+    def locked(self, *args, **kwargs):
+        with self._lock.write():
+            # Method tulis bersarang (create -> add) hanya menaikkan versi sekali,
+            # sehingga versi event sama dengan versi papan setelah operasi. Versi
+            # hanya naik jika ada event: operasi tanpa perubahan tidak mengubah ETag
+            self._write_depth += 1
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._write_depth -= 1
+                if not self._write_depth and self._changed:
+                    self._changed = False
+                    self.version += 1
+    return locked
+
+def _reads(method):
+    @wraps(method)
+    def locked(self, *args, **kwargs):
+        with self._lock.read():
+            return method(self, *args, **kwargs)
+    return locked
+
+class TaskManager:
+    """Pengelola papan tugas beserta statistik, indeks pencarian, dan jadwal deadline.
+
+    Model konkurensi: semua perubahan (add, update, remove, ``*_many``,
+    memuat atau membuka papan) berjalan di bawah kunci tulis ``_lock`` dan
+    menaikkan ``version``. Pembacaan (get, ids, search, stats, menyimpan ke
+    file) memakai kunci baca sehingga dapat berjalan bersamaan dan selalu
+    melihat keadaan yang utuh. Thread latar yang perlu mengiterasi semua
+    tugas sebaiknya memakai ``snapshot()``: salinan copy-on-write yang hanya
+    dibuat ulang setelah ada perubahan dan dapat dibaca tanpa kunci.
+    ``replace_tasks`` membangun store dan indeks baru di luar kunci, lalu
+    menukarnya sekaligus, sehingga pembaca tidak tertahan selama file dimuat.
+    Objek dari ``get`` adalah tugas di dalam store; ubahlah hanya lewat
+    method TaskManager.
+
+    Setiap perubahan menghasilkan ``TaskEvent`` yang diteruskan lewat satu
+    jalur (``_publish``) ke statistik, indeks, jadwal deadline, journal,
+    dan pelanggan dari ``subscribe``. Konsumen yang melakukan polling dapat
+    memakai ``changes_since(version)``.
+    """
+
+    def __init__(self, overdue_callback: Optional[Callable[[Task], None]] = None,
+                 store: Optional[TaskStore] = None):
+        # store dapat diganti, misalnya dengan taskTable.TaskTable untuk papan besar
+        self.tasks = store if store is not None else TaskStore()
+        self._store_type = type(self.tasks)
+        # Store yang mengindeks sendiri (SQLite) menjawab statistik dan pencarian
+        self._store_indexed = getattr(self.tasks, 'indexed', False)
+        self._derived_stale = False
         self.task_id_counter = 1
-        self.stop_thread = False
-        self.deadline_check_thread = None
+        self.statistics = TaskStatistics()
+        self.search_index = SearchIndex()
+        self.sorted_index = SortedTaskIndex()
+        self.journal = None
+        self.version = 0
+        self._write_depth = 0
+        self._changed = False  # Ada event di dalam method @_writes yang sedang berjalan
+        self._task_versions: Dict[int, int] = {}
+        self._base_task_version = 0
+        self._table_cache = RenderCache()
+        self._lock = ReadWriteLock()
+        self._snapshot: Optional[Tuple[int, Tuple[Task, ...]]] = None
+        self._events: Deque[TaskEvent] = deque()
+        self._events_floor = 0  # Versi event terbaru yang sudah dibuang dari riwayat
+        self._subscribers: List[Callable[[List[TaskEvent]], None]] = []
+        self.overdue_callback = overdue_callback or self._print_overdue
+        self.deadline_scheduler = DeadlineScheduler(self._dispatch_overdue)
 
     @staticmethod
     def clear_screen():
         os.system('cls' if os.name == 'nt' else 'clear')
 
     @staticmethod
-    def print_colored(text: str, color: str = Fore.WHITE):
-        print(f"{color}{text}{Style.RESET_ALL}")
+    def print_colored(text: str, color: Optional[str] = None):
+        print(f"{color or Fore.WHITE}{text}{Style.RESET_ALL}")
 
-    def get_time_remaining(self, deadline: str) -> str:
-        now = datetime.now()
-        deadline_date = datetime.strptime(deadline, "%Y-%m-%d %H:%M")
-        if deadline_date < now:
+    def get_time_remaining(self, deadline: datetime, now: Optional[datetime] = None) -> str:
+        now = now or datetime.now()
+        if deadline < now:
             return "Terlambat"
         
-        delta = deadline_date - now
+        delta = deadline - now
         days = delta.days
         hours = delta.seconds // 3600
         minutes = (delta.seconds % 3600) // 60
@@ -79,6 +924,498 @@ class TaskManager:
             return f"{hours} jam {minutes} menit"
         return f"{minutes} menit"
 
+    @_reads
+    def get(self, task_id: int) -> Optional[Task]:
+        return self.tasks.get(task_id)
+
+    @_reads
+    def ids(self) -> List[int]:
+        return self.tasks.ids()
+
+    def snapshot(self) -> Tuple[Task, ...]:
+        """Salinan semua tugas pada versi saat ini, aman dibaca dari thread mana pun."""
+        cached = self._snapshot
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        with self._lock.read():
+            version = self.version
+            tasks = tuple(task.copy() for task in self.tasks)
+        self._snapshot = (version, tasks)
+        return tasks
+
+    @timed
+    @_writes
+    def add(self, task: Task) -> Task:
+        task.validate()
+        self._ensure_derived()
+        task = self.tasks.add(task)
+        self.task_id_counter = max(self.task_id_counter, task.id + 1)
+        self._publish([self._event(EventKind.TASK_ADDED, task.copy())])
+        return task
+
+    @_writes
+    def create(self, title: str, description: str, priority: Priority, deadline: datetime) -> Task:
+        validate_task_fields({'title': title, 'description': description, 'priority': priority,
+                              'deadline': deadline})
+        task = Task(
+            id=self.task_id_counter,
+            title=title,
+            description=description,
+            priority=priority,
+            status=TaskStatus.PENDING,
+            deadline=deadline.replace(second=0, microsecond=0),
+            created_at=datetime.now().replace(second=0, microsecond=0)
+        )
+        return self.add(task)
+
+    @timed
+    @_writes
+    def remove(self, task_id: int) -> Optional[Task]:
+        self._ensure_derived()
+        task = self.tasks.remove(task_id)
+        if task is not None:
+            self._publish([self._event(EventKind.TASK_DELETED, previous=task)])
+        return task
+
+    @timed
+    @_writes
+    def update(self, task_id: int, **fields) -> Optional[Task]:
+        self._ensure_derived()
+        task = self.tasks.get(task_id)
+        if task is None:
+            return None
+        validate_task_fields(fields)
+        previous = task.copy()
+        task = self.tasks.update(task_id, **fields)
+        self._publish([self._update_event(previous, task)])
+        return task
+
+    @_writes
+    def complete(self, task_id: int) -> Optional[Task]:
+        """Tandai selesai; tugas yang sudah selesai dikembalikan apa adanya tanpa event."""
+        task = self.tasks.get(task_id)
+        if task is None or task.status == TaskStatus.COMPLETED:
+            return task
+        return self.update(
+            task_id,
+            status=TaskStatus.COMPLETED,
+            completed_at=datetime.now().replace(second=0, microsecond=0)
+        )
+
+    def _select(self, selector: Union[Iterable[int], Callable[[Task], bool]]) -> List[int]:
+        if callable(selector):
+            return [task.id for task in self.tasks if selector(task)]
+        return list(dict.fromkeys(selector))
+
+    def _batch(self):
+        # Store persisten menjalankan seluruh perubahan massal dalam satu transaksi
+        transaction = getattr(self.tasks, 'transaction', None)
+        return transaction() if transaction is not None else nullcontext()
+
+    @timed
+    @_writes
+    def add_many(self, tasks: Iterable[Task]) -> List[Task]:
+        """Tambahkan banyak tugas dengan satu pembaruan statistik, indeks, dan journal."""
+        self._ensure_derived()
+        tasks = list(tasks)
+        seen = set()
+        for task in tasks:
+            task.validate()
+            if task.id in seen or task.id in self.tasks:
+                raise KeyError(f"Tugas dengan ID {task.id} sudah ada")
+            seen.add(task.id)
+        with self._batch():
+            added = [self.tasks.add(task) for task in tasks]
+        if added:
+            self.task_id_counter = max(self.task_id_counter, max(seen) + 1)
+        self._publish([self._event(EventKind.TASK_ADDED, task.copy()) for task in added])
+        return added
+
+    @timed
+    @_writes
+    def update_many(self, selector: Union[Iterable[int], Callable[[Task], bool]], **fields) -> List[Task]:
+        """Ubah field yang sama pada banyak tugas sekaligus.
+
+        ``selector`` berupa daftar id (id yang tidak ada dilewati) atau
+        predikat ``Task -> bool``. Kembalikan tugas yang diubah.
+        """
+        self._ensure_derived()
+        for name in fields:
+            if name == 'id' or name not in Task.__slots__:
+                raise AttributeError(f"Field '{name}' tidak dapat diubah")
+        validate_task_fields(fields)
+        events = []
+        updated = []
+        with self._batch():
+            for task_id in self._select(selector):
+                task = self.tasks.get(task_id)
+                if task is None:
+                    continue
+                previous = task.copy()
+                task = self.tasks.update(task_id, **fields)
+                updated.append(task)
+                events.append(self._update_event(previous, task))
+        self._publish(events)
+        return updated
+
+    @_writes
+    def complete_many(self, selector: Union[Iterable[int], Callable[[Task], bool]]) -> List[Task]:
+        """Tandai banyak tugas selesai; kembalikan semua tugas yang ditemukan.
+
+        Seperti ``complete``, tugas yang sudah selesai tidak diubah
+        (``completed_at`` tetap) tetapi tetap ada di hasil.
+        """
+        tasks = [task for task in map(self.tasks.get, self._select(selector)) if task is not None]
+        self.update_many(
+            [task.id for task in tasks if task.status != TaskStatus.COMPLETED],
+            status=TaskStatus.COMPLETED,
+            completed_at=datetime.now().replace(second=0, microsecond=0)
+        )
+        # Store yang menyalin tugas (SQLite, snapshot) mengembalikan objek baru setelah update
+        return [task for task in map(self.tasks.get, (task.id for task in tasks)) if task is not None]
+
+    @timed
+    @_writes
+    def delete_many(self, selector: Union[Iterable[int], Callable[[Task], bool]]) -> List[Task]:
+        """Hapus banyak tugas sekaligus; kembalikan tugas yang benar-benar dihapus."""
+        self._ensure_derived()
+        with self._batch():
+            removed = [task for task in map(self.tasks.remove, self._select(selector)) if task is not None]
+        self._publish([self._event(EventKind.TASK_DELETED, previous=task) for task in removed])
+        return removed
+
+    def _event(self, kind: EventKind, task: Optional[Task] = None, previous: Optional[Task] = None) -> TaskEvent:
+        # Dipanggil di dalam method @_writes: versi event adalah versi setelah perubahan ini
+        task_id = (task or previous).id
+        return TaskEvent(kind, self.version + 1, task_id, task, previous)
+
+    def _update_event(self, previous: Task, task: Task) -> TaskEvent:
+        completed = previous.status != TaskStatus.COMPLETED and task.status == TaskStatus.COMPLETED
+        return self._event(EventKind.TASK_COMPLETED if completed else EventKind.TASK_UPDATED,
+                           task.copy(), previous)
+
+    @staticmethod
+    def _apply_to_index(index, discard: List[Task], add: List[Task]):
+        # Versi *_many menyusun ulang struktur internal sekali; untuk satu tugas versi tunggal lebih murah
+        if len(discard) == 1:
+            index.discard(discard[0])
+        elif discard:
+            index.discard_many(discard)
+        if len(add) == 1:
+            index.add(add[0])
+        elif add:
+            index.add_many(add)
+
+    def _publish(self, events: List[TaskEvent]):
+        """Teruskan event perubahan ke semua konsumen, lalu simpan di riwayat.
+
+        Urutannya: versi per tugas, statistik dan indeks (kecuali store yang
+        mengindeks sendiri), jadwal deadline, journal, lalu pelanggan dari
+        ``subscribe``. Dipanggil di bawah kunci tulis.
+        """
+        if not events:
+            return
+        added, removed, before, after = [], [], [], []
+        for event in events:
+            if event.kind is EventKind.TASK_ADDED:
+                added.append(event.task)
+            elif event.kind is EventKind.TASK_DELETED:
+                removed.append(event.previous)
+            else:
+                before.append(event.previous)
+                after.append(event.task)
+        written = added + after
+
+        self._touch(task.id for task in written)
+        for task in removed:
+            self._task_versions.pop(task.id, None)
+
+        if not self._store_indexed:
+            self._apply_to_index(self.statistics, removed + before, written)
+            text_changed = [(old, new) for old, new in zip(before, after)
+                            if old.title != new.title or old.description != new.description]
+            if len(removed) > len(self.tasks) and not written:
+                # Lebih murah mengindeks ulang sisa tugas daripada membongkar sebagian besar indeks
+                self.search_index.rebuild(self.tasks)
+            else:
+                self._apply_to_index(self.search_index, removed + [old for old, _ in text_changed],
+                                     added + [new for _, new in text_changed])
+            order_changed = [(old, new) for old, new in zip(before, after)
+                             if any(getattr(old, name) != getattr(new, name) for name in SortedTaskIndex.FIELDS)]
+            self._apply_to_index(self.sorted_index, removed + [old for old, _ in order_changed],
+                                 added + [new for _, new in order_changed])
+
+        if removed:
+            self.deadline_scheduler.discard_many(task.id for task in removed)
+        if written:
+            self.deadline_scheduler.schedule_many(written)
+
+        if self.journal is not None:
+            if removed:
+                self.journal.record_delete_many(task.id for task in removed)
+            if written:
+                self.journal.record_put_many(written)
+
+        self._record_events(events)
+
+    def _record_events(self, events: List[TaskEvent]):
+        if self._write_depth:
+            self._changed = True
+        self._events.extend(events)
+        while len(self._events) > EVENT_HISTORY:
+            self._events_floor = self._events.popleft().version
+        for callback in list(self._subscribers):
+            try:
+                callback(events)
+            except Exception:
+                # Pelanggan yang gagal tidak boleh membatalkan perubahan yang sudah terjadi
+                traceback.print_exc()
+
+    def subscribe(self, callback: Callable[[List[TaskEvent]], None]) -> Callable[[], None]:
+        """Daftarkan ``callback(events)``; kembalikan fungsi untuk berhenti berlangganan.
+
+        Callback dipanggil sekali per perubahan dengan semua event-nya,
+        di thread yang melakukan perubahan dan di bawah kunci tulis: buat
+        singkat, jangan menunggu thread lain, dan serahkan pekerjaan berat
+        (misalnya ke antrean GUI) ke tempat lain.
+        """
+        with self._lock.write():
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._lock.write():
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return unsubscribe
+
+    @_reads
+    def changes_since(self, version: int) -> Optional[List[TaskEvent]]:
+        """Event dengan versi lebih besar dari ``version``, terlama dulu.
+
+        Kembalikan None jika riwayat (``EVENT_HISTORY`` event terakhir) tidak
+        lagi menjangkau versi itu, atau versi itu lebih baru dari papan ini;
+        konsumen perlu memuat ulang semuanya.
+        BULK_LOADED di dalam hasil juga berarti seluruh isi papan diganti.
+        """
+        if version < self._events_floor or version > self.version:
+            # Versi dari masa depan berasal dari papan/proses lain: konsumen harus sinkron ulang
+            return None
+        events = []
+        for event in reversed(self._events):
+            if event.version <= version:
+                break
+            events.append(event)
+        events.reverse()
+        return events
+
+    @timed
+    def replace_tasks(self, tasks: Iterable[Task]):
+        replace_all = getattr(self.tasks, 'replace_all', None)
+        if replace_all is not None:
+            # Store persisten (SQLite) mengganti isinya sendiri dalam satu transaksi
+            with self._lock.write():
+                self.task_id_counter = replace_all(tasks) + 1
+                self._rebuild_derived()
+                self._after_replace()
+            return
+
+        # Store, statistik, dan indeks baru dibangun tanpa kunci; pembaca tetap
+        # melihat isi lama sampai semuanya ditukar sekaligus
+        store = self._store_type()
+        last_id = 0
+        for task in tasks:
+            store.add(task)
+            last_id = max(last_id, task.id)
+        statistics = TaskStatistics()
+        statistics.rebuild(store)
+        search_index = SearchIndex()
+        search_index.rebuild(store)
+        sorted_index = SortedTaskIndex()
+        sorted_index.rebuild(store)
+        with self._lock.write():
+            self._set_store(store)
+            self.statistics = statistics
+            self.search_index = search_index
+            self.sorted_index = sorted_index
+            self.task_id_counter = last_id + 1
+            self.deadline_scheduler.rebuild(store)
+            self._derived_stale = False
+            self._after_replace()
+
+    def _after_replace(self):
+        if self.journal is not None:
+            self.journal.record_reset(self.tasks)
+        self._reset_task_versions()
+        if self._write_depth:
+            # Dipanggil dari method @_writes (enable_journal): wrapper-nya yang menaikkan versi
+            version = self.version + 1
+        else:
+            self.version += 1
+            version = self.version
+        self._record_events([TaskEvent(EventKind.BULK_LOADED, version)])
+
+    def task_version(self, task_id: int) -> int:
+        """Versi satu tugas: berubah setiap kali tugas itu diubah, tidak pernah dipakai ulang."""
+        return self._task_versions.get(task_id, self._base_task_version)
+
+    def _touch(self, task_ids: Iterable[int]):
+        version = self.version + 1
+        for task_id in task_ids:
+            self._task_versions[task_id] = version
+
+    def _reset_task_versions(self):
+        # Semua tugas di store baru mendapat versi yang belum pernah dipakai
+        self._task_versions.clear()
+        self._base_task_version = self.version + 1
+
+    @timed
+    def _rebuild_derived(self):
+        if not self._store_indexed:
+            self.statistics.rebuild(self.tasks)
+            self.search_index.rebuild(self.tasks)
+            self.sorted_index.rebuild(self.tasks)
+        pending_tasks = getattr(self.tasks, 'pending_tasks', None)
+        self.deadline_scheduler.rebuild(pending_tasks() if pending_tasks else self.tasks)
+        self._derived_stale = False
+
+    def _ensure_derived(self):
+        # Store yang dibuka secara lazy (snapshot biner) baru diindeks saat dibutuhkan
+        if self._derived_stale:
+            with self._lock.write():
+                if self._derived_stale:
+                    self._rebuild_derived()
+
+    def _set_store(self, store):
+        close = getattr(self.tasks, 'close', None)
+        if close is not None and store is not self.tasks:
+            close()
+        self.tasks = store
+        self._store_indexed = getattr(store, 'indexed', False)
+        self._reset_task_versions()
+
+    @timed
+    @_writes
+    def open_snapshot(self, path: str):
+        """Buka snapshot biner dengan mmap; Task dibuat hanya saat diakses.
+
+        Statistik, indeks pencarian, dan jadwal deadline dibangun saat
+        pertama kali dibutuhkan, bukan saat membuka file.
+        """
+        from taskSnapshot import SnapshotStore
+
+        store = SnapshotStore(path)
+        self._set_store(store)
+        self.task_id_counter = store.max_id + 1
+        # Jadwal papan lama harus dibuang sekarang: id yang sama di papan baru adalah tugas lain
+        self.deadline_scheduler.rebuild(())
+        self._derived_stale = True
+        if self.journal is not None:
+            self.journal.record_reset(self.tasks)
+        self._record_events([TaskEvent(EventKind.BULK_LOADED, self.version + 1)])
+
+    @timed
+    @_writes
+    def open_database(self, path: str):
+        """Gunakan database SQLite sebagai store; statistik dan pencarian dijalankan di SQL."""
+        from taskSqlite import SqliteTaskStore
+
+        store = SqliteTaskStore(path)
+        self._set_store(store)
+        self.task_id_counter = store.max_id() + 1
+        self._rebuild_derived()
+        if self.journal is not None:
+            self.journal.record_reset(self.tasks)
+        self._record_events([TaskEvent(EventKind.BULK_LOADED, self.version + 1)])
+
+    @timed
+    @_reads
+    def save_snapshot(self, path: str):
+        from taskSnapshot import write_snapshot
+
+        write_snapshot(path, self.tasks)
+
+    @_writes
+    def enable_journal(self, path: str, **options):
+        """Aktifkan autosave: setiap perubahan dicatat ke journal di samping ``path``.
+
+        Jika ``path`` atau journal-nya sudah ada, isinya dimuat dan
+        menggantikan tugas saat ini; jika belum, tugas saat ini menjadi
+        snapshot awal. ``options`` diteruskan ke ``TaskJournal``.
+        """
+        from taskJournal import TaskJournal
+
+        self.disable_journal()
+        journal = TaskJournal(path, **options)
+        existing = os.path.exists(path) or os.path.exists(journal.journal_path)
+        tasks = journal.open()
+        if existing:
+            self.replace_tasks(tasks)
+            self.journal = journal
+        else:
+            self.journal = journal
+            journal.record_reset(self.tasks)
+
+    @_writes
+    def disable_journal(self):
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+
+    @timed
+    def load_file(self, path: str, progress: Optional[Callable[[int, int], None]] = None):
+        """Muat tugas dari file JSON atau NDJSON (.ndjson/.jsonl) secara streaming."""
+        from taskStream import iter_task_file
+
+        self.replace_tasks(iter_task_file(path, progress))
+
+    @timed
+    @_reads
+    def save_file(self, path: str, progress: Optional[Callable[[int, int], None]] = None):
+        """Simpan tugas; format NDJSON dipakai untuk ekstensi .ndjson/.jsonl."""
+        from taskStream import write_task_file
+
+        write_task_file(path, self.tasks, progress)
+
+    @timed
+    def stats(self) -> StatisticsSnapshot:
+        self._ensure_derived()
+        with self._lock.read():
+            if self._store_indexed:
+                return self.tasks.statistics()
+            return self.statistics.snapshot()
+
+    @timed
+    def search(self, query: str) -> List[Task]:
+        self._ensure_derived()
+        with self._lock.read():
+            if self._store_indexed:
+                return self.tasks.search_tasks(query)
+            return [self.tasks.get(task_id) for task_id in self.search_index.search(query)]
+
+    @timed
+    def query_ids(self, status: Optional[TaskStatus] = None, priority: Optional[Priority] = None,
+                  due_before: Optional[datetime] = None, order_by: str = 'deadline',
+                  limit: Optional[int] = None, offset: int = 0) -> List[int]:
+        """Lihat ``SortedTaskIndex.query_ids``."""
+        self._ensure_derived()
+        with self._lock.read():
+            if self._store_indexed:
+                return [task.id for task in self.tasks.query_tasks(
+                    status, priority, due_before, order_by, limit, offset)]
+            return self.sorted_index.query_ids(status, priority, due_before, order_by, limit, offset)
+
+    @timed
+    def query(self, status: Optional[TaskStatus] = None, priority: Optional[Priority] = None,
+              due_before: Optional[datetime] = None, order_by: str = 'deadline',
+              limit: Optional[int] = None, offset: int = 0) -> List[Task]:
+        """Saring dan urutkan tugas lewat indeks terurut dalam O(log n + k)."""
+        self._ensure_derived()
+        with self._lock.read():
+            if self._store_indexed:
+                return self.tasks.query_tasks(status, priority, due_before, order_by, limit, offset)
+            ids = self.sorted_index.query_ids(status, priority, due_before, order_by, limit, offset)
+            return [self.tasks.get(task_id) for task_id in ids]
+
     def add_task(self):
         while True:
             title = input("Masukkan nama tugas: ").strip()
@@ -90,20 +1427,9 @@ class TaskManager:
         priority = self._get_priority()
         deadline = self._get_deadline()
         
-        task = Task(
-            id=self.task_id_counter,
-            title=title,
-            description=description,
-            priority=priority,
-            status=TaskStatus.PENDING,
-            deadline=deadline.strftime("%Y-%m-%d %H:%M"),
-            created_at=datetime.now().strftime("%Y-%m-%d %H:%M")
-        )
-        
-        self.tasks.append(task)
+        self.create(title, description, priority, deadline)
         self.print_colored(f"\nTugas '{title}' berhasil ditambahkan!", Fore.GREEN)
-        print(f"Deadline: {deadline.strftime('%Y-%m-%d %H:%M')}")
-        self.task_id_counter += 1
+        print(f"Deadline: {format_datetime(deadline)}")
 
     def _get_priority(self) -> Priority:
         print("\nPilih prioritas tugas:")
@@ -167,7 +1493,7 @@ class TaskManager:
         while True:
             try:
                 deadline_str = input("Masukkan deadline (format: YYYY-MM-DD HH:MM): ").strip()
-                return datetime.strptime(deadline_str, "%Y-%m-%d %H:%M")
+                return datetime.strptime(deadline_str, DATE_FORMAT)
             except ValueError:
                 self.print_colored("Format deadline tidak valid! Gunakan format: YYYY-MM-DD HH:MM", Fore.RED)
 
@@ -191,76 +1517,190 @@ class TaskManager:
             except ValueError:
                 self.print_colored("Masukkan angka yang valid!", Fore.RED)
 
+    def _format_task_row(self, task: Task, now: datetime) -> list:
+        status = "✔️" if task.status == TaskStatus.COMPLETED else "❌"
+        deadline = task.deadline
+        
+        if task.status != TaskStatus.COMPLETED:
+            if deadline < now:
+                deadline_status = "🔴 Terlambat"
+            elif (deadline - now) <= timedelta(days=1):
+                deadline_status = "🟡 Segera"
+            else:
+                deadline_status = "🟢 Masih ada waktu"
+            time_remaining = self.get_time_remaining(deadline, now)
+        else:
+            deadline_status = "✔️ Selesai"
+            time_remaining = "-"
+
+        description = task.description if task.description else "-"
+        completed_at = format_datetime(task.completed_at) or "-"
+
+        return [
+            task.id,
+            status,
+            task.title,
+            description[:30] + "..." if len(description) > 30 else description,
+            task.priority.icon,
+            format_datetime(deadline),
+            deadline_status,
+            time_remaining,
+            completed_at
+        ]
+
+    def _task_row(self, task: Task, now: datetime, minute: datetime) -> list:
+        version = self.task_version(task.id)
+        row = self._table_cache.get(task.id, version, minute)
+        if row is None:
+            row = self._format_task_row(task, now)
+            # Baris tugas selesai tidak bergantung pada waktu sekarang
+            self._table_cache.put(task.id, version,
+                                  None if task.status == TaskStatus.COMPLETED else minute, row)
+        return row
+
+    @timed
     def format_tasks_table(self, task_list: List[Task]) -> str:
         if not task_list:
             return "Tidak ada tugas!"
+        # tabulate lambat diimpor dan hanya dipakai di sini; print_tasks_table tidak memerlukannya
+        from tabulate import tabulate
         
-        table_data = []
         now = datetime.now()
+        minute = RenderCache.minute(now)
+        table_data = [self._task_row(task, now, minute) for task in task_list]
+        # Hanya kolom ID yang berisi angka; kolom teks tidak perlu dicoba diparse
+        return tabulate(table_data, headers=TABLE_HEADERS, tablefmt="grid",
+                        disable_numparse=list(range(1, len(TABLE_HEADERS))))
+
+    def iter_table_lines(self, tasks: Iterable[Task]) -> Iterator[str]:
+        """Baris-baris tabel ber-grid dengan lebar kolom tetap (``TABLE_WIDTHS``).
+
+        Berbeda dengan ``format_tasks_table``, lebar kolom tidak bergantung
+        pada isi, sehingga setiap baris bisa dicetak begitu tugasnya dibaca.
+        """
+        border = "+" + "+".join("-" * (width + 2) for width in TABLE_WIDTHS) + "+"
         
-        for task in task_list:
-            status = "✔️" if task.status == TaskStatus.COMPLETED else "❌"
-            deadline = datetime.strptime(task.deadline, "%Y-%m-%d %H:%M")
-            
-            if task.status != TaskStatus.COMPLETED:
-                if deadline < now:
-                    deadline_status = "🔴 Terlambat"
-                elif (deadline - now) <= timedelta(days=1):
-                    deadline_status = "🟡 Segera"
-                else:
-                    deadline_status = "🟢 Masih ada waktu"
-                time_remaining = self.get_time_remaining(task.deadline)
-            else:
-                deadline_status = "✔️ Selesai"
-                time_remaining = "-"
-
-            description = task.description if task.description else "-"
-            completed_at = task.completed_at if task.completed_at else "-"
-
-            table_data.append([
-                task.id,
-                status,
-                task.title,
-                description[:30] + "..." if len(description) > 30 else description,
-                task.priority.icon,
-                task.deadline,
-                deadline_status,
-                time_remaining,
-                completed_at
-            ])
+        def line(cells: list) -> str:
+            return "| " + " | ".join(
+                fit_cell(cell, width, align_right=isinstance(cell, int))
+                for cell, width in zip(cells, TABLE_WIDTHS)) + " |"
         
-        headers = ["ID", "Status", "Judul", "Deskripsi", "Prioritas", "Deadline", 
-                  "Status Deadline", "Sisa Waktu", "Selesai Pada"]
-        return tabulate(table_data, headers=headers, tablefmt="grid")
+        yield border
+        yield line(TABLE_HEADERS)
+        yield border.replace("-", "=")
+        now = datetime.now()
+        minute = RenderCache.minute(now)
+        for task in tasks:
+            yield line(self._task_row(task, now, minute))
+            yield border
+
+    @timed
+    def print_tasks_table(self, tasks: Iterable[Task], chunk_size: int = 200):
+        """Cetak tabel secara streaming per ``chunk_size`` tugas; memori tetap kecil."""
+        lines = []
+        for line in self.iter_table_lines(tasks):
+            lines.append(line)
+            if len(lines) >= 2 * chunk_size:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+                lines.clear()
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+
+    def browse_tasks(self, task_ids: List[int], page_size: int = 20):
+        """Tampilkan tugas per halaman sampai pengguna memilih selesai.
+
+        Perintah ``s KOLOM`` mengurutkan ulang daftar lewat indeks terurut
+        (deadline, created_at, id, priority, status; awali ``-`` untuk menurun).
+        """
+        page = 0
+        while True:
+            pages = max(1, -(-len(task_ids) // page_size))
+            page = max(0, min(page, pages - 1))
+            self.clear_screen()
+            if task_ids:
+                start = page * page_size
+                self.print_tasks_table(task for task in map(self.get, task_ids[start:start + page_size])
+                                       if task is not None)
+            else:
+                print("Tidak ada tugas!")
+            print(f"\nHalaman {page + 1}/{pages} ({len(task_ids)} tugas, {page_size} per halaman)")
+            command = input("[Enter/n] berikutnya  [p] sebelumnya  [h N] halaman  [g ID] cari ID  "
+                            "[u N] ukuran halaman  [s KOLOM] urutkan  [a] tampilkan semua  [q] selesai: ").strip().lower()
+            name, _, argument = command.partition(" ")
+            try:
+                if name in ("", "n"):
+                    if page == pages - 1 and name == "":
+                        return
+                    page += 1
+                elif name == "p":
+                    page -= 1
+                elif name == "h":
+                    page = int(argument) - 1
+                elif name == "g":
+                    page = task_ids.index(int(argument)) // page_size
+                elif name == "u":
+                    first = page * page_size
+                    page_size = max(1, int(argument))
+                    page = first // page_size
+                elif name == "s":
+                    shown = set(task_ids)
+                    task_ids = [task_id for task_id in self.query_ids(order_by=argument) if task_id in shown]
+                    page = 0
+                elif name == "a":
+                    self.clear_screen()
+                    self.print_tasks_table(task for task in map(self.get, task_ids) if task is not None)
+                    input("\nTekan Enter untuk kembali ke halaman...")
+                elif name == "q":
+                    return
+                else:
+                    raise ValueError(command)
+            except ValueError:
+                # int() gagal atau ID tidak ada di daftar
+                self.print_colored("Perintah tidak valid!", Fore.RED)
+                input("Tekan Enter untuk melanjutkan...")
 
     def view_tasks(self):
-        self.clear_screen()
-        print(self.format_tasks_table(self.tasks))
+        self.browse_tasks(self.ids())
+
+    @staticmethod
+    def _parse_ids(text: str) -> List[int]:
+        """Ubah masukan seperti ``3``, ``1, 4 7`` atau ``10-20`` menjadi daftar id."""
+        ids = []
+        for part in re.split(r"[,\s]+", text.strip()):
+            if not part:
+                continue
+            start, _, end = part.partition("-")
+            if end:
+                ids.extend(range(int(start), int(end) + 1))
+            else:
+                ids.append(int(start))
+        if not ids:
+            raise ValueError("ID kosong")
+        return list(dict.fromkeys(ids))
+
+    def _report_bulk(self, tasks: List[Task], requested: int, action: str):
+        if len(tasks) == 1 and requested == 1:
+            self.print_colored(f"Tugas '{tasks[0].title}' berhasil {action}!", Fore.GREEN)
+        elif tasks:
+            self.print_colored(f"{len(tasks)} tugas berhasil {action}!", Fore.GREEN)
+        if len(tasks) < requested:
+            self.print_colored(f"{requested - len(tasks)} ID tugas tidak ditemukan!", Fore.RED)
 
     def mark_task_completed(self):
         self.view_tasks()
         try:
-            task_id = int(input("\nMasukkan ID tugas yang ingin ditandai selesai: "))
-            task = next((t for t in self.tasks if t.id == task_id), None)
-            if task:
-                task.status = TaskStatus.COMPLETED
-                task.completed_at = datetime.now().strftime("%Y-%m-%d %H:%M")
-                self.print_colored(f"Tugas '{task.title}' berhasil ditandai selesai!", Fore.GREEN)
-            else:
-                self.print_colored("ID tugas tidak ditemukan!", Fore.RED)
+            task_ids = self._parse_ids(input("\nMasukkan ID tugas yang ingin ditandai selesai (contoh: 3 atau 1,4 atau 10-20): "))
+            self._report_bulk(self.complete_many(task_ids), len(task_ids), "ditandai selesai")
         except ValueError:
             self.print_colored("ID harus berupa angka!", Fore.RED)
 
     def delete_task(self):
         self.view_tasks()
         try:
-            task_id = int(input("\nMasukkan ID tugas yang ingin dihapus: "))
-            task = next((t for t in self.tasks if t.id == task_id), None)
-            if task:
-                self.tasks.remove(task)
-                self.print_colored(f"Tugas '{task.title}' berhasil dihapus!", Fore.GREEN)
-            else:
-                self.print_colored("ID tugas tidak ditemukan!", Fore.RED)
+            task_ids = self._parse_ids(input("\nMasukkan ID tugas yang ingin dihapus (contoh: 3 atau 1,4 atau 10-20): "))
+            self._report_bulk(self.delete_many(task_ids), len(task_ids), "dihapus")
         except ValueError:
             self.print_colored("ID harus berupa angka!", Fore.RED)
 
@@ -268,24 +1708,26 @@ class TaskManager:
         self.view_tasks()
         try:
             task_id = int(input("\nMasukkan ID tugas yang ingin diedit: "))
-            task = next((t for t in self.tasks if t.id == task_id), None)
+            task = self.get(task_id)
             if task:
                 print("\nBiarkan kosong jika tidak ingin mengubah")
+                changes = {}
                 
                 title = input(f"Judul baru (sekarang: {task.title}): ").strip()
                 if title:
-                    task.title = title
+                    changes['title'] = title
                 
                 description = input(f"Deskripsi baru (sekarang: {task.description}): ").strip()
                 if description:
-                    task.description = description
+                    changes['description'] = description
                 
                 if input("Ubah prioritas? (y/n): ").lower() == 'y':
-                    task.priority = self._get_priority()
+                    changes['priority'] = self._get_priority()
                 
                 if input("Ubah deadline? (y/n): ").lower() == 'y':
-                    task.deadline = self._get_deadline().strftime("%Y-%m-%d %H:%M")
+                    changes['deadline'] = self._get_deadline().replace(second=0, microsecond=0)
                 
+                task = self.update(task_id, **changes)
                 self.print_colored(f"Tugas '{task.title}' berhasil diperbarui!", Fore.GREEN)
             else:
                 self.print_colored("ID tugas tidak ditemukan!", Fore.RED)
@@ -293,32 +1735,37 @@ class TaskManager:
             self.print_colored("ID harus berupa angka!", Fore.RED)
 
     def search_task(self):
-        keyword = input("Masukkan kata kunci pencarian: ").lower()
-        found_tasks = [
-            task for task in self.tasks
-            if keyword in task.title.lower() or 
-               keyword in task.description.lower()
-        ]
-        self.clear_screen()
-        print(self.format_tasks_table(found_tasks))
+        keyword = input("Masukkan kata kunci pencarian: ")
+        self.browse_tasks([task.id for task in self.search(keyword)])
+
+    def enable_autosave(self):
+        filename = input("Masukkan nama file autosave (contoh: tasks.json): ")
+        try:
+            self.enable_journal(filename)
+            self.print_colored(f"Autosave aktif! Setiap perubahan dicatat ke '{filename}'.", Fore.GREEN)
+        except json.JSONDecodeError:
+            self.print_colored("Format file tidak valid!", Fore.RED)
+        except Exception as e:
+            self.print_colored(f"Gagal mengaktifkan autosave: {str(e)}", Fore.RED)
 
     def save_tasks(self):
         filename = input("Masukkan nama file untuk menyimpan tugas (contoh: tasks.json): ")
         try:
-            with open(filename, 'w') as file:
-                json.dump([task.to_dict() for task in self.tasks], file, indent=4)
+            self.save_file(filename)
             self.print_colored(f"Tugas berhasil disimpan ke file '{filename}'!", Fore.GREEN)
         except Exception as e:
             self.print_colored(f"Gagal menyimpan file: {str(e)}", Fore.RED)
 
+    @staticmethod
+    def _print_progress(done: int, total: int):
+        percent = done * 100 // total if total else 100
+        print(f"\rMemuat... {percent}%", end="", flush=True)
+
     def load_tasks(self):
         filename = input("Masukkan nama file untuk memuat tugas (contoh: tasks.json): ")
         try:
-            with open(filename, 'r') as file:
-                data = json.load(file)
-                self.tasks = [Task.from_dict(task_data) for task_data in data]
-                if self.tasks:
-                    self.task_id_counter = max(task.id for task in self.tasks) + 1
+            self.load_file(filename, self._print_progress)
+            print()
             self.print_colored(f"Tugas berhasil dimuat dari file '{filename}'!", Fore.GREEN)
         except FileNotFoundError:
             self.print_colored(f"File '{filename}' tidak ditemukan!", Fore.RED)
@@ -329,51 +1776,79 @@ class TaskManager:
 
     def show_statistics(self):
         self.clear_screen()
-        total_tasks = len(self.tasks)
-        if total_tasks == 0:
+        stats = self.stats()
+        if stats.total == 0:
             self.print_colored("Belum ada tugas yang ditambahkan!", Fore.YELLOW)
             return
-
-        completed_tasks = sum(1 for task in self.tasks if task.status == TaskStatus.COMPLETED)
-        pending_tasks = total_tasks - completed_tasks
-        now = datetime.now()
-        overdue_tasks = sum(1 for task in self.tasks 
-                           if task.status == TaskStatus.PENDING 
-                           and datetime.strptime(task.deadline, "%Y-%m-%d %H:%M") < now)
-        
-        priority_counts = {priority: sum(1 for task in self.tasks if task.priority == priority)
-                         for priority in Priority}
         
         self.print_colored(f"\nStatistik Tugas:", Fore.CYAN)
-        print(f"Total tugas         : {total_tasks}")
-        print(f"Tugas selesai       : {completed_tasks}")
-        print(f"Tugas pending       : {pending_tasks}")
-        print(f"Tugas terlambat     : {overdue_tasks}")
+        print(f"Total tugas         : {stats.total}")
+        print(f"Tugas selesai       : {stats.completed}")
+        print(f"Tugas pending       : {stats.pending}")
+        print(f"Tugas terlambat     : {stats.overdue}")
         
         print("\nJumlah tugas berdasarkan prioritas:")
-        for priority, count in priority_counts.items():
+        for priority, count in stats.by_priority.items():
             print(f"{priority.icon} {priority.label}: {count}")
 
-    def deadline_check_worker(self):
-        while not self.stop_thread:
-            now = datetime.now()
-            for task in self.tasks:
-                if (
-                    task.status == TaskStatus.PENDING and
-                    datetime.strptime(task.deadline, "%Y-%m-%d %H:%M") < now
-                ):
-                    self.print_colored(f"\n⚠️ Tugas '{task.title}' telah melewati deadline!", Fore.RED)
-            threading.Event().wait(60)  # Tunggu 60 detik sebelum mengecek lagi
+    def show_profile(self):
+        """Ringkasan latensi per operasi, serta perintah cProfile dan tracemalloc."""
+        while True:
+            self.clear_screen()
+            state = "aktif" if instrumentation.enabled else "nonaktif"
+            self.print_colored(f"\nProfiling ({state}):", Fore.CYAN)
+            print(instrumentation.format_summary())
+            profile_action = "hentikan" if instrumentation.profiling else "mulai"
+            command = input(f"\n[e] aktif/nonaktif  [r] reset  [p] {profile_action} cProfile  "
+                            "[m] snapshot memori  [Enter] kembali: ").strip().lower()
+            try:
+                if command == "":
+                    return
+                elif command == "e":
+                    if instrumentation.enabled:
+                        instrumentation.disable()
+                    else:
+                        instrumentation.enable()
+                    continue
+                elif command == "r":
+                    instrumentation.reset()
+                    continue
+                elif command == "p" and not instrumentation.profiling:
+                    instrumentation.start_profile()
+                    self.print_colored("cProfile mulai merekam.", Fore.GREEN)
+                elif command == "p":
+                    filename = input("Simpan cProfile ke file (contoh: profile.prof): ")
+                    print(instrumentation.stop_profile(filename))
+                elif command == "m":
+                    filename = input("Simpan snapshot memori ke file (contoh: memory.snap): ")
+                    print(instrumentation.dump_memory(filename))
+                else:
+                    self.print_colored("Pilihan tidak valid!", Fore.RED)
+            except OSError as e:
+                self.print_colored(f"Gagal menyimpan file: {str(e)}", Fore.RED)
+            input("\nTekan Enter untuk melanjutkan...")
+
+    def _print_overdue(self, task: Task):
+        self.print_colored(f"\n⚠️ Tugas '{task.title}' telah melewati deadline!", Fore.RED)
+
+    def _dispatch_overdue(self, task: Task):
+        # Dipanggil dari thread scheduler: kirim salinan yang konsisten, dan lewati
+        # tugas yang sudah selesai atau dihapus sejak dijadwalkan
+        with self._lock.read():
+            current = self.tasks.get(task.id)
+            current = current.copy() if current is not None else None
+        if current is not None and current.status == TaskStatus.PENDING:
+            self.overdue_callback(current)
+
+    def set_overdue_callback(self, callback: Callable[[Task], None]):
+        self.overdue_callback = callback
 
     def start_deadline_check(self):
-        if self.deadline_check_thread is None or not self.deadline_check_thread.is_alive():
-            self.deadline_check_thread = threading.Thread(target=self.deadline_check_worker, daemon=True)
-            self.deadline_check_thread.start()
+        self._ensure_derived()
+        self.deadline_scheduler.start()
 
     def stop_deadline_check(self):
-        self.stop_thread = True
-        if self.deadline_check_thread is not None:
-            self.deadline_check_thread.join()
+        self.deadline_scheduler.stop()
 
     def run(self):
         self.start_deadline_check()
@@ -389,6 +1864,8 @@ class TaskManager:
             print("7. Simpan Tugas ke File")
             print("8. Muat Tugas dari File")
             print("9. Lihat Statistik")
+            print("10. Aktifkan Autosave")
+            print("11. Profiling")
             print("0. Keluar")
             
             try:
@@ -397,7 +1874,6 @@ class TaskManager:
                     self.add_task()
                 elif choice == 2:
                     self.view_tasks()
-                    input("\nTekan Enter untuk kembali ke menu...")
                 elif choice == 3:
                     self.mark_task_completed()
                     input("\nTekan Enter untuk kembali ke menu...")
@@ -409,7 +1885,6 @@ class TaskManager:
                     input("\nTekan Enter untuk kembali ke menu...")
                 elif choice == 6:
                     self.search_task()
-                    input("\nTekan Enter untuk kembali ke menu...")
                 elif choice == 7:
                     self.save_tasks()
                     input("\nTekan Enter untuk kembali ke menu...")
@@ -419,8 +1894,14 @@ class TaskManager:
                 elif choice == 9:
                     self.show_statistics()
                     input("\nTekan Enter untuk kembali ke menu...")
+                elif choice == 10:
+                    self.enable_autosave()
+                    input("\nTekan Enter untuk kembali ke menu...")
+                elif choice == 11:
+                    self.show_profile()
                 elif choice == 0:
                     self.stop_deadline_check()
+                    self.disable_journal()
                     self.print_colored("Terima kasih telah menggunakan Task Manager!", Fore.CYAN)
                     break
                 else:
@@ -430,6 +1911,11 @@ class TaskManager:
             except Exception as e:
                 self.print_colored(f"Terjadi kesalahan: {str(e)}", Fore.RED)
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Mode tanpa prompt, contoh: python taskManager.py -f tasks.json add "Tugas" --deadline "2025-01-01 09:00"
+        from taskCli import main
+        sys.exit(main())
+
     try:
         print("Pilih mode aplikasi:")
         print("1. Command Line Interface (CLI)")
@@ -442,14 +1928,15 @@ if __name__ == "__main__":
         if choice == "1":
             task_manager.run()
         elif choice == "2":
-            from taskManagerUI import TaskManagerUI
-            app = TaskManagerUI(task_manager)
-            app.mainloop()
+            from taskManagerUI import ModernTaskManagerUI
+            app = ModernTaskManagerUI(task_manager)
+            app.run()
         else:
             TaskManager.print_colored("Pilihan tidak valid!", Fore.RED)
             
     except KeyboardInterrupt:
         task_manager.stop_deadline_check()
+        task_manager.disable_journal()
         TaskManager.print_colored("\nProgram dihentikan oleh pengguna.", Fore.CYAN)
     except Exception as e:
         TaskManager.print_colored(f"Terjadi kesalahan fatal: {str(e)}", Fore.RED)
@@ -1,17 +1,209 @@
 import customtkinter as ctk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import tkinter as tk
-from tkcalendar import DateEntry
 from datetime import datetime, timedelta
-from taskManager import TaskManager, Task, Priority, TaskStatus
-from PIL import Image, ImageTk
+from taskManager import TaskManager, Task, Priority, TaskStatus, EventKind, RenderCache, format_datetime
 import os
+import bisect
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from taskStream import write_task_file
+from taskProfile import instrumentation, timed
+
+ROW_HEIGHT = 40
+VIRTUAL_THRESHOLD = 2000  # Views larger than this only materialize the visible rows
+VIRTUAL_MARGIN = 50
+SEARCH_DEBOUNCE_MS = 200
+POLL_MS = 15  # Roughly one frame
+LAG_INTERVAL_MS = 100  # Event-loop lag probe interval
+CHANGES_POLL_MS = 50  # How often the change feed flag is checked
+TASK_FILE_TYPES = [("Task files", "*.json *.ndjson *.jsonl"), ("All files", "*.*")]
+# Columns that can be sorted by clicking their heading, mapped to TaskManager.query orders
+SORT_COLUMNS = {"ID": "id", "Priority": "priority", "Deadline": "deadline", "Status": "status"}
+
+def longest_increasing(values):
+    """Indices of one longest strictly increasing subsequence of values, in O(n log n)"""
+    tails = []  # tails[k]: index of the smallest tail of an increasing run of length k + 1
+    tail_values = []
+    previous = [None] * len(values)
+    for index, value in enumerate(values):
+        length = bisect.bisect_left(tail_values, value)
+        if length:
+            previous[index] = tails[length - 1]
+        if length == len(tails):
+            tails.append(index)
+            tail_values.append(value)
+        else:
+            tails[length] = index
+            tail_values[length] = value
+    result = set()
+    index = tails[-1] if tails else None
+    while index is not None:
+        result.add(index)
+        index = previous[index]
+    return result
+
+class JobCancelled(Exception):
+    """Raised inside a worker when its job has been cancelled"""
+
+class Job:
+    """Handle for work submitted to a BackgroundExecutor"""
+
+    def __init__(self, executor, on_done, on_error, on_progress, on_cancelled):
+        self._executor = executor
+        self._cancelled = threading.Event()
+        self.future = None
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancelled = on_cancelled
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Request cancellation; the job's callbacks will not run anymore"""
+        if self.cancelled:
+            return
+        self._cancelled.set()
+        if self.future is not None and self.future.cancel():
+            # Never started, so no worker will report back
+            self._executor._post(self, "cancelled", None)
+
+    def check(self):
+        """Cancellation point for worker code"""
+        if self.cancelled:
+            raise JobCancelled()
+
+    def report(self, done, total):
+        """Progress callback for worker code (e.g. load_file); also a cancellation point"""
+        self.check()
+        self._executor._post(self, "progress", (done, total))
+
+class BackgroundExecutor:
+    """Thread pool whose results are handed back to the Tk thread.
+
+    Workers never touch widgets: results, errors and progress go through a
+    queue that is drained with after() every POLL_MS while jobs are active,
+    so callbacks always run on the Tk thread. Progress updates are coalesced
+    to the latest value per job and poll.
+    """
+
+    def __init__(self, widget, max_workers=2):
+        self._widget = widget
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task-ui")
+        self._messages = queue.Queue()
+        self._active = set()
+        self._polling = False
+
+    def submit(self, function, *args, on_done=None, on_error=None, on_progress=None, on_cancelled=None):
+        """Run function(job, *args) on a worker thread and return the Job"""
+        job = Job(self, on_done, on_error, on_progress, on_cancelled)
+        self._active.add(job)
+        job.future = self._pool.submit(self._run, job, function, args)
+        if not self._polling:
+            self._polling = True
+            self._widget.after(POLL_MS, self._poll)
+        return job
+
+    def _run(self, job, function, args):
+        if job.cancelled:
+            self._post(job, "cancelled", None)
+            return
+        try:
+            result = function(job, *args)
+        except JobCancelled:
+            self._post(job, "cancelled", None)
+        except Exception as e:
+            self._post(job, "error", e)
+        else:
+            self._post(job, "done", result)
+
+    def _post(self, job, kind, payload):
+        self._messages.put((job, kind, payload))
+
+    def _call(self, callback, *args):
+        """Run a job callback; a failing one is reported the way Tk reports its own"""
+        try:
+            callback(*args)
+        except Exception:
+            self._widget.report_callback_exception(*sys.exc_info())
+
+    @timed
+    def _poll(self):
+        try:
+            self._drain()
+        finally:
+            # Always re-arm (or stop) polling, or later results would never be delivered
+            if self._active:
+                self._widget.after(POLL_MS, self._poll)
+            else:
+                self._polling = False
+
+    def _drain(self):
+        progress = {}
+        while True:
+            try:
+                job, kind, payload = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                progress[job] = payload
+                continue
+            self._active.discard(job)
+            progress.pop(job, None)
+            if kind == "cancelled" or job.cancelled:
+                callback, args = job.on_cancelled, ()
+            elif kind == "error":
+                callback, args = job.on_error, (payload,)
+            else:
+                callback, args = job.on_done, (payload,)
+            if callback is not None:
+                self._call(callback, *args)
+                
+        for job, (done, total) in progress.items():
+            if job.on_progress is not None and not job.cancelled:
+                self._call(job.on_progress, done, total)
+
+    def shutdown(self):
+        for job in list(self._active):
+            job.cancel()
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
 class ModernTaskManagerUI(ctk.CTk):
     def __init__(self, task_manager):
         super().__init__()
         self.task_manager = task_manager
         
+        # Treeview state: rows currently materialized (iid -> (values, tags))
+        # and the ordered task ids of the current view
+        self._rows = {}
+        self._view_ids = []
+        self._view_offset = 0
+        self._window_start = 0
+        self._window_end = 0
+        self._search_term = ""  # Term of the newest view request
+        self._view_reset = False
+        self._sort_column = None  # None = store order
+        self._sort_descending = False
+        self._render_pending = None
+        self._hover_iid = None
+        self._hover_pos = None
+        self._hover_pending = None
+        self._row_cache = RenderCache()  # Formatted cells per (task version, minute)
+        self.virtual_mode = None  # None = automatic, based on VIRTUAL_THRESHOLD
+        
+        # Queries, statistics and file I/O run on worker threads; only the
+        # newest view query is kept, and one file operation runs at a time
+        self.executor = BackgroundExecutor(self)
+        self._view_job = None
+        self._file_job = None
+        self._search_debounce = None
+        
         # Configure window
         self.title("Modern Task Manager")
         self.geometry("1300x800")
@@ -23,6 +215,16 @@ class ModernTaskManagerUI(ctk.CTk):
         # Load and store images
         self.images = self._load_images()
         
+        # Overdue notifications arrive from the deadline scheduler thread
+        self._overdue_queue = queue.Queue()
+        self.task_manager.set_overdue_callback(self._overdue_queue.put)
+        
+        # Board changes (from dialogs, workers or other threads) only raise a
+        # flag here; _poll_changes reads the change feed on the Tk thread
+        self._seen_version = self.task_manager.version
+        self._changes_pending = threading.Event()
+        self._unsubscribe = self.task_manager.subscribe(lambda events: self._changes_pending.set())
+        
         self._create_widgets()
         self._setup_layout()
         self._apply_custom_style()
@@ -77,7 +279,9 @@ class ModernTaskManagerUI(ctk.CTk):
         button_configs = [
             ("Add Task", self._show_add_task_dialog, "#4CAF50"),
             ("View Tasks", self._refresh_task_list, "#2196F3"),
-            ("Statistics", self._show_statistics, "#9C27B0")
+            ("Statistics", self._show_statistics, "#9C27B0"),
+            ("Open File", self._open_file, "#00897B"),
+            ("Save File", self._save_file, "#607D8B")
         ]
         
         self.nav_buttons = []
@@ -136,6 +340,7 @@ class ModernTaskManagerUI(ctk.CTk):
             self.task_frame,
             columns=("ID", "Title", "Priority", "Deadline", "Status", "Progress"),
             show="headings",
+            selectmode="extended",  # Ctrl/Shift-click to act on several tasks at once
             style="Modern.Treeview"
         )
         self._setup_treeview()
@@ -167,6 +372,30 @@ class ModernTaskManagerUI(ctk.CTk):
                 hover_color=self._adjust_color(color, -20)
             )
             self.action_buttons.append(btn)
+            
+        # Progress of file operations, shown only while one is running
+        self.progress_label = ctk.CTkLabel(
+            self.action_frame,
+            text="",
+            font=("Roboto", 12)
+        )
+        
+        self.progress_bar = ctk.CTkProgressBar(
+            self.action_frame,
+            width=200
+        )
+        
+        self.progress_cancel_btn = ctk.CTkButton(
+            self.action_frame,
+            text="Cancel",
+            command=self._cancel_file_job,
+            width=80,
+            height=35,
+            corner_radius=8,
+            font=("Roboto", 12),
+            fg_color="#757575",
+            hover_color=self._adjust_color("#757575", -20)
+        )
 
     def _setup_treeview(self):
         # Configure columns with improved styling
@@ -183,7 +412,8 @@ class ModernTaskManagerUI(ctk.CTk):
             self.task_tree.heading(
                 col, 
                 text=col.upper(),
-                anchor="w"
+                anchor="w",
+                command=(lambda col=col: self._sort_by(col)) if col in SORT_COLUMNS else ""
             )
             self.task_tree.column(
                 col,
@@ -196,14 +426,16 @@ class ModernTaskManagerUI(ctk.CTk):
         self.scrollbar = ttk.Scrollbar(
             self.task_frame,
             orient="vertical",
-            command=self.task_tree.yview,
+            command=self._on_scrollbar,
             style="Modern.Vertical.TScrollbar"
         )
-        self.task_tree.configure(yscrollcommand=self.scrollbar.set)
+        self.task_tree.configure(yscrollcommand=self._on_tree_scrolled)
         
         # Bind selection and hover events
         self.task_tree.bind("<<TreeviewSelect>>", self._on_select_task)
         self.task_tree.bind("<Motion>", self._on_hover)
+        self.task_tree.bind("<Leave>", self._on_hover_leave)
+        self.task_tree.bind("<Control-a>", self._select_all)
         
         # Add alternating row colors and hover effect
         self.task_tree.tag_configure('oddrow', background='#333333')
@@ -236,6 +468,8 @@ class ModernTaskManagerUI(ctk.CTk):
         # Main frame layout with improved spacing
         self.search_frame.pack(fill="x", padx=15, pady=15)
         self.search_entry.pack(side="left", fill="x", expand=True, padx=(15, 10))
+        self.search_entry.bind("<KeyRelease>", self._on_search_typed)
+        self.search_entry.bind("<Return>", lambda event: self._search_tasks())
         self.search_btn.pack(side="right", padx=15)
         
         self.task_frame.pack(fill="both", expand=True, padx=15, pady=(0, 15))
@@ -257,7 +491,7 @@ class ModernTaskManagerUI(ctk.CTk):
             fieldbackground="#2B2B2B",
             borderwidth=0,
             font=("Roboto", 11),
-            rowheight=40
+            rowheight=ROW_HEIGHT
         )
         
         # Configure Treeview Headings
@@ -292,108 +526,339 @@ class ModernTaskManagerUI(ctk.CTk):
         return '#{:02x}{:02x}{:02x}'.format(*new_rgb)
 
     def _on_hover(self, event):
-        """Handle mouse hover over tasks"""
-        region = self.task_tree.identify_region(event.x, event.y)
-        if region == "cell":
-            iid = self.task_tree.identify_row(event.y)
-            if iid:
-                # Remove hover tag from all items
-                for item in self.task_tree.get_children():
-                    tags = list(self.task_tree.item(item, "tags"))
-                    if "hover" in tags:
-                        tags.remove("hover")
-                    self.task_tree.item(item, tags=tags)
-                
-                # Add hover tag to current item
-                current_tags = list(self.task_tree.item(iid, "tags"))
-                if "hover" not in current_tags:
-                    current_tags.append("hover")
-                    self.task_tree.item(iid, tags=current_tags)
+        """Handle mouse hover over tasks, at most once per frame"""
+        self._hover_pos = (event.x, event.y)
+        if self._hover_pending is None:
+            self._hover_pending = self.after(16, self._apply_hover)
 
-    def _refresh_task_list(self):
-        for item in self.task_tree.get_children():
-            self.task_tree.delete(item)
+    def _on_hover_leave(self, event):
+        self._hover_pos = None
+        if self._hover_pending is None:
+            self._hover_pending = self.after(16, self._apply_hover)
+
+    def _apply_hover(self):
+        self._hover_pending = None
+        iid = None
+        if self._hover_pos is not None:
+            x, y = self._hover_pos
+            if self.task_tree.identify_region(x, y) == "cell":
+                iid = self.task_tree.identify_row(y) or None
+                
+        if iid == self._hover_iid:
+            return
             
-        for i, task in enumerate(self.task_manager.tasks):
-            deadline = datetime.strptime(task.deadline, "%Y-%m-%d %H:%M")
-            now = datetime.now()
+        # Only the previously hovered row and the new one need their tags updated
+        if self._hover_iid is not None and self.task_tree.exists(self._hover_iid):
+            tags = [tag for tag in self.task_tree.item(self._hover_iid, "tags") if tag != "hover"]
+            self.task_tree.item(self._hover_iid, tags=tags)
+        if iid is not None:
+            tags = list(self.task_tree.item(iid, "tags"))
+            if "hover" not in tags:
+                tags.append("hover")
+                self.task_tree.item(iid, tags=tags)
+        self._hover_iid = iid
+
+    def _build_row(self, task, index, now, minute):
+        """Return the (values, tags) tuple displayed for a task"""
+        # Cells only change when the task is edited or, for pending tasks, as
+        # time passes, so they are reused within the same minute
+        version = self.task_manager.task_version(task.id)
+        cached = self._row_cache.get(task.id, version, minute)
+        if cached is None:
+            cached = self._format_row(task, now)
+            completed = task.status == TaskStatus.COMPLETED
+            self._row_cache.put(task.id, version, None if completed else minute, cached)
+        values, tags = cached
+        
+        # Add alternating row colors
+        return values, ('evenrow' if index % 2 == 0 else 'oddrow',) + tags
+
+    def _format_row(self, task, now):
+        deadline = task.deadline
+        
+        # Calculate progress
+        if task.status == TaskStatus.COMPLETED:
+            progress = "100%"
+        else:
+            total_time = (deadline - task.created_at).total_seconds()
+            elapsed_time = (now - task.created_at).total_seconds()
+            progress = f"{min(100, int((elapsed_time / total_time) * 100))}%" if total_time > 0 else "100%"
+        
+        # Determine row tags
+        tags = []
+        
+        # Add status-based tags
+        if task.status == TaskStatus.COMPLETED:
+            tags.append('completed')
+        elif deadline < now:
+            tags.append('overdue')
             
-            # Calculate progress
-            if task.status == TaskStatus.COMPLETED:
-                progress = "100%"
+        # Add priority-based tags
+        if task.priority == Priority.HIGH:
+            tags.append('high_priority')
+        elif task.priority == Priority.MEDIUM:
+            tags.append('medium_priority')
+        else:
+            tags.append('low_priority')
+        
+        values = (
+            task.id,
+            task.title,
+            f"{task.priority.icon} {task.priority.label}",
+            format_datetime(deadline),
+            task.status.value,
+            progress
+        )
+        return values, tuple(tags)
+
+    @timed
+    def _sync_rows(self, entries):
+        """Diff the Treeview against entries, a list of (iid, values, tags)"""
+        wanted = {iid for iid, _, _ in entries}
+        stale = [iid for iid in self._rows if iid not in wanted]
+        if stale:
+            self.task_tree.delete(*stale)
+            for iid in stale:
+                del self._rows[iid]
+        
+        # Existing rows whose relative order already matches (a longest increasing
+        # run of their current positions) stay put; only the others are moved
+        position = {iid: index for index, iid in enumerate(self.task_tree.get_children())}
+        existing = [iid for iid, _, _ in entries if iid in position]
+        keep = longest_increasing([position[iid] for iid in existing])
+        moved = {iid for index, iid in enumerate(existing) if index not in keep}
+        reselect = []
+        if moved:
+            # Detached rows are reattached below; keep them selected if they were
+            reselect = [iid for iid in self.task_tree.selection() if iid in moved]
+            self.task_tree.detach(*moved)
+        
+        # Only kept rows remain in the tree and already in entry order, so
+        # placing every other row at its entry index yields the final order
+        for index, (iid, values, tags) in enumerate(entries):
+            row = (values, tags)
+            if iid not in self._rows:
+                self.task_tree.insert("", index, iid=iid, values=values, tags=tags)
             else:
-                total_time = (deadline - datetime.strptime(task.created_at, "%Y-%m-%d %H:%M")).total_seconds()
-                elapsed_time = (now - datetime.strptime(task.created_at, "%Y-%m-%d %H:%M")).total_seconds()
-                progress = f"{min(100, int((elapsed_time / total_time) * 100))}%"
+                if iid in moved:
+                    self.task_tree.move(iid, "", index)
+                if self._rows[iid] == row:
+                    continue
+                self.task_tree.item(iid, values=values, tags=tags)
+            self._rows[iid] = row
+        if reselect:
+            self.task_tree.selection_add(reselect)
+
+    def _is_virtual(self):
+        if self.virtual_mode is None:
+            return len(self._view_ids) > VIRTUAL_THRESHOLD
+        return self.virtual_mode
+
+    def _page_size(self):
+        return max(20, self.task_tree.winfo_height() // ROW_HEIGHT)
+
+    @timed
+    def _render_view(self):
+        """Materialize the current view, or only its visible window in virtual mode"""
+        self._render_pending = None
+        total = len(self._view_ids)
+        
+        if self._is_virtual():
+            page = self._page_size()
+            self._view_offset = max(0, min(self._view_offset, total - page))
+            start = max(0, self._view_offset - VIRTUAL_MARGIN)
+            end = min(total, self._view_offset + page + VIRTUAL_MARGIN)
+        else:
+            start, end = 0, total
+            
+        self._window_start, self._window_end = start, end
+        now = datetime.now()
+        minute = RenderCache.minute(now)
+        entries = []
+        for index in range(start, end):
+            task = self.task_manager.get(self._view_ids[index])
+            if task is None:
+                continue
+            values, tags = self._build_row(task, index, now, minute)
+            entries.append((str(task.id), values, tags))
+        self._sync_rows(entries)
+        
+        if self._is_virtual() and end > start:
+            self.task_tree.yview_moveto((self._view_offset - start) / (end - start))
+        
+        # _rows caches tags without "hover", so _sync_rows leaves the old hovered
+        # row alone when its cells are unchanged: reset it explicitly, then
+        # highlight whichever row is now under the pointer
+        previous, self._hover_iid = self._hover_iid, None
+        if previous in self._rows:
+            self.task_tree.item(previous, tags=self._rows[previous][1])
+        if previous is not None or self._hover_pos is not None:
+            self._apply_hover()
+
+    def _schedule_render(self):
+        if self._render_pending is None:
+            self._render_pending = self.after_idle(self._render_view)
+
+    def _on_tree_scrolled(self, first, last):
+        """Keep the scrollbar in sync; in virtual mode map it onto the whole view"""
+        if not self._is_virtual():
+            self.scrollbar.set(first, last)
+            return
             
-            # Determine row tags
-            tags = []
+        total = len(self._view_ids)
+        if not total:
+            # Empty view (e.g. a search without matches): nothing to scroll
+            self._view_offset = 0
+            self.scrollbar.set(0, 1)
+            return
+        window = self._window_end - self._window_start
+        page = self._page_size()
+        self._view_offset = self._window_start + round(float(first) * window)
+        self.scrollbar.set(self._view_offset / total, min(1.0, (self._view_offset + page) / total))
+        
+        # Re-materialize once the viewport gets close to the window edges
+        near_top = self._window_start > 0 and self._view_offset < self._window_start + VIRTUAL_MARGIN // 2
+        near_bottom = (self._window_end < total and
+                       self._view_offset + page > self._window_end - VIRTUAL_MARGIN // 2)
+        if near_top or near_bottom:
+            self._schedule_render()
+
+    def _on_scrollbar(self, *args):
+        if not self._is_virtual():
+            self.task_tree.yview(*args)
+            return
             
-            # Add alternating row colors
-            tags.append('evenrow' if i % 2 == 0 else 'oddrow')
+        total = len(self._view_ids)
+        if args[0] == "moveto":
+            self._view_offset = int(float(args[1]) * total)
+        else:
+            step = self._page_size() if args[2] == "pages" else 1
+            self._view_offset += int(args[1]) * step
+        self._view_offset = max(0, min(self._view_offset, total - 1))
+        self._render_view()
+
+    def _request_view(self, term, reset_offset):
+        """Evaluate the view (all ids or a search) on a worker; newest request wins"""
+        if self._view_job is not None:
+            self._view_job.cancel()
+            # The replaced request's offset reset (a new search) still applies
+            reset_offset = reset_offset or self._view_reset
+        # The newest requested term is the current one, even before its results
+        # arrive, so refreshes triggered meanwhile do not revert to the old term
+        self._search_term = term
+        self._view_reset = reset_offset
+        order_by = None
+        if self._sort_column is not None:
+            order_by = ("-" if self._sort_descending else "") + SORT_COLUMNS[self._sort_column]
             
-            # Add status-based tags
-            if task.status == TaskStatus.COMPLETED:
-                tags.append('completed')
-            elif deadline < now:
-                tags.append('overdue')
-                
-            # Add priority-based tags
-            if task.priority == Priority.HIGH:
-                tags.append('high_priority')
-            elif task.priority == Priority.MEDIUM:
-                tags.append('medium_priority')
-            else:
-                tags.append('low_priority')
+        @timed(name="ModernTaskManagerUI.view_query")
+        def evaluate(job):
+            if order_by is None:
+                if term:
+                    return [task.id for task in self.task_manager.search(term)]
+                return self.task_manager.ids()
+            ids = self.task_manager.query_ids(order_by=order_by)
+            if term:
+                # The sorted index gives the order, the search only filters it
+                matches = {task.id for task in self.task_manager.search(term)}
+                job.check()
+                ids = [task_id for task_id in ids if task_id in matches]
+            return ids
             
-            self.task_tree.insert(
-                "",
-                "end",
-                values=(
-                    task.id,
-                    task.title,
-                    f"{task.priority.icon} {task.priority.label}",
-                    deadline.strftime("%Y-%m-%d %H:%M"),
-                    task.status.value,
-                    progress
-                ),
-                tags=tags
-            )
+        self._view_job = self.executor.submit(
+            evaluate,
+            on_done=lambda ids: self._show_view(ids, reset_offset),
+            on_error=lambda error: messagebox.showerror("Error", f"Could not load tasks: {error}")
+        )
+
+    @timed
+    def _show_view(self, ids, reset_offset):
+        self._view_job = None
+        self._view_ids = ids
+        if reset_offset:
+            self._view_offset = 0
+        self._render_view()
+
+    def _sort_by(self, column):
+        """Heading click: sort by the column, clicking again reverses the order"""
+        if self._sort_column == column:
+            self._sort_descending = not self._sort_descending
+        else:
+            self._sort_column = column
+            self._sort_descending = False
+        for name in SORT_COLUMNS:
+            text = name.upper()
+            if name == column:
+                text += " ▼" if self._sort_descending else " ▲"
+            self.task_tree.heading(name, text=text)
+        self._request_view(self._search_term, reset_offset=True)
+
+    def _refresh_task_list(self):
+        self._request_view(self._search_term, reset_offset=False)
+
+    @timed
+    def _poll_changes(self):
+        """Apply board changes: re-render in place when the view's ids and order still hold"""
+        if self._changes_pending.is_set():
+            self._changes_pending.clear()
+            events = self.task_manager.changes_since(self._seen_version)
+            if events is None or any(event.kind not in (EventKind.TASK_UPDATED, EventKind.TASK_COMPLETED)
+                                     for event in events):
+                self._seen_version = self.task_manager.version
+                self._refresh_task_list()
+            elif events:
+                self._seen_version = events[-1].version
+                # Sorted and searched views depend on field values, plain views only on membership
+                if self._sort_column is not None or self._search_term:
+                    self._refresh_task_list()
+                else:
+                    self._schedule_render()
+        self.after(CHANGES_POLL_MS, self._poll_changes)
+
+    def _on_search_typed(self, event):
+        """Debounce keystrokes so only the last one in a burst starts a query"""
+        if self._search_debounce is not None:
+            self.after_cancel(self._search_debounce)
+        self._search_debounce = self.after(SEARCH_DEBOUNCE_MS, self._search_tasks)
 
     def _search_tasks(self):
-        search_term = self.search_entry.get().lower()
-        self._refresh_task_list()  # First refresh the list to show all items
-        
-        if search_term:  # Only filter if search term is not empty
-            for item in self.task_tree.get_children():
-                values = self.task_tree.item(item)['values']
-                title = str(values[1]).lower()
-                if search_term not in title:
-                    self.task_tree.detach(item)
+        if self._search_debounce is not None:
+            self.after_cancel(self._search_debounce)
+            self._search_debounce = None
+            
+        self._request_view(self.search_entry.get().lower(), reset_offset=True)
 
     def _show_add_task_dialog(self):
         dialog = ModernAddTaskDialog(self, self.task_manager)
         self.wait_window(dialog)
-        self._refresh_task_list()
 
+    def _selected_ids(self):
+        """Ids of all selected rows (row iids are the task ids)"""
+        return [int(iid) for iid in self.task_tree.selection()]
+
+    def _select_all(self, event=None):
+        """Select every rendered row (the visible window when virtualised)"""
+        self.task_tree.selection_set(self.task_tree.get_children())
+        return "break"
+
+    @timed
     def _complete_task(self):
-        selected = self.task_tree.selection()
+        selected = self._selected_ids()
         if not selected:
             messagebox.showwarning("Warning", "Please select a task to complete")
             return
-            
-        task_id = int(self.task_tree.item(selected[0])['values'][0])
-        task = next((t for t in self.task_manager.tasks if t.id == task_id), None)
-        
-        if task:
-            if task.status == TaskStatus.COMPLETED:
-                messagebox.showinfo("Info", "Task is already completed!")
-                return
-                
-            task.status = TaskStatus.COMPLETED
-            task.completed_at = datetime.now().strftime("%Y-%m-%d %H:%M")
-            messagebox.showinfo("Success", f"Task '{task.title}' marked as completed!")
-            self._refresh_task_list()
+
+        pending = [task_id for task_id in selected
+                   if (task := self.task_manager.get(task_id)) and task.status != TaskStatus.COMPLETED]
+        if not pending:
+            messagebox.showinfo("Info", "Task is already completed!")
+            return
+
+        completed = self.task_manager.complete_many(pending)
+        if len(completed) == 1:
+            messagebox.showinfo("Success", f"Task '{completed[0].title}' marked as completed!")
+        else:
+            messagebox.showinfo("Success", f"{len(completed)} tasks marked as completed!")
 
     def _edit_task(self):
         selected = self.task_tree.selection()
@@ -402,32 +867,39 @@ class ModernTaskManagerUI(ctk.CTk):
             return
             
         task_id = int(self.task_tree.item(selected[0])['values'][0])
-        task = next((t for t in self.task_manager.tasks if t.id == task_id), None)
+        task = self.task_manager.get(task_id)
         
         if task:
             dialog = ModernEditTaskDialog(self, self.task_manager, task)
             self.wait_window(dialog)
-            self._refresh_task_list()
 
+    @timed
     def _delete_task(self):
-        selected = self.task_tree.selection()
+        selected = self._selected_ids()
         if not selected:
             messagebox.showwarning("Warning", "Please select a task to delete")
             return
-            
-        task_id = int(self.task_tree.item(selected[0])['values'][0])
-        task = next((t for t in self.task_manager.tasks if t.id == task_id), None)
-        
-        if task:
-            if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete task '{task.title}'?"):
-                self.task_manager.tasks.remove(task)
-                messagebox.showinfo("Success", f"Task '{task.title}' deleted successfully!")
-                self._refresh_task_list()
+
+        if len(selected) == 1:
+            task = self.task_manager.get(selected[0])
+            if not task:
+                return
+            question = f"Are you sure you want to delete task '{task.title}'?"
+        else:
+            question = f"Are you sure you want to delete {len(selected)} tasks?"
+
+        if messagebox.askyesno("Confirm Delete", question):
+            deleted = self.task_manager.delete_many(selected)
+            if len(deleted) == 1:
+                messagebox.showinfo("Success", f"Task '{deleted[0].title}' deleted successfully!")
+            else:
+                messagebox.showinfo("Success", f"{len(deleted)} tasks deleted successfully!")
 
     def _show_statistics(self):
         stats_window = ModernStatisticsDialog(self, self.task_manager)
         stats_window.grab_set()  # Make the window modal
 
+    @timed
     def _on_select_task(self, event):
         """Enable/disable action buttons based on task selection"""
         selected = self.task_tree.selection()
@@ -439,18 +911,116 @@ class ModernTaskManagerUI(ctk.CTk):
             else:
                 btn.configure(state="disabled")
                 
-        # If a task is selected, get its status
+        # Complete handles mixed selections, so it only needs one pending task
         if selected:
-            task_id = int(self.task_tree.item(selected[0])['values'][0])
-            task = next((t for t in self.task_manager.tasks if t.id == task_id), None)
-            
-            if task and task.status == TaskStatus.COMPLETED:
-                # Disable complete button for completed tasks
+            tasks = map(self.task_manager.get, self._selected_ids())
+            if not any(task is not None and task.status == TaskStatus.PENDING for task in tasks):
                 self.action_buttons[0].configure(state="disabled")
 
+    @timed
+    def _poll_overdue(self):
+        """Show overdue notifications posted by the deadline scheduler"""
+        overdue = []
+        while True:
+            try:
+                overdue.append(self._overdue_queue.get_nowait())
+            except queue.Empty:
+                break
+                
+        if overdue:
+            self._refresh_task_list()
+            titles = "\n".join(f"• {task.title}" for task in overdue[:10])
+            if len(overdue) > 10:
+                titles += f"\n... and {len(overdue) - 10} more"
+            messagebox.showwarning("Deadline Passed", f"These tasks are past their deadline:\n\n{titles}")
+            
+        self.after(500, self._poll_overdue)
+
+    def _start_file_job(self, message, function, on_done):
+        """Run a load/save on a worker with a progress bar and a Cancel button"""
+        if self._file_job is not None:
+            messagebox.showwarning("Warning", "Another file operation is still running")
+            return
+            
+        self.progress_label.configure(text=message)
+        self.progress_bar.set(0)
+        self.progress_label.pack(side="left", padx=(20, 5))
+        self.progress_bar.pack(side="left", padx=5)
+        self.progress_cancel_btn.pack(side="left", padx=5)
+        
+        def finish(callback):
+            def handler(*args):
+                self._file_job = None
+                self.progress_label.pack_forget()
+                self.progress_bar.pack_forget()
+                self.progress_cancel_btn.pack_forget()
+                if callback is not None:
+                    callback(*args)
+            return handler
+            
+        self._file_job = self.executor.submit(
+            function,
+            on_done=finish(on_done),
+            on_error=finish(lambda error: messagebox.showerror("Error", str(error))),
+            on_progress=lambda done, total: self.progress_bar.set(done / total if total else 1),
+            on_cancelled=finish(None)
+        )
+
+    def _cancel_file_job(self):
+        if self._file_job is not None:
+            self._file_job.cancel()
+
+    def _open_file(self):
+        path = filedialog.askopenfilename(title="Open Tasks", filetypes=TASK_FILE_TYPES)
+        if not path:
+            return
+            
+        def loaded(_):
+            messagebox.showinfo("Success", f"Loaded {len(self.task_manager.tasks)} tasks from "
+                                           f"'{os.path.basename(path)}'")
+            
+        # The old board stays visible and usable until the new one is swapped in
+        self._start_file_job(
+            f"Loading {os.path.basename(path)}...",
+            lambda job: self.task_manager.load_file(path, job.report),
+            loaded
+        )
+
+    def _save_file(self):
+        path = filedialog.asksaveasfilename(title="Save Tasks", defaultextension=".json",
+                                            filetypes=TASK_FILE_TYPES)
+        if not path:
+            return
+            
+        # Write a copy-on-write snapshot so edits made while saving never wait on the file
+        self._start_file_job(
+            f"Saving {os.path.basename(path)}...",
+            lambda job: write_task_file(path, self.task_manager.snapshot(), job.report),
+            lambda _: messagebox.showinfo("Success", f"Tasks saved to '{os.path.basename(path)}'")
+        )
+
+    def _on_close(self):
+        self._unsubscribe()
+        self.executor.shutdown()
+        self.task_manager.stop_deadline_check()
+        self.destroy()
+
+    def _watch_event_loop(self, scheduled=None):
+        """Record how late the after() probe fires, i.e. how long the Tk loop was blocked"""
+        now = time.perf_counter()
+        if scheduled is not None and instrumentation.enabled:
+            lag = (now - scheduled) * 1000 - LAG_INTERVAL_MS
+            instrumentation.record("Tk event loop lag", max(0.0, lag))
+        self.after(LAG_INTERVAL_MS, self._watch_event_loop, now)
+
     def run(self):
         """Start the application"""
         self._refresh_task_list()
+        self.task_manager.start_deadline_check()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.after(500, self._poll_overdue)
+        self.after(CHANGES_POLL_MS, self._poll_changes)
+        self._watch_event_loop()
         self.mainloop()
 
 
@@ -529,7 +1099,9 @@ class ModernAddTaskDialog(ctk.CTkToplevel):
             font=("Roboto", 12)
         )
         
-        # Date picker
+        # Date picker; tkcalendar is only imported once a dialog needs it
+        from tkcalendar import DateEntry
+
         default_date = datetime.now() + timedelta(days=1)
         self.date_picker = DateEntry(
             self.deadline_frame,
@@ -731,7 +1303,9 @@ class ModernAddTaskDialog(ctk.CTkToplevel):
             fg_color="transparent"
         )
         
-        # Use tkcalendar's DateEntry for date selection
+        # Use tkcalendar's DateEntry for date selection (imported on first use)
+        from tkcalendar import DateEntry
+
         self.date_picker = DateEntry(
             self.deadline_frame,
             width=12,
@@ -830,15 +1404,12 @@ class ModernAddTaskDialog(ctk.CTkToplevel):
             return
         
         # Create new task
-        new_task = Task(
+        self.task_manager.create(
             title=title,
             description=description,
             priority=priority,
-            deadline=deadline.strftime("%Y-%m-%d %H:%M")
+            deadline=deadline
         )
-    
-        # Add to task manager
-        self.task_manager.tasks.append(new_task)
         messagebox.showinfo("Success", "Task added successfully!")
         self.destroy()
 class ModernEditTaskDialog(ModernAddTaskDialog):
@@ -856,7 +1427,7 @@ class ModernEditTaskDialog(ModernAddTaskDialog):
         self.priority_var.set(self.task.priority.name)
         
         # Set deadline
-        deadline = datetime.strptime(self.task.deadline, "%Y-%m-%d %H:%M")
+        deadline = self.task.deadline
         self.date_picker.set_date(deadline.date())
         self.time_spinbox.set(f"{deadline.hour:02d}:00")
         
@@ -878,10 +1449,13 @@ class ModernEditTaskDialog(ModernAddTaskDialog):
             return
         
         # Update task
-        self.task.title = title
-        self.task.description = description
-        self.task.priority = priority
-        self.task.deadline = deadline.strftime("%Y-%m-%d %H:%M")
+        self.task_manager.update(
+            self.task.id,
+            title=title,
+            description=description,
+            priority=priority,
+            deadline=deadline
+        )
         
         messagebox.showinfo("Success", "Task updated successfully!")
         self.destroy()
@@ -890,9 +1464,11 @@ class ModernStatisticsDialog(ctk.CTkToplevel):
     def __init__(self, parent, task_manager):
         super().__init__(parent)
         self.task_manager = task_manager
+        self.executor = parent.executor
+        self._stats_job = None
         
         self.title("Task Statistics")
-        self.geometry("800x600")
+        self.geometry("900x820")
         
         # Make dialog modal
         self.transient(parent)
@@ -918,10 +1494,10 @@ class ModernStatisticsDialog(ctk.CTkToplevel):
         # Create stat cards
         self.cards = []
         card_configs = [
-            ("Total Tasks", "0", "#4CAF50"),
-            ("Completed Tasks", "0", "#2196F3"),
-            ("Pending Tasks", "0", "#FF9800"),
-            ("Overdue Tasks", "0", "#F44336")
+            ("Total Tasks", "…", "#4CAF50"),
+            ("Completed Tasks", "…", "#2196F3"),
+            ("Pending Tasks", "…", "#FF9800"),
+            ("Overdue Tasks", "…", "#F44336")
         ]
         
         self.cards_frame = ctk.CTkFrame(
@@ -951,6 +1527,49 @@ class ModernStatisticsDialog(ctk.CTkToplevel):
             font=("Roboto", 12)
         )
         
+        # Performance (opt-in instrumentation)
+        self.profile_frame = ctk.CTkFrame(
+            self.stats_frame,
+            corner_radius=10
+        )
+        
+        self.profile_label = ctk.CTkLabel(
+            self.profile_frame,
+            text="Performance",
+            font=("Roboto", 16, "bold")
+        )
+        
+        self.profile_stats = ctk.CTkTextbox(
+            self.profile_frame,
+            height=160,
+            font=("Courier", 11),
+            wrap="none"
+        )
+        
+        self.profile_buttons = ctk.CTkFrame(self.profile_frame, fg_color="transparent")
+        self.profile_toggle_btn = ctk.CTkButton(
+            self.profile_buttons,
+            command=self._toggle_instrumentation,
+            width=140
+        )
+        self.profile_reset_btn = ctk.CTkButton(
+            self.profile_buttons,
+            text="Reset",
+            command=self._reset_instrumentation,
+            width=90
+        )
+        self.cprofile_btn = ctk.CTkButton(
+            self.profile_buttons,
+            command=self._toggle_cprofile,
+            width=140
+        )
+        self.memory_btn = ctk.CTkButton(
+            self.profile_buttons,
+            text="Memory Snapshot...",
+            command=self._dump_memory,
+            width=150
+        )
+        
         # Button
         self.close_btn = ctk.CTkButton(
             self,
@@ -1012,37 +1631,95 @@ class ModernStatisticsDialog(ctk.CTkToplevel):
         self.priority_label.pack(pady=(15, 10))
         self.priority_stats.pack(padx=15, pady=(0, 15), fill="x")
         
+        # Performance
+        self.profile_frame.pack(fill="both", expand=True, padx=15, pady=(0, 15))
+        self.profile_label.pack(pady=(15, 10))
+        self.profile_stats.pack(padx=15, pady=(0, 10), fill="both", expand=True)
+        self.profile_buttons.pack(pady=(0, 15))
+        for button in (self.profile_toggle_btn, self.profile_reset_btn, self.cprofile_btn, self.memory_btn):
+            button.pack(side="left", padx=5)
+        self._show_instrumentation()
+        
         # Close button
         self.close_btn.pack(pady=(0, 20))
         
     def _load_statistics(self):
-        now = datetime.now()
-        
-        # Calculate statistics
-        total_tasks = len(self.task_manager.tasks)
-        completed_tasks = len([t for t in self.task_manager.tasks if t.status == TaskStatus.COMPLETED])
-        pending_tasks = total_tasks - completed_tasks
-        overdue_tasks = len([
-            t for t in self.task_manager.tasks
-            if t.status != TaskStatus.COMPLETED and
-            datetime.strptime(t.deadline, "%Y-%m-%d %H:%M") < now
-        ])
+        """Compute statistics on a worker; the dialog shows placeholders until then"""
+        self._stats_job = self.executor.submit(
+            lambda job: self.task_manager.stats(),
+            on_done=self._show_statistics,
+            on_error=lambda error: messagebox.showerror("Error", str(error), parent=self)
+        )
+
+    def destroy(self):
+        if self._stats_job is not None:
+            self._stats_job.cancel()
+        super().destroy()
+
+    def _show_statistics(self, stats):
+        self._stats_job = None
         
         # Update stat cards
-        stats = [total_tasks, completed_tasks, pending_tasks, overdue_tasks]
-        for card, value in zip(self.cards, stats):
+        values = [stats.total, stats.completed, stats.pending, stats.overdue]
+        for card, value in zip(self.cards, values):
             card['value'].configure(text=str(value))
             
-        # Calculate priority distribution
-        priority_counts = {priority: 0 for priority in Priority}
-        for task in self.task_manager.tasks:
-            priority_counts[task.priority] += 1
-            
         # Format priority statistics
         priority_stats = "Priority Distribution:\n\n"
-        for priority, count in priority_counts.items():
-            percentage = (count / total_tasks * 100) if total_tasks > 0 else 0
+        for priority, count in stats.by_priority.items():
+            percentage = (count / stats.total * 100) if stats.total > 0 else 0
             priority_stats += f"{priority.label}: {count} tasks ({percentage:.1f}%)\n"
             
         self.priority_stats.delete("1.0", "end")
         self.priority_stats.insert("1.0", priority_stats)
+
+    def _show_instrumentation(self):
+        """Latency summary recorded since profiling was enabled (or last reset)"""
+        self.profile_toggle_btn.configure(
+            text="Disable Profiling" if instrumentation.enabled else "Enable Profiling")
+        self.cprofile_btn.configure(
+            text="Stop cProfile..." if instrumentation.profiling else "Start cProfile")
+        self.profile_stats.configure(state="normal")
+        self.profile_stats.delete("1.0", "end")
+        self.profile_stats.insert("1.0", instrumentation.format_summary())
+        self.profile_stats.configure(state="disabled")
+
+    def _toggle_instrumentation(self):
+        if instrumentation.enabled:
+            instrumentation.disable()
+        else:
+            instrumentation.enable()
+        self._show_instrumentation()
+
+    def _reset_instrumentation(self):
+        instrumentation.reset()
+        self._show_instrumentation()
+
+    def _toggle_cprofile(self):
+        """cProfile records the Tk thread, where callbacks and rendering run"""
+        if not instrumentation.profiling:
+            instrumentation.start_profile()
+        else:
+            path = filedialog.asksaveasfilename(
+                parent=self, defaultextension=".prof",
+                filetypes=[("cProfile data", "*.prof"), ("All files", "*.*")])
+            if not path:
+                return
+            try:
+                instrumentation.stop_profile(path)
+            except OSError as e:
+                messagebox.showerror("Error", f"Could not save profile: {e}", parent=self)
+        self._show_instrumentation()
+
+    def _dump_memory(self):
+        path = filedialog.asksaveasfilename(
+            parent=self, defaultextension=".snap",
+            filetypes=[("tracemalloc snapshot", "*.snap"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            summary = instrumentation.dump_memory(path)
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not save snapshot: {e}", parent=self)
+            return
+        messagebox.showinfo("Memory Snapshot", summary.split("\n")[0], parent=self)
@@ -0,0 +1,169 @@
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Batas atas bucket histogram latensi dalam milidetik (bucket terakhir tanpa batas)
+BUCKET_BOUNDS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+class LatencyHistogram:
+    """Histogram latensi dengan bucket logaritmik tetap; persentil diperkirakan dari bucket."""
+
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, milliseconds: float):
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS_MS, milliseconds)] += 1
+        self.count += 1
+        self.total += milliseconds
+        self.max = max(self.max, milliseconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Batas atas bucket tempat persentil itu jatuh (dibatasi nilai maksimum)."""
+        if not self.count:
+            return 0.0
+        target = percent / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(BUCKET_BOUNDS_MS[index], self.max) if index < len(BUCKET_BOUNDS_MS) else self.max
+        return self.max
+
+class Instrumentation:
+    """Pencatat latensi per operasi yang hanya aktif bila diminta.
+
+    Saat nonaktif, fungsi yang dibungkus ``timed`` hanya membayar satu
+    pengecekan atribut. Aktifkan dengan ``enable()`` atau variabel
+    lingkungan ``TASKMANAGER_PROFILE=1``. Selain histogram, kelas ini
+    dapat merekam cProfile dan snapshot tracemalloc sesuai permintaan.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self._profiler = None
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+    def record(self, name: str, milliseconds: float):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.record(milliseconds)
+
+    @contextmanager
+    def measure(self, name: str):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def timed(self, function: Optional[Callable] = None, *, name: Optional[str] = None):
+        """Dekorator pencatat latensi; nama bawaan adalah ``__qualname__`` fungsi."""
+        def decorate(function: Callable) -> Callable:
+            label = name or function.__qualname__
+
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.record(label, (time.perf_counter() - start) * 1000)
+            return wrapper
+        return decorate(function) if function is not None else decorate
+
+    def summary(self) -> List[Tuple[str, int, float, float, float, float]]:
+        """Baris (nama, jumlah panggilan, rata-rata, p50, p95, maks) dalam ms, terlama dulu."""
+        with self._lock:
+            rows = [(name, histogram.count, histogram.mean, histogram.percentile(50),
+                     histogram.percentile(95), histogram.max)
+                    for name, histogram in self._histograms.items()]
+        return sorted(rows, key=lambda row: row[1] * row[2], reverse=True)
+
+    def format_summary(self) -> str:
+        rows = self.summary()
+        if not rows:
+            return "Belum ada data profiling." if self.enabled else "Profiling tidak aktif."
+        width = max(len(row[0]) for row in rows)
+        lines = [f"{'Operasi':<{width}}  {'Panggilan':>9}  {'Rata2 ms':>9}  {'p50 ms':>8}  "
+                 f"{'p95 ms':>8}  {'Maks ms':>9}"]
+        for name, count, mean, p50, p95, maximum in rows:
+            lines.append(f"{name:<{width}}  {count:>9}  {mean:>9.2f}  {p50:>8.2f}  {p95:>8.2f}  {maximum:>9.2f}")
+        return "\n".join(lines)
+
+    @property
+    def profiling(self) -> bool:
+        return self._profiler is not None
+
+    def start_profile(self):
+        """Mulai merekam cProfile untuk thread pemanggil."""
+        import cProfile
+
+        if self._profiler is None:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def stop_profile(self, path: str, limit: int = 25) -> str:
+        """Hentikan cProfile, simpan hasilnya (format pstats) ke ``path``, dan kembalikan ringkasannya."""
+        import io
+        import pstats
+
+        if self._profiler is None:
+            raise ValueError("cProfile belum dimulai")
+        profiler = self._profiler
+        profiler.disable()
+        # Rekaman baru dilepas setelah tersimpan, sehingga penyimpanan yang gagal bisa diulang
+        profiler.dump_stats(path)
+        self._profiler = None
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(limit)
+        return output.getvalue()
+
+    def dump_memory(self, path: str, limit: int = 15) -> str:
+        """Simpan snapshot tracemalloc ke ``path`` dan kembalikan baris alokasi terbesar.
+
+        Panggilan pertama baru memulai tracemalloc; alokasi sebelumnya tidak terlihat.
+        """
+        import tracemalloc
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        snapshot = tracemalloc.take_snapshot()
+        snapshot.dump(path)
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"Memori terlacak: {current / 2 ** 20:.1f} MiB (puncak {peak / 2 ** 20:.1f} MiB)"]
+        lines += [str(statistic) for statistic in snapshot.statistics("lineno")[:limit]]
+        return "\n".join(lines)
+
+instrumentation = Instrumentation(enabled=os.environ.get("TASKMANAGER_PROFILE", "") not in ("", "0"))
+timed = instrumentation.timed
@@ -0,0 +1,352 @@
+import argparse
+import asyncio
+import json
+import re
+import secrets
+import signal
+import sys
+from http import HTTPStatus
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from taskCli import apply_operation, parse_deadline, parse_priority, parse_status
+from taskManager import RenderCache, SortedTaskIndex, TaskManager
+
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 16 * 1024 * 1024
+KEEP_ALIVE_SECONDS = 15
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 10000
+
+class HttpError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+class Request:
+    __slots__ = ('method', 'path', 'query', 'headers', 'body')
+
+    def __init__(self, method: str, target: str, headers: Dict[str, str], body: bytes = b""):
+        url = urlsplit(target)
+        self.method = method
+        self.path = url.path.rstrip('/') or '/'
+        self.query = dict(parse_qsl(url.query))
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        try:
+            return json.loads(self.body or b"null")
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Body bukan JSON yang valid")
+
+class Response:
+    __slots__ = ('status', 'body', 'headers')
+
+    def __init__(self, status: HTTPStatus, body: bytes = b"", headers: Optional[Dict[str, str]] = None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    def encode(self, keep_alive: bool) -> bytes:
+        lines = [f"HTTP/1.1 {self.status.value} {self.status.phrase}"]
+        if self.status not in (HTTPStatus.NO_CONTENT, HTTPStatus.NOT_MODIFIED):
+            lines.append("Content-Type: application/json; charset=utf-8")
+            lines.append(f"Content-Length: {len(self.body)}")
+        lines += [f"{name}: {value}" for name, value in self.headers.items()]
+        lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + self.body
+
+def json_response(payload, status: HTTPStatus = HTTPStatus.OK, headers: Optional[Dict[str, str]] = None) -> Response:
+    return Response(status, json.dumps(payload, ensure_ascii=False).encode('utf-8'), headers)
+
+def error_response(status: HTTPStatus, message: str) -> Response:
+    return json_response({"error": message}, status)
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    # Perbandingan lemah: W/"x" dianggap sama dengan "x"
+    return "*" in candidates or etag in (candidate[2:] if candidate.startswith("W/") else candidate
+                                         for candidate in candidates)
+
+class TaskServer:
+    """Server HTTP/JSON asyncio di atas TaskManager.
+
+    Endpoint:
+      GET    /tasks               daftar (status, priority, due_before, order_by,
+                                  desc, limit, offset, q), ETag per versi papan
+      POST   /tasks               buat tugas baru
+      GET    /tasks/{id}          satu tugas, ETag per versi tugas
+      PATCH  /tasks/{id}          ubah title/description/priority/deadline
+      POST   /tasks/{id}/complete tandai selesai
+      DELETE /tasks/{id}          hapus
+      GET    /stats               statistik, ETag per versi papan dan menit
+      POST   /batch               daftar operasi (format sama dengan ``batch`` di CLI)
+      GET    /changes?since=N     event perubahan setelah versi N; 410 jika riwayat
+                                  sudah tidak menjangkau N atau ``epoch`` berbeda
+                                  (muat ulang /tasks)
+
+    Nomor versi TaskManager hanya berlaku di dalam satu proses, jadi setiap
+    ETag dan respons /changes membawa ``epoch`` acak milik proses server ini;
+    cache klien dari proses sebelumnya tidak akan pernah mendapat 304 palsu.
+
+    Koneksi HTTP/1.1 dipertahankan (keep-alive) dan request berurutan
+    (pipelining) dilayani satu per satu. Semua handler memakai kunci
+    baca/tulis TaskManager, yang bisa menunggu penulis (dan penulis bisa
+    menunggu disk), jadi semuanya dijalankan di thread pool; event loop
+    hanya membaca dan menulis socket.
+    """
+
+    def __init__(self, manager: TaskManager, host: str = "127.0.0.1", port: int = 8765):
+        self.manager = manager
+        self.host = host
+        self.port = port
+        self.epoch = secrets.token_hex(4)
+        # (method, pola path, handler)
+        self._routes: List[Tuple[str, re.Pattern, Callable[..., Response]]] = [
+            ("GET", re.compile(r"/tasks"), self.list_tasks),
+            ("POST", re.compile(r"/tasks"), self.create_task),
+            ("GET", re.compile(r"/tasks/(\d+)"), self.get_task),
+            ("PATCH", re.compile(r"/tasks/(\d+)"), self.update_task),
+            ("DELETE", re.compile(r"/tasks/(\d+)"), self.delete_task),
+            ("POST", re.compile(r"/tasks/(\d+)/complete"), self.complete_task),
+            ("GET", re.compile(r"/stats"), self.stats),
+            ("POST", re.compile(r"/batch"), self.batch),
+            ("GET", re.compile(r"/changes"), self.changes),
+        ]
+
+    async def start(self) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                          limit=MAX_HEADER_BYTES)
+
+    async def serve_until_stopped(self):
+        """Layani request sampai SIGINT/SIGTERM sehingga pemanggil sempat menutup papan."""
+        server = await self.start()
+        stopped = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signal_number, stopped.set)
+            except NotImplementedError:
+                # Windows: Ctrl+C tetap muncul sebagai KeyboardInterrupt
+                pass
+        async with server:
+            await stopped.wait()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Tuple[Request, bool]:
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_SECONDS)
+        request_line, *header_lines = head.decode('latin-1').split("\r\n")
+        try:
+            method, target, version = request_line.split(" ")
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Baris request tidak valid")
+        headers = {}
+        for line in header_lines:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise HttpError(HTTPStatus.LENGTH_REQUIRED, "Transfer-Encoding chunked tidak didukung")
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Content-Length tidak valid")
+        if length > MAX_BODY_BYTES:
+            raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Body terlalu besar")
+        body = await reader.readexactly(length) if length else b""
+        return Request(method, target, headers, body), keep_alive
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request, keep_alive = await self._read_request(reader)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(error_response(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                                                "Header terlalu besar").encode(False))
+                    break
+                except HttpError as e:
+                    writer.write(error_response(e.status, str(e)).encode(False))
+                    break
+                response = await self._dispatch(request)
+                writer.write(response.encode(keep_alive))
+                if not keep_alive:
+                    break
+                await writer.drain()
+        finally:
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+            writer.close()
+
+    async def _dispatch(self, request: Request) -> Response:
+        allowed = []
+        for method, pattern, handler in self._routes:
+            match = pattern.fullmatch(request.path)
+            if match is None:
+                continue
+            if method != request.method:
+                allowed.append(method)
+                continue
+            try:
+                return await asyncio.to_thread(handler, request, *match.groups())
+            except HttpError as e:
+                return error_response(e.status, str(e))
+            except (KeyError, ValueError, TypeError, AttributeError, argparse.ArgumentTypeError) as e:
+                return error_response(HTTPStatus.BAD_REQUEST, str(e))
+        if allowed:
+            response = error_response(HTTPStatus.METHOD_NOT_ALLOWED, "Metode tidak didukung")
+            response.headers["Allow"] = ", ".join(allowed)
+            return response
+        return error_response(HTTPStatus.NOT_FOUND, "Tidak ditemukan")
+
+    def _etag(self, version) -> str:
+        return f'"{self.epoch}-{version}"'
+
+    def _conditional(self, request: Request, etag: str, build: Callable[[], object]) -> Response:
+        """304 jika klien sudah punya versi ini; jika tidak, susun isi respons."""
+        if etag_matches(request, etag):
+            return Response(HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+        return json_response(build(), headers={"ETag": etag})
+
+    def _task_response(self, task_id: int, status: HTTPStatus = HTTPStatus.OK) -> Response:
+        task = self.manager.get(task_id)
+        if task is None:
+            raise HttpError(HTTPStatus.NOT_FOUND, "ID tugas tidak ditemukan")
+        return json_response(task.to_dict(), status,
+                             {"ETag": self._etag(self.manager.task_version(task_id))})
+
+    def list_tasks(self, request: Request) -> Response:
+        query = request.query
+        status = parse_status(query["status"]) if "status" in query else None
+        priority = parse_priority(query["priority"]) if "priority" in query else None
+        due_before = parse_deadline(query["due_before"]) if "due_before" in query else None
+        order_by = query.get("order_by", "id")
+        if order_by not in SortedTaskIndex.ORDERS:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Urutan tidak dikenal: {order_by}")
+        if query.get("desc", "").lower() in ("1", "true", "yes"):
+            order_by = "-" + order_by
+        limit = min(int(query.get("limit", DEFAULT_LIMIT)), MAX_LIMIT)
+        offset = int(query.get("offset", 0))
+        text = query.get("q", "")
+
+        # Isi daftar hanya bergantung pada URL dan versi papan; ETag dipakai hanya
+        # jika versi tidak berubah selama daftar disusun
+        version = self.manager.version
+
+        def build():
+            if text:
+                matches = {task.id for task in self.manager.search(text)}
+                ids = [task_id for task_id in self.manager.query_ids(status, priority, due_before, order_by)
+                       if task_id in matches][offset:offset + limit]
+                tasks = [task for task in map(self.manager.get, ids) if task is not None]
+            else:
+                tasks = self.manager.query(status, priority, due_before, order_by, limit, offset)
+            return {"version": version, "tasks": [task.to_dict() for task in tasks]}
+
+        etag = self._etag(version)
+        if etag_matches(request, etag):
+            return Response(HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+        payload = build()
+        headers = {"ETag": etag} if self.manager.version == version else {}
+        return json_response(payload, headers=headers)
+
+    def get_task(self, request: Request, task_id: str) -> Response:
+        etag = self._etag(self.manager.task_version(int(task_id)))
+        if etag_matches(request, etag) and self.manager.get(int(task_id)) is not None:
+            return Response(HTTPStatus.NOT_MODIFIED, headers={"ETag": etag})
+        return self._task_response(int(task_id))
+
+    def create_task(self, request: Request) -> Response:
+        body = request.json()
+        if not isinstance(body, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Body harus berupa objek JSON")
+        missing = [name for name in ("title", "deadline") if name not in body]
+        if missing:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Field wajib tidak ada: {', '.join(missing)}")
+        result = apply_operation(self.manager, {**body, "op": "add"})
+        response = self._task_response(result["id"], HTTPStatus.CREATED)
+        response.headers["Location"] = f"/tasks/{result['id']}"
+        return response
+
+    def update_task(self, request: Request, task_id: str) -> Response:
+        body = request.json()
+        if not isinstance(body, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Body harus berupa objek JSON")
+        unknown = set(body) - {"title", "description", "priority", "deadline"}
+        if unknown:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Field tidak dapat diubah: {', '.join(sorted(unknown))}")
+        result = apply_operation(self.manager, {**body, "op": "edit", "id": int(task_id)})
+        if not result["ok"]:
+            raise HttpError(HTTPStatus.NOT_FOUND, result["error"])
+        return self._task_response(int(task_id))
+
+    def complete_task(self, request: Request, task_id: str) -> Response:
+        if self.manager.complete(int(task_id)) is None:
+            raise HttpError(HTTPStatus.NOT_FOUND, "ID tugas tidak ditemukan")
+        return self._task_response(int(task_id))
+
+    def delete_task(self, request: Request, task_id: str) -> Response:
+        if self.manager.remove(int(task_id)) is None:
+            raise HttpError(HTTPStatus.NOT_FOUND, "ID tugas tidak ditemukan")
+        return Response(HTTPStatus.NO_CONTENT)
+
+    def stats(self, request: Request) -> Response:
+        # Jumlah tugas terlambat berubah seiring waktu, jadi menit ikut dalam ETag
+        minute = RenderCache.minute().strftime("%Y%m%d%H%M")
+        etag = self._etag(f"{self.manager.version}-{minute}")
+
+        def build():
+            stats = self.manager.stats()
+            return {
+                "total": stats.total,
+                "completed": stats.completed,
+                "pending": stats.pending,
+                "overdue": stats.overdue,
+                "by_priority": {priority.name: count for priority, count in stats.by_priority.items()}
+            }
+        return self._conditional(request, etag, build)
+
+    def batch(self, request: Request) -> Response:
+        """Jalankan banyak operasi dalam satu request; hasilnya per operasi, berurutan."""
+        operations = request.json()
+        if not isinstance(operations, list):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Body harus berupa daftar operasi")
+        results = []
+        for operation in operations:
+            try:
+                results.append(apply_operation(self.manager, operation))
+            except (KeyError, ValueError, TypeError, AttributeError, argparse.ArgumentTypeError) as e:
+                results.append({"ok": False, "error": str(e)})
+        return json_response({"version": self.manager.version, "results": results})
+
+    def changes(self, request: Request) -> Response:
+        since = int(request.query.get("since", 0))
+        version = self.manager.version
+        events = self.manager.changes_since(since)
+        if request.query.get("epoch", self.epoch) != self.epoch:
+            # Versi dari proses server lain tidak bisa dibandingkan dengan versi di sini
+            events = None
+        if events is None:
+            raise HttpError(HTTPStatus.GONE, "Riwayat perubahan tidak lagi mencakup versi itu")
+        if events:
+            version = max(version, events[-1].version)
+        return json_response({"epoch": self.epoch, "version": version,
+                              "events": [event.to_dict() for event in events]})
+
+def serve(manager: TaskManager, host: str = "127.0.0.1", port: int = 8765):
+    """Jalankan server sampai Ctrl+C."""
+    print(f"Server berjalan di http://{host}:{port} (Ctrl+C untuk berhenti)", file=sys.stderr)
+    try:
+        asyncio.run(TaskServer(manager, host, port).serve_until_stopped())
+    except KeyboardInterrupt:
+        pass
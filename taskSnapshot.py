@@ -0,0 +1,239 @@
+import bisect
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from taskManager import Task
+from taskTable import PRIORITIES, STATUSES, from_epoch_seconds, to_epoch_seconds
+
+MAGIC = b"TMSNAP\x00\x01"
+VERSION = 1
+FLAG_SORTED_IDS = 1
+
+# magic, versi, flag, jumlah record, id terbesar, offset record, offset heap, offset indeks
+HEADER = struct.Struct("<8sHH4xQqQQQ")
+# id, deadline, created_at, completed_at, prioritas, status, offset+panjang judul, offset+panjang deskripsi
+RECORD = struct.Struct("<qqqqBB2xQIQI")
+
+class _IdColumn:
+    """Urutan id record di dalam mmap, cukup untuk dipakai bisect."""
+
+    def __init__(self, buffer, offset: int, count: int):
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, row: int) -> int:
+        return struct.unpack_from("<q", self._buffer, self._offset + row * RECORD.size)[0]
+
+def write_snapshot(path: str, tasks: Iterable[Task]):
+    """Tulis snapshot biner: header, record lebar tetap, heap string, lalu indeks id.
+
+    Record dan heap ditulis bertahap sehingga memori tidak bergantung pada
+    ukuran papan; indeks hanya ditulis jika id tidak berurutan naik.
+    """
+    temp_path = path + ".tmp"
+    ids = array('q')
+    ids_sorted = True
+    with open(temp_path, 'wb') as file, tempfile.TemporaryFile() as heap:
+        file.write(b"\0" * HEADER.size)
+        heap_size = 0
+        for task in tasks:
+            title = task.title.encode('utf-8')
+            description = task.description.encode('utf-8')
+            file.write(RECORD.pack(
+                task.id,
+                to_epoch_seconds(task.deadline),
+                to_epoch_seconds(task.created_at),
+                to_epoch_seconds(task.completed_at),
+                PRIORITIES.index(task.priority),
+                STATUSES.index(task.status),
+                heap_size, len(title),
+                heap_size + len(title), len(description)
+            ))
+            heap.write(title)
+            heap.write(description)
+            heap_size += len(title) + len(description)
+            if ids and task.id <= ids[-1]:
+                ids_sorted = False
+            ids.append(task.id)
+
+        heap_offset = file.tell()
+        heap.seek(0)
+        while True:
+            chunk = heap.read(1 << 20)
+            if not chunk:
+                break
+            file.write(chunk)
+
+        index_offset = 0
+        if not ids_sorted:
+            index_offset = file.tell()
+            order = sorted(range(len(ids)), key=ids.__getitem__)
+            file.write(array('q', (ids[row] for row in order)).tobytes())
+            file.write(array('q', order).tobytes())
+
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, FLAG_SORTED_IDS if ids_sorted else 0,
+                               len(ids), max(ids, default=0), HEADER.size, heap_offset, index_offset))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+class SnapshotStore:
+    """Store berbasis snapshot biner yang dibuka dengan mmap.
+
+    Membuka file hanya membaca header; Task dibuat dari record saat
+    diakses. Perubahan disimpan di atas snapshot (tugas yang sudah dibuat
+    disimpan, tugas baru ditambahkan, yang dihapus ditandai), sehingga
+    antarmukanya sama dengan ``TaskStore``. Gunakan ``write_snapshot``
+    untuk menyimpan hasilnya.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, flags, count, max_id, records, heap, index = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"'{path}' bukan snapshot Task Manager yang valid")
+        self.max_id = max_id
+        self._count = count
+        self._records = records
+        self._heap = heap
+        self._ids = _IdColumn(self._map, records, count)
+        if flags & FLAG_SORTED_IDS:
+            self._sorted_ids = self._ids
+            self._index_rows = None
+        else:
+            self._sorted_ids = memoryview(self._map)[index:index + 8 * count].cast('q')
+            self._index_rows = memoryview(self._map)[index + 8 * count:index + 16 * count].cast('q')
+        self._materialized: Dict[int, Task] = {}
+        self._added: Dict[int, Task] = {}
+        self._deleted: Set[int] = set()
+
+    def close(self):
+        if self._map is not None:
+            self._sorted_ids = self._index_rows = None
+            self._map.close()
+            self._file.close()
+            self._map = None
+
+    def _find_row(self, task_id: int) -> Optional[int]:
+        position = bisect.bisect_left(self._sorted_ids, task_id)
+        if position == self._count or self._sorted_ids[position] != task_id:
+            return None
+        return position if self._index_rows is None else self._index_rows[position]
+
+    def _materialize(self, row: int) -> Task:
+        (task_id, deadline, created_at, completed_at, priority, status,
+         title_offset, title_length, description_offset, description_length) = RECORD.unpack_from(
+            self._map, self._records + row * RECORD.size)
+        start = self._heap + title_offset
+        title = self._map[start:start + title_length].decode('utf-8')
+        start = self._heap + description_offset
+        description = self._map[start:start + description_length].decode('utf-8')
+        return Task(task_id, sys.intern(title), description, PRIORITIES[priority], STATUSES[status],
+                    from_epoch_seconds(deadline), from_epoch_seconds(created_at),
+                    from_epoch_seconds(completed_at))
+
+    def __len__(self) -> int:
+        return self._count - len(self._deleted) + len(self._added)
+
+    def __iter__(self) -> Iterator[Task]:
+        for row in range(self._count):
+            task_id = self._ids[row]
+            if task_id in self._deleted:
+                continue
+            task = self._materialized.get(task_id)
+            yield task if task is not None else self._materialize(row)
+        yield from list(self._added.values())
+
+    def __contains__(self, task_id: int) -> bool:
+        if task_id in self._added:
+            return True
+        return task_id not in self._deleted and self._find_row(task_id) is not None
+
+    def get(self, task_id: int) -> Optional[Task]:
+        task = self._added.get(task_id) or self._materialized.get(task_id)
+        if task is not None or task_id in self._deleted:
+            return task
+        row = self._find_row(task_id)
+        if row is None:
+            return None
+        # Disimpan agar perubahan lewat update() tetap berlaku
+        task = self._materialized[task_id] = self._materialize(row)
+        return task
+
+    def add(self, task: Task) -> Task:
+        if task.id in self:
+            raise KeyError(f"Tugas dengan ID {task.id} sudah ada")
+        self._added[task.id] = task
+        self.max_id = max(self.max_id, task.id)
+        return task
+
+    def remove(self, task_id: int) -> Optional[Task]:
+        if task_id in self._added:
+            return self._added.pop(task_id)
+        task = self.get(task_id)
+        if task is not None:
+            self._materialized.pop(task_id, None)
+            self._deleted.add(task_id)
+        return task
+
+    def update(self, task_id: int, **fields) -> Optional[Task]:
+        task = self.get(task_id)
+        if task is None:
+            return None
+        for name in fields:
+            if name == 'id' or not hasattr(task, name):
+                raise AttributeError(f"Field '{name}' tidak dapat diubah")
+        for name, value in fields.items():
+            setattr(task, name, value)
+        return task
+
+    def ids(self) -> List[int]:
+        ids = [self._ids[row] for row in range(self._count)]
+        if self._deleted:
+            ids = [task_id for task_id in ids if task_id not in self._deleted]
+        return ids + list(self._added)
+
+    def clear(self):
+        self._deleted.update(self._ids[row] for row in range(self._count))
+        self._materialized.clear()
+        self._added.clear()
+
+def json_to_snapshot(json_path: str, snapshot_path: str):
+    """Ubah file JSON/NDJSON (format save.json) menjadi snapshot biner secara streaming."""
+    from taskStream import iter_task_file
+
+    write_snapshot(snapshot_path, iter_task_file(json_path))
+
+def snapshot_to_json(snapshot_path: str, json_path: str):
+    """Ubah snapshot biner kembali menjadi file JSON/NDJSON."""
+    from taskStream import write_task_file
+
+    store = SnapshotStore(snapshot_path)
+    try:
+        write_task_file(json_path, store)
+    finally:
+        store.close()
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Penggunaan: python taskSnapshot.py <sumber> <tujuan>")
+        print("  .json/.ndjson -> snapshot biner, atau snapshot biner -> .json/.ndjson")
+        sys.exit(1)
+    source, target = sys.argv[1], sys.argv[2]
+    if source.lower().endswith(('.json', '.ndjson', '.jsonl')):
+        json_to_snapshot(source, target)
+    else:
+        snapshot_to_json(source, target)
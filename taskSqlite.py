@@ -0,0 +1,268 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional
+
+from taskManager import Priority, SearchIndex, StatisticsSnapshot, Task, TaskStatus
+from taskTable import from_epoch_seconds, to_epoch_seconds
+
+COLUMNS = "id, title, description, priority, status, deadline, created_at, completed_at"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    priority TEXT NOT NULL,
+    status TEXT NOT NULL,
+    deadline INTEGER NOT NULL,
+    created_at INTEGER NOT NULL,
+    completed_at INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status_deadline ON tasks (status, deadline);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority, status);
+CREATE INDEX IF NOT EXISTS idx_tasks_deadline ON tasks (deadline);
+CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks (created_at);
+"""
+
+PRIORITY_RANK = "CASE priority " + " ".join(
+    f"WHEN '{priority.name}' THEN {rank}" for rank, priority in enumerate(Priority)) + " END"
+STATUS_RANK = "CASE status " + " ".join(
+    f"WHEN '{status.value}' THEN {rank}" for rank, status in enumerate(TaskStatus)) + " END"
+ORDER_COLUMNS = {
+    'deadline': ("deadline", "id"),
+    'created_at': ("created_at", "id"),
+    'id': ("id",),
+    'priority': (PRIORITY_RANK, "deadline", "id"),
+    'status': (STATUS_RANK, "deadline", "id"),
+}
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    title, description, content='tasks', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+    INSERT INTO tasks_fts (rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+"""
+
+def _row_values(task: Task) -> tuple:
+    return (task.id, task.title, task.description, task.priority.name, task.status.value,
+            to_epoch_seconds(task.deadline), to_epoch_seconds(task.created_at),
+            None if task.completed_at is None else to_epoch_seconds(task.completed_at))
+
+def _row_to_task(row: tuple) -> Task:
+    task_id, title, description, priority, status, deadline, created_at, completed_at = row
+    return Task(task_id, title, description, Priority[priority], TaskStatus(status),
+                from_epoch_seconds(deadline), from_epoch_seconds(created_at),
+                None if completed_at is None else from_epoch_seconds(completed_at))
+
+# Pencocokan akhir dilakukan di Python agar huruf besar/kecil dilipat persis seperti
+# SearchIndex (str.lower); LIKE hanya melipat huruf ASCII
+
+def _word_prefix(text: Optional[str], prefix: str) -> bool:
+    # Tokenisasi sama persis dengan SearchIndex: "gam*" cocok dengan "beta-gamma"
+    if text is None:
+        return False
+    return any(token.startswith(prefix) for token in SearchIndex.TOKEN_PATTERN.findall(text.lower()))
+
+def _contains_text(text: Optional[str], term: str) -> bool:
+    return text is not None and term in text.lower()
+
+class SqliteTaskStore:
+    """Store SQLite (mode WAL) dengan indeks status, prioritas, dan deadline.
+
+    Pencarian judul/deskripsi memakai tabel FTS5 bertokenizer trigram bila
+    tersedia (pemindaian penuh jika tidak), dan statistik dihitung dengan kueri
+    ber-indeks. Karena itu ``indexed`` bernilai True: TaskManager tidak
+    membangun indeks di memori untuk store ini.
+    """
+
+    indexed = True
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.create_function("word_prefix", 2, _word_prefix, deterministic=True)
+        self._db.create_function("contains_text", 2, _contains_text, deterministic=True)
+        self._db.executescript(SCHEMA)
+        try:
+            self._db.executescript(FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            # SQLite tanpa FTS5/trigram: pencarian memindai seluruh tabel
+            self.has_fts = False
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _query(self, sql: str, parameters: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._db.execute(sql, parameters).fetchall()
+
+    def __len__(self) -> int:
+        return self._query("SELECT COUNT(*) FROM tasks")[0][0]
+
+    def __iter__(self) -> Iterator[Task]:
+        # Dibaca per halaman agar tidak memegang kursor selama pemanggil memproses hasil
+        last_id = None
+        while True:
+            if last_id is None:
+                rows = self._query(f"SELECT {COLUMNS} FROM tasks ORDER BY id LIMIT 1000")
+            else:
+                rows = self._query(f"SELECT {COLUMNS} FROM tasks WHERE id > ? ORDER BY id LIMIT 1000",
+                                   (last_id,))
+            if not rows:
+                return
+            for row in rows:
+                yield _row_to_task(row)
+            last_id = rows[-1][0]
+
+    def __contains__(self, task_id: int) -> bool:
+        return bool(self._query("SELECT 1 FROM tasks WHERE id = ?", (task_id,)))
+
+    def get(self, task_id: int) -> Optional[Task]:
+        rows = self._query(f"SELECT {COLUMNS} FROM tasks WHERE id = ?", (task_id,))
+        return _row_to_task(rows[0]) if rows else None
+
+    def add(self, task: Task) -> Task:
+        try:
+            self._query(f"INSERT INTO tasks ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", _row_values(task))
+        except sqlite3.IntegrityError:
+            raise KeyError(f"Tugas dengan ID {task.id} sudah ada")
+        return task
+
+    def remove(self, task_id: int) -> Optional[Task]:
+        with self._lock:
+            task = self.get(task_id)
+            if task is not None:
+                self._query("DELETE FROM tasks WHERE id = ?", (task_id,))
+            return task
+
+    def update(self, task_id: int, **fields) -> Optional[Task]:
+        with self._lock:
+            task = self.get(task_id)
+            if task is None:
+                return None
+            for name in fields:
+                if name == 'id' or not hasattr(task, name):
+                    raise AttributeError(f"Field '{name}' tidak dapat diubah")
+            for name, value in fields.items():
+                setattr(task, name, value)
+            values = _row_values(task)
+            self._query("UPDATE tasks SET title = ?, description = ?, priority = ?, status = ?, "
+                        "deadline = ?, created_at = ?, completed_at = ? WHERE id = ?",
+                        values[1:] + values[:1])
+            return task
+
+    def ids(self) -> List[int]:
+        return [row[0] for row in self._query("SELECT id FROM tasks ORDER BY id")]
+
+    def clear(self):
+        self._query("DELETE FROM tasks")
+
+    @contextmanager
+    def transaction(self):
+        """Kelompokkan beberapa perubahan menjadi satu transaksi (satu commit)."""
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                yield
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def replace_all(self, tasks: Iterable[Task]) -> int:
+        """Ganti seluruh isi tabel dalam satu transaksi; kembalikan id terbesar."""
+        with self.transaction():
+            self._db.execute("DELETE FROM tasks")
+            self._db.executemany(f"INSERT INTO tasks ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                 (_row_values(task) for task in tasks))
+        return self.max_id()
+
+    def max_id(self) -> int:
+        return self._query("SELECT COALESCE(MAX(id), 0) FROM tasks")[0][0]
+
+    def pending_tasks(self) -> Iterator[Task]:
+        rows = self._query(f"SELECT {COLUMNS} FROM tasks WHERE status = ? ORDER BY deadline",
+                           (TaskStatus.PENDING.value,))
+        return (_row_to_task(row) for row in rows)
+
+    def statistics(self) -> StatisticsSnapshot:
+        by_priority = {priority: 0 for priority in Priority}
+        total = completed = 0
+        for priority, status, count in self._query(
+                "SELECT priority, status, COUNT(*) FROM tasks GROUP BY priority, status"):
+            by_priority[Priority[priority]] += count
+            total += count
+            if status == TaskStatus.COMPLETED.value:
+                completed += count
+        overdue = self._query("SELECT COUNT(*) FROM tasks WHERE status = ? AND deadline < ?",
+                              (TaskStatus.PENDING.value, to_epoch_seconds(datetime.now())))[0][0]
+        return StatisticsSnapshot(total=total, completed=completed, pending=total - completed,
+                                  overdue=overdue, by_priority=by_priority)
+
+    def query_tasks(self, status: Optional[TaskStatus] = None, priority: Optional[Priority] = None,
+                    due_before: Optional[datetime] = None, order_by: str = 'deadline',
+                    limit: Optional[int] = None, offset: int = 0) -> List[Task]:
+        """Padanan ``SortedTaskIndex.query_ids`` dengan ORDER BY/LIMIT ber-indeks."""
+        descending = order_by.startswith('-')
+        columns = ORDER_COLUMNS.get(order_by[1:] if descending else order_by)
+        if columns is None:
+            raise ValueError(f"Urutan tidak dikenal: {order_by}")
+        conditions = []
+        parameters = []
+        if status is not None:
+            conditions.append("status = ?")
+            parameters.append(status.value)
+        if priority is not None:
+            conditions.append("priority = ?")
+            parameters.append(priority.name)
+        if due_before is not None:
+            conditions.append("deadline < ?")
+            parameters.append(to_epoch_seconds(due_before))
+        where = " AND ".join(conditions) if conditions else "1"
+        order = ", ".join(f"{column} DESC" if descending else column for column in columns)
+        parameters += [-1 if limit is None else limit, offset]
+        rows = self._query(f"SELECT {COLUMNS} FROM tasks WHERE {where} ORDER BY {order} LIMIT ? OFFSET ?",
+                           tuple(parameters))
+        return [_row_to_task(row) for row in rows]
+
+    def search_tasks(self, query: str) -> List[Task]:
+        """Jalankan kueri dengan sintaks yang sama seperti ``SearchIndex``."""
+        conditions = []
+        parameters = []
+        for fields, term, prefix in SearchIndex.parse_query(query):
+            alternatives = []
+            for name in fields:
+                match = f"word_prefix({name}, ?)" if prefix else f"contains_text({name}, ?)"
+                if self.has_fts and len(term) >= 3:
+                    # Indeks trigram mempersempit kandidat; fungsi Python memastikan hasilnya
+                    phrase = term.replace('"', '""')
+                    alternatives.append(f"(id IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?) "
+                                        f"AND {match})")
+                    parameters += [f'{name} : "{phrase}"', term]
+                else:
+                    alternatives.append(match)
+                    parameters.append(term)
+            conditions.append("(" + " OR ".join(alternatives) + ")")
+        where = " AND ".join(conditions) if conditions else "1"
+        rows = self._query(f"SELECT {COLUMNS} FROM tasks WHERE {where} ORDER BY id", tuple(parameters))
+        return [_row_to_task(row) for row in rows]
@@ -0,0 +1,142 @@
+import codecs
+import json
+import os
+from contextlib import suppress
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional
+
+from taskManager import Task
+
+CHUNK_SIZE = 1 << 16
+NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+
+ProgressCallback = Callable[[int, int], None]
+
+def is_ndjson(path: str) -> bool:
+    return path.lower().endswith(NDJSON_EXTENSIONS)
+
+class _ChunkReader:
+    """Membaca file biner per potongan, men-decode UTF-8, dan melaporkan progres."""
+
+    def __init__(self, file: BinaryIO, total: int, progress: Optional[ProgressCallback]):
+        self._file = file
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._total = total
+        self._progress = progress
+        self.done = 0
+        self.eof = False
+
+    def read(self) -> str:
+        data = self._file.read(CHUNK_SIZE)
+        self.done += len(data)
+        if not data:
+            self.eof = True
+        if self._progress is not None:
+            self._progress(self.done, self._total)
+        return self._decoder.decode(data, final=not data)
+
+def iter_json_array(file: BinaryIO, total: int = 0,
+                    progress: Optional[ProgressCallback] = None) -> Iterator[dict]:
+    """Urai array JSON ``[{...}, {...}]`` satu elemen demi satu elemen.
+
+    Hanya potongan yang sedang diurai yang disimpan di memori, bukan
+    seluruh isi file.
+    """
+    reader = _ChunkReader(file, total, progress)
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    started = False
+
+    while True:
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+        if position >= len(buffer):
+            if reader.eof:
+                raise json.JSONDecodeError("Array JSON tidak ditutup", buffer, position)
+            buffer = reader.read()
+            position = 0
+            continue
+
+        if not started:
+            if buffer[position] != '[':
+                raise json.JSONDecodeError("File tidak berisi array JSON", buffer, position)
+            started = True
+            position += 1
+            continue
+        if buffer[position] == ']':
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, position)
+            complete = end < len(buffer) or reader.eof
+        except json.JSONDecodeError:
+            if reader.eof:
+                raise
+            complete = False
+        if not complete:
+            # Elemen terpotong di akhir potongan; tambah data lalu ulangi
+            buffer = buffer[position:] + reader.read()
+            position = 0
+            continue
+
+        yield item
+        position = end
+        if position > CHUNK_SIZE:
+            buffer = buffer[position:]
+            position = 0
+
+def iter_ndjson(file: BinaryIO, total: int = 0,
+                progress: Optional[ProgressCallback] = None) -> Iterator[dict]:
+    done = 0
+    for count, line in enumerate(file, 1):
+        done += len(line)
+        if line.strip():
+            yield json.loads(line)
+        if progress is not None and count % 1000 == 0:
+            progress(done, total)
+    if progress is not None:
+        progress(done, total)
+
+def iter_task_file(path: str, progress: Optional[ProgressCallback] = None) -> Iterator[Task]:
+    """Bangun Task satu per satu dari file JSON atau NDJSON."""
+    total = os.path.getsize(path)
+    with open(path, 'rb') as file:
+        records = iter_ndjson if is_ndjson(path) else iter_json_array
+        for data in records(file, total, progress):
+            yield Task.from_dict(data)
+
+def write_task_file(path: str, tasks: Iterable[Task], progress: Optional[ProgressCallback] = None):
+    """Tulis tugas secara bertahap; NDJSON untuk .ndjson/.jsonl, selain itu array JSON.
+
+    ``progress`` menerima (jumlah tugas tertulis, total tugas). Jika penulisan
+    gagal atau dibatalkan (progress melempar exception), file lama tetap utuh.
+    """
+    temp_path = path + ".tmp"
+    total = len(tasks) if hasattr(tasks, '__len__') else 0
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            ndjson = is_ndjson(path)
+            if not ndjson:
+                file.write("[")
+            separator = "\n"
+            for count, task in enumerate(tasks, 1):
+                if ndjson:
+                    file.write(json.dumps(task.to_dict(), separators=(',', ':'), ensure_ascii=False))
+                    file.write("\n")
+                else:
+                    file.write(separator)
+                    # Sama dengan keluaran json.dump(..., indent=4) untuk seluruh list
+                    file.write("    " + json.dumps(task.to_dict(), indent=4).replace("\n", "\n    "))
+                    separator = ",\n"
+                if progress is not None and count % 1000 == 0:
+                    progress(count, total)
+            if not ndjson:
+                file.write("\n]" if separator != "\n" else "]")
+    except BaseException:
+        # open() sendiri bisa gagal sebelum file sementara ada; galat aslinya yang dilempar ulang
+        with suppress(FileNotFoundError):
+            os.remove(temp_path)
+        raise
+    os.replace(temp_path, path)
+    if progress is not None:
+        progress(total, total)
@@ -0,0 +1,225 @@
+import bisect
+import sys
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from taskManager import Priority, Task, TaskStatus
+
+EPOCH = datetime(1970, 1, 1)
+NO_DATE = -1
+PRIORITIES = list(Priority)
+STATUSES = list(TaskStatus)
+
+def to_epoch_seconds(value: Optional[datetime]) -> int:
+    return NO_DATE if value is None else int((value - EPOCH).total_seconds())
+
+def from_epoch_seconds(value: int) -> Optional[datetime]:
+    return None if value == NO_DATE else EPOCH + timedelta(seconds=value)
+
+class TaskView:
+    """Objek mirip Task yang membaca dan menulis langsung ke kolom TaskTable.
+
+    View hanya menyimpan id, sehingga tetap berlaku setelah tabel dipadatkan.
+    """
+
+    __slots__ = ('_table', 'id')
+
+    def __init__(self, table: 'TaskTable', task_id: int):
+        self._table = table
+        self.id = task_id
+
+    def _row(self) -> int:
+        row = self._table._find(self.id)
+        if row is None:
+            raise KeyError(f"Tugas dengan ID {self.id} sudah dihapus")
+        return row
+
+    @property
+    def title(self) -> str:
+        return self._table._titles[self._row()]
+
+    @title.setter
+    def title(self, value: str):
+        self._table._titles[self._row()] = sys.intern(value)
+
+    @property
+    def description(self) -> str:
+        return self._table._descriptions[self._row()]
+
+    @description.setter
+    def description(self, value: str):
+        self._table._descriptions[self._row()] = sys.intern(value)
+
+    @property
+    def priority(self) -> Priority:
+        return PRIORITIES[self._table._priorities[self._row()]]
+
+    @priority.setter
+    def priority(self, value: Priority):
+        self._table._priorities[self._row()] = PRIORITIES.index(value)
+
+    @property
+    def status(self) -> TaskStatus:
+        return STATUSES[self._table._statuses[self._row()]]
+
+    @status.setter
+    def status(self, value: TaskStatus):
+        self._table._statuses[self._row()] = STATUSES.index(value)
+
+    @property
+    def deadline(self) -> datetime:
+        return from_epoch_seconds(self._table._deadlines[self._row()])
+
+    @deadline.setter
+    def deadline(self, value: datetime):
+        self._table._deadlines[self._row()] = to_epoch_seconds(value)
+
+    @property
+    def created_at(self) -> datetime:
+        return from_epoch_seconds(self._table._created[self._row()])
+
+    @created_at.setter
+    def created_at(self, value: datetime):
+        self._table._created[self._row()] = to_epoch_seconds(value)
+
+    @property
+    def completed_at(self) -> Optional[datetime]:
+        return from_epoch_seconds(self._table._completed[self._row()])
+
+    @completed_at.setter
+    def completed_at(self, value: Optional[datetime]):
+        self._table._completed[self._row()] = to_epoch_seconds(value)
+
+    to_dict = Task.to_dict
+
+    def copy(self) -> Task:
+        return Task(self.id, self.title, self.description, self.priority, self.status,
+                    self.deadline, self.created_at, self.completed_at)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Task, TaskView)):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TaskView({self.copy()!r})"
+
+class TaskTable:
+    """Store kolumnar untuk papan tugas yang sangat besar.
+
+    Id dan tanggal (detik sejak 1970-01-01) disimpan dalam ``array``,
+    prioritas dan status sebagai kode satu byte, dan teks di-intern. Selama
+    id ditambahkan berurutan naik (kasus normal), baris dicari dengan bisect
+    pada kolom id tanpa dict tambahan. Baris yang dihapus ditandai lalu
+    dibuang saat lebih dari separuh tabel kosong, sehingga urutan penyisipan
+    tetap terjaga. Antarmukanya sama dengan ``TaskStore`` dan mengembalikan
+    ``TaskView``.
+    """
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        self._reset()
+        for task in tasks:
+            self.add(task)
+
+    def _reset(self):
+        self._ids = array('q')
+        self._deadlines = array('q')
+        self._created = array('q')
+        self._completed = array('q')
+        self._priorities = bytearray()
+        self._statuses = bytearray()
+        self._alive = bytearray()
+        self._titles: List[str] = []
+        self._descriptions: List[str] = []
+        self._count = 0
+        # Hanya dibuat jika id ditambahkan tidak berurutan
+        self._rows: Optional[Dict[int, int]] = None
+
+    def _find(self, task_id: int) -> Optional[int]:
+        if self._rows is not None:
+            return self._rows.get(task_id)
+        row = bisect.bisect_left(self._ids, task_id)
+        if row < len(self._ids) and self._ids[row] == task_id and self._alive[row]:
+            return row
+        return None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[TaskView]:
+        ids, alive = self._ids, self._alive
+        for row in range(len(ids)):
+            if alive[row]:
+                yield TaskView(self, ids[row])
+
+    def __contains__(self, task_id: int) -> bool:
+        return self._find(task_id) is not None
+
+    def get(self, task_id: int) -> Optional[TaskView]:
+        return TaskView(self, task_id) if self._find(task_id) is not None else None
+
+    def add(self, task: Task) -> TaskView:
+        if self._find(task.id) is not None:
+            raise KeyError(f"Tugas dengan ID {task.id} sudah ada")
+        if self._rows is None and self._ids and task.id <= self._ids[-1]:
+            self._rows = {self._ids[row]: row for row in range(len(self._ids)) if self._alive[row]}
+        if self._rows is not None:
+            self._rows[task.id] = len(self._ids)
+        self._count += 1
+        self._ids.append(task.id)
+        self._deadlines.append(to_epoch_seconds(task.deadline))
+        self._created.append(to_epoch_seconds(task.created_at))
+        self._completed.append(to_epoch_seconds(task.completed_at))
+        self._priorities.append(PRIORITIES.index(task.priority))
+        self._statuses.append(STATUSES.index(task.status))
+        self._alive.append(1)
+        self._titles.append(sys.intern(task.title))
+        self._descriptions.append(sys.intern(task.description))
+        return TaskView(self, task.id)
+
+    def remove(self, task_id: int) -> Optional[Task]:
+        row = self._find(task_id)
+        if row is None:
+            return None
+        task = TaskView(self, task_id).copy()
+        if self._rows is not None:
+            del self._rows[task_id]
+        self._count -= 1
+        self._alive[row] = 0
+        self._titles[row] = self._descriptions[row] = ""
+        if len(self._ids) > 64 and self._count * 2 < len(self._ids):
+            self._compact()
+        return task
+
+    def update(self, task_id: int, **fields) -> Optional[TaskView]:
+        if self._find(task_id) is None:
+            return None
+        view = TaskView(self, task_id)
+        for name in fields:
+            if name == 'id' or not hasattr(view, name):
+                raise AttributeError(f"Field '{name}' tidak dapat diubah")
+        for name, value in fields.items():
+            setattr(view, name, value)
+        return view
+
+    def ids(self) -> List[int]:
+        ids, alive = self._ids, self._alive
+        return [ids[row] for row in range(len(ids)) if alive[row]]
+
+    def clear(self):
+        self._reset()
+
+    def _compact(self):
+        keep = [row for row in range(len(self._ids)) if self._alive[row]]
+        self._ids = array('q', (self._ids[row] for row in keep))
+        self._deadlines = array('q', (self._deadlines[row] for row in keep))
+        self._created = array('q', (self._created[row] for row in keep))
+        self._completed = array('q', (self._completed[row] for row in keep))
+        self._priorities = bytearray(self._priorities[row] for row in keep)
+        self._statuses = bytearray(self._statuses[row] for row in keep)
+        self._alive = bytearray(b"\x01" * len(keep))
+        self._titles = [self._titles[row] for row in keep]
+        self._descriptions = [self._descriptions[row] for row in keep]
+        if self._rows is not None:
+            self._rows = {task_id: row for row, task_id in enumerate(self._ids)}
@@ -0,0 +1,59 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from taskManager import Priority, SearchIndex, Task, TaskStatus
+from taskSqlite import SqliteTaskStore
+
+TITLES = ("beta-gamma", "alpha/beta", "Gamma ray", "x.gam_ma", "(gamut)", "megagame", "Über-Äpfel", "foo_bar baz",
+          "ÉCOLE d'été", "café crème", "Straße Σίσυφος")
+QUERIES = ("gam*", "beta*", "alpha*", "ray*", "ma*", "gamut*", "über*", "äp*", "bar*", "foo_b*", "foo-b*",
+           "title:gam*", "deskripsi:gam*", "gam", "beta-g",
+           # Term pendek dan non-ASCII: huruf besar/kecil harus dilipat seperti str.lower
+           "äp", "üb", "é", "éc", "éco", "école", "crè*", "cr*", "été*", "straß", "σίσ*", "ΣΊΣ", "judul:é")
+
+class SearchParityTest(unittest.TestCase):
+    """SqliteTaskStore.search_tasks harus memberi hasil yang sama dengan SearchIndex."""
+
+    def setUp(self):
+        now = datetime(2025, 1, 15, 9, 0)
+        self.tasks = [Task(task_id, title, f"catatan {title}", Priority.MEDIUM, TaskStatus.PENDING, now, now)
+                      for task_id, title in enumerate(TITLES, 1)]
+        self.index = SearchIndex()
+        self.index.add_many(self.tasks)
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = SqliteTaskStore(os.path.join(self.directory.name, "tasks.db"))
+        for task in self.tasks:
+            self.store.add(task)
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_punctuated_titles(self):
+        for query in QUERIES:
+            with self.subTest(query=query):
+                expected = self.index.search(query)
+                self.assertEqual([task.id for task in self.store.search_tasks(query)], expected)
+
+    def test_long_terms_use_fts(self):
+        if not self.store.has_fts:
+            self.skipTest("SQLite tanpa FTS5/trigram")
+        statements = []
+        self.store._db.set_trace_callback(statements.append)
+        for query in ("gamma*", "école"):
+            with self.subTest(query=query):
+                statements.clear()
+                self.store.search_tasks(query)
+                self.assertTrue(any("tasks_fts MATCH" in statement for statement in statements))
+
+    def test_prefix_after_punctuation(self):
+        self.assertEqual(self.index.search("gam*"), [1, 3, 4, 5])
+        self.assertEqual([task.id for task in self.store.search_tasks("gam*")], [1, 3, 4, 5])
+
+if __name__ == "__main__":
+    unittest.main()